@@ -0,0 +1,77 @@
+"""Time loading and saving a synthetic Bookmarks file with each JSON codec.
+
+``text json.load`` is the previous code path (text-mode read, then parse) and
+serves as the baseline::
+
+    python benchmarks/bench_codecs.py [--bookmarks N] [--runs N]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bookmarks_to_shortcuts.codec import CODECS, get_codec, read_json, write_json  # noqa: E402
+
+
+def synthetic_data(bookmarks: int) -> dict:
+    children = [
+        {
+            "date_added": "13300000000000000",
+            "guid": f"00000000-0000-4000-8000-{idx:012d}",
+            "id": str(idx + 10),
+            "name": f"Bookmark {idx} — café",
+            "type": "url",
+            "url": f"https://example.com/{idx}/page?query={idx}",
+        }
+        for idx in range(bookmarks)
+    ]
+    folder = {"children": children, "id": "1", "name": "Bookmarks bar", "type": "folder"}
+    return {"checksum": "", "roots": {"bookmark_bar": folder}, "version": 1}
+
+
+def timed(run, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def text_load(path: Path) -> None:
+    with path.open("r", encoding="utf-8") as fh:
+        json.load(fh)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookmarks", type=int, default=200_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    data = synthetic_data(args.bookmarks)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "Bookmarks"
+        write_json(path, data, indent=3)
+        print(f"{args.bookmarks} bookmarks, {path.stat().st_size / 2**20:.1f} MiB")
+        print(f"{'text json.load':<16} load {timed(lambda: text_load(path), args.runs) * 1000:8.1f} ms")
+        for name in CODECS:
+            try:
+                codec = get_codec(name)
+            except ImportError:
+                print(f"{name:<16} not installed")
+                continue
+            load = timed(lambda: read_json(path, codec), args.runs)
+            save = timed(lambda: write_json(path, data, indent=3, codec=codec), args.runs)
+            print(f"{name:<16} load {load * 1000:8.1f} ms   save {save * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
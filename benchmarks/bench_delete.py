@@ -0,0 +1,58 @@
+"""Time deleting a few bookmarks from files of growing size, with and without folder paths::
+
+    python benchmarks/bench_delete.py [--sizes 10000 100000 1000000] [--ids 3] [--per-folder 50]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bookmarks_to_shortcuts.deleter import BookmarkDeleter  # noqa: E402
+from bookmarks_to_shortcuts.raw import RawBookmarkFile  # noqa: E402
+
+
+def synthetic_file(bookmarks: int, per_folder: int = 50) -> RawBookmarkFile:
+    folders = []
+    for start in range(0, bookmarks, per_folder):
+        children = [
+            {"id": str(idx), "name": f"Bookmark {idx}", "type": "url", "url": f"https://{idx}.example/"}
+            for idx in range(start, min(start + per_folder, bookmarks))
+        ]
+        folders.append({"id": f"f{start}", "name": f"Folder {start}", "type": "folder", "children": children})
+    roots = {"bookmark_bar": {"id": "root", "name": "Bookmarks bar", "type": "folder", "children": folders}}
+    return RawBookmarkFile.create(Path("Bookmarks"), roots)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--ids", type=int, default=3)
+    parser.add_argument("--per-folder", type=int, default=50)
+    args = parser.parse_args()
+    for size in args.sizes:
+        # from the middle of the file, so the search has to cover half of it
+        first = size // 2
+        ids = {str(first + offset) for offset in range(args.ids)}
+        ancestors = {
+            node_id: ["root", f"f{int(node_id) // args.per_folder * args.per_folder}"] for node_id in ids
+        }
+        timings = {}
+        for label, hint in (("search", None), ("ancestors", ancestors)):
+            raw = synthetic_file(size, args.per_folder)
+            # the checksum covers the whole file and is not what is measured here
+            raw.update_checksum = lambda: None  # type: ignore[method-assign]
+            start = time.perf_counter()
+            assert BookmarkDeleter(raw).delete(ids, ancestors=hint) == len(ids)
+            timings[label] = time.perf_counter() - start
+        print(
+            f"{size:>9,} bookmarks: search {timings['search'] * 1e3:7.2f} ms, "
+            f"with ancestors {timings['ancestors'] * 1e3:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
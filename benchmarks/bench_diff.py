@@ -0,0 +1,51 @@
+"""Time diff_bookmarks on two synthetic files that differ in a few URLs::
+
+    python benchmarks/bench_diff.py [--bookmarks N]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bookmarks_to_shortcuts.diff import diff_bookmarks  # noqa: E402
+from bookmarks_to_shortcuts.raw import RawBookmarkFile  # noqa: E402
+
+
+def synthetic_file(bookmarks: int, changed_every: int = 0, per_folder: int = 1000) -> RawBookmarkFile:
+    folders = []
+    for start in range(0, bookmarks, per_folder):
+        children = []
+        for idx in range(start, min(start + per_folder, bookmarks)):
+            suffix = "/v2" if changed_every and idx % changed_every == 0 else ""
+            children.append({
+                "guid": f"g{idx}",
+                "id": str(idx + 100),
+                "name": f"Bookmark {idx}",
+                "type": "url",
+                "url": f"https://{idx}.example{suffix}",
+            })
+        folders.append(
+            {"guid": f"f{start}", "id": f"f{start}", "name": f"Folder {start}", "type": "folder", "children": children}
+        )
+    bar = {"guid": "bar", "id": "1", "name": "Bookmarks bar", "type": "folder", "children": folders}
+    return RawBookmarkFile(source_path=Path("Bookmarks"), data={"roots": {"bookmark_bar": bar}})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookmarks", type=int, default=1_000_000)
+    args = parser.parse_args()
+    old = synthetic_file(args.bookmarks)
+    new = synthetic_file(args.bookmarks, changed_every=1000)
+    start = time.perf_counter()
+    result = diff_bookmarks(old, new)
+    elapsed = time.perf_counter() - start
+    print(f"{args.bookmarks} bookmarks: {elapsed:.2f} s, {result.counts()}")
+
+
+if __name__ == "__main__":
+    main()
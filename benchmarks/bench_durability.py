@@ -0,0 +1,51 @@
+"""Shortcut export throughput for each durability level::
+
+    python benchmarks/bench_durability.py [--bookmarks N] [--per-folder N] [--journal]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bookmarks_to_shortcuts.durability import Durability  # noqa: E402
+from bookmarks_to_shortcuts.exporter import BookmarkExporter  # noqa: E402
+from bookmarks_to_shortcuts.model import BookmarkNode  # noqa: E402
+
+
+def synthetic_tree(bookmarks: int, per_folder: int) -> BookmarkNode:
+    root = BookmarkNode(id="root", name="Bookmarks bar", type="folder")
+    for start in range(0, bookmarks, per_folder):
+        folder = BookmarkNode(id=f"f{start}", name=f"Folder {start}", type="folder")
+        root.add_child(folder)
+        for idx in range(start, min(start + per_folder, bookmarks)):
+            folder.add_child(
+                BookmarkNode(id=str(idx), name=f"Bookmark {idx}", type="url", url=f"https://{idx}.example/")
+            )
+    return root
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookmarks", type=int, default=5000)
+    parser.add_argument("--per-folder", type=int, default=100)
+    parser.add_argument("--journal", action="store_true", help="Export with the resume journal")
+    args = parser.parse_args()
+    root = synthetic_tree(args.bookmarks, args.per_folder)
+    for level in Durability:
+        with tempfile.TemporaryDirectory(dir=Path.cwd()) as tmp:
+            exporter = BookmarkExporter(
+                Path(tmp) / "out", journal=args.journal, track_paths=False, durability=level
+            )
+            start = time.perf_counter()
+            result = exporter.export([root])
+            elapsed = time.perf_counter() - start
+        print(f"{level.value:>8}: {elapsed:6.2f} s, {result.created_count / elapsed:8,.0f} files/s")
+
+
+if __name__ == "__main__":
+    main()
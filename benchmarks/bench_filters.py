@@ -0,0 +1,70 @@
+"""Cost of filter rules when planning an export, and what folder pruning saves::
+
+    python benchmarks/bench_filters.py [--bookmarks N] [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bookmarks_to_shortcuts.exporter import BookmarkExporter  # noqa: E402
+from bookmarks_to_shortcuts.filters import FilterSpec  # noqa: E402
+from bookmarks_to_shortcuts.model import BookmarkNode  # noqa: E402
+
+CASES = {
+    "no filters": FilterSpec(),
+    "url rules": FilterSpec(
+        exclude_schemes=["javascript"],
+        exclude_domains=["ads.example", "tracker.example"],
+        exclude_urls=[r"[?&]utm_", r"/logout\b"],
+    ),
+    "domain include": FilterSpec(include_domains=["*.corp.example", "example.org"]),
+    "folder rules": FilterSpec(exclude_folders=["**/Archive", "Root 2"]),
+    "all rules": FilterSpec(
+        include_folders=["Root 0", "Root 1/**"],
+        exclude_folders=["**/Archive"],
+        include_domains=["*.corp.example", "example.org"],
+        exclude_urls=[r"/logout\b"],
+        exclude_schemes=["javascript"],
+    ),
+}
+
+
+def synthetic_tree(bookmarks: int, roots: int = 3, per_folder: int = 50) -> list:
+    nodes = [BookmarkNode(id=f"r{idx}", name=f"Root {idx}", type="folder") for idx in range(roots)]
+    for start in range(0, bookmarks, per_folder):
+        name = "Archive" if start // per_folder % 4 == 0 else f"Folder {start}"
+        folder = BookmarkNode(id=f"f{start}", name=name, type="folder")
+        nodes[start // per_folder % roots].add_child(folder)
+        for idx in range(start, min(start + per_folder, bookmarks)):
+            host = f"h{idx % 97}.corp.example" if idx % 2 else "example.org"
+            folder.add_child(
+                BookmarkNode(id=str(idx), name=f"Bookmark {idx}", type="url", url=f"https://{host}/{idx}")
+            )
+    return nodes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookmarks", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    nodes = synthetic_tree(args.bookmarks)
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, spec in CASES.items():
+            exporter = BookmarkExporter(Path(tmp) / "out", filters=spec)
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                plan = exporter.plan(nodes)
+                best = min(best, time.perf_counter() - start)
+            print(f"{label:>15}: {best:.3f} s to plan, {plan.file_count:,} shortcuts kept")
+
+
+if __name__ == "__main__":
+    main()
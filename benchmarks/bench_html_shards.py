@@ -0,0 +1,52 @@
+"""Compare the monolithic HTML export with the sharded one::
+
+    python benchmarks/bench_html_shards.py [--bookmarks N] [--shard-size N]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bookmarks_to_shortcuts.exporter import BookmarkExporter  # noqa: E402
+from bookmarks_to_shortcuts.model import BookmarkNode  # noqa: E402
+
+
+def synthetic_tree(bookmarks: int, roots: int = 3, per_folder: int = 100) -> list:
+    nodes = [BookmarkNode(id=f"r{idx}", name=f"Root {idx}", type="folder") for idx in range(roots)]
+    for start in range(0, bookmarks, per_folder):
+        folder = BookmarkNode(id=f"f{start}", name=f"Folder {start}", type="folder")
+        nodes[start // per_folder % roots].add_child(folder)
+        for idx in range(start, min(start + per_folder, bookmarks)):
+            folder.add_child(
+                BookmarkNode(id=str(idx), name=f"Bookmark {idx}", type="url", url=f"https://{idx}.example/?a&b")
+            )
+    return nodes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookmarks", type=int, default=300_000)
+    parser.add_argument("--shard-size", type=int, default=5000)
+    args = parser.parse_args()
+    nodes = synthetic_tree(args.bookmarks)
+    exporter = BookmarkExporter("unused", include_full_path=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        exporter.export_html(nodes, Path(tmp) / "all.html")
+        single = time.perf_counter() - start
+        size = (Path(tmp) / "all.html").stat().st_size
+        start = time.perf_counter()
+        result = exporter.export_html_shards(nodes, Path(tmp) / "shards", shard_size=args.shard_size)
+        sharded = time.perf_counter() - start
+        largest = max(page.stat().st_size for page in result.pages)
+    print(f"single page: {single:.2f} s, {size / 1e6:.1f} MB")
+    print(f"sharded:     {sharded:.2f} s, {len(result.pages)} pages, largest {largest / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
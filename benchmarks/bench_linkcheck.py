@@ -0,0 +1,64 @@
+"""Time LinkChecker against a local stand-in server with simulated latency::
+
+    python benchmarks/bench_linkcheck.py [--urls N] [--hosts H] [--latency SECONDS]
+
+Hosts are distinct loopback addresses (127.0.0.1, 127.0.0.2, ...), so the
+per-host pools and limits behave as they would against real sites.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bookmarks_to_shortcuts.linkcheck import LinkChecker, summarize  # noqa: E402
+
+
+async def _serve(latency: float, ready: threading.Event, port: list) -> None:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                await asyncio.sleep(latency)
+                code = b"404 Not Found" if b"/dead" in head.split(b"\r\n", 1)[0] else b"200 OK"
+                writer.write(b"HTTP/1.1 " + code + b"\r\nContent-Length: 0\r\n\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    server = await asyncio.start_server(handle, "0.0.0.0", 0, backlog=1024)
+    port.append(server.sockets[0].getsockname()[1])
+    ready.set()
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=20_000)
+    parser.add_argument("--hosts", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+
+    ready, port = threading.Event(), []
+    threading.Thread(target=asyncio.run, args=(_serve(args.latency, ready, port),), daemon=True).start()
+    ready.wait()
+    urls = [
+        f"http://127.0.0.{idx % args.hosts + 1}:{port[0]}/{'dead' if idx % 50 == 0 else 'page'}/{idx}"
+        for idx in range(args.urls)
+    ]
+    start = time.perf_counter()
+    results = LinkChecker(concurrency=args.concurrency).check(urls)
+    elapsed = time.perf_counter() - start
+    print(f"{args.urls} URLs on {args.hosts} hosts: {elapsed:.2f} s "
+          f"({args.urls / elapsed:.0f} URLs/s), {summarize(results.values())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Time merging overlapping synthetic Bookmarks files at two sizes, to show linear scaling::
+
+    python benchmarks/bench_merge.py [--bookmarks N] [--files K]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bookmarks_to_shortcuts.merge import BookmarkMerger  # noqa: E402
+from bookmarks_to_shortcuts.raw import RawBookmarkFile  # noqa: E402
+
+
+def synthetic_file(bookmarks: int, offset: int, per_folder: int = 1000) -> RawBookmarkFile:
+    """``bookmarks`` links starting at ``offset``, so files built with close offsets overlap."""
+    folders = []
+    for start in range(offset, offset + bookmarks, per_folder):
+        children = [
+            {"id": str(idx), "name": f"Bookmark {idx}", "type": "url", "url": f"https://{idx}.example/"}
+            for idx in range(start, min(start + per_folder, offset + bookmarks))
+        ]
+        name = f"Folder {start // per_folder}"
+        folders.append({"id": f"f{start}", "name": name, "type": "folder", "children": children})
+    bar = {"id": "1", "name": "Bookmarks bar", "type": "folder", "children": folders}
+    return RawBookmarkFile(source_path=Path("Bookmarks"), data={"roots": {"bookmark_bar": bar}})
+
+
+def time_merge(bookmarks: int, files: int) -> float:
+    # each file shares half of its links with the previous one
+    raws = [synthetic_file(bookmarks, offset=index * bookmarks // 2) for index in range(files)]
+    start = time.perf_counter()
+    merger = BookmarkMerger()
+    for raw in raws:
+        merger.add(raw)
+    merger.nodes()
+    elapsed = time.perf_counter() - start
+    result = merger.result
+    print(
+        f"{files} x {bookmarks} bookmarks: {elapsed:.2f} s "
+        f"({result.bookmarks} kept, {result.duplicates} duplicates)"
+    )
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookmarks", type=int, default=200_000)
+    parser.add_argument("--files", type=int, default=3)
+    args = parser.parse_args()
+    small = time_merge(args.bookmarks, args.files)
+    large = time_merge(args.bookmarks * 2, args.files)
+    print(f"doubling the input took {large / small:.2f}x as long")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare exporting to three destinations one by one with a single mirrored run::
+
+    python benchmarks/bench_mirrors.py [--bookmarks N]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bookmarks_to_shortcuts.exporter import BookmarkExporter  # noqa: E402
+from bookmarks_to_shortcuts.model import BookmarkNode  # noqa: E402
+
+
+def synthetic_tree(bookmarks: int, per_folder: int = 100) -> BookmarkNode:
+    root = BookmarkNode(id="root", name="Bookmarks bar", type="folder")
+    for start in range(0, bookmarks, per_folder):
+        folder = BookmarkNode(id=f"f{start}", name=f"Folder {start}", type="folder")
+        root.add_child(folder)
+        for idx in range(start, min(start + per_folder, bookmarks)):
+            folder.add_child(
+                BookmarkNode(id=str(idx), name=f"Bookmark {idx}", type="url", url=f"https://{idx}.example/")
+            )
+    return root
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookmarks", type=int, default=20_000)
+    args = parser.parse_args()
+    root = synthetic_tree(args.bookmarks)
+    options = dict(journal=True, track_paths=False)
+    with tempfile.TemporaryDirectory(dir=Path.cwd()) as tmp:
+        roots = [Path(tmp) / "separate" / name for name in ("a", "b", "c")]
+        start = time.perf_counter()
+        for output in roots:
+            BookmarkExporter(output, **options).export([root])
+        separate = time.perf_counter() - start
+
+        roots = [Path(tmp) / "mirrored" / name for name in ("a", "b", "c")]
+        start = time.perf_counter()
+        BookmarkExporter(roots[0], mirror_roots=roots[1:], **options).export([root])
+        mirrored = time.perf_counter() - start
+    print(f"three separate runs: {separate:.2f} s")
+    print(f"one run, 2 mirrors:  {mirrored:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compare the tree-based and the raw streaming shortcut exports.
+
+Reports wall time and peak traced memory (``tracemalloc``) of
+``BookmarkTreeBuilder`` + ``BookmarkExporter.export`` against
+``BookmarkExporter.export_raw`` on a synthetic Bookmarks file::
+
+    python benchmarks/bench_raw_export.py [--bookmarks N]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bookmarks_to_shortcuts.exporter import BookmarkExporter  # noqa: E402
+from bookmarks_to_shortcuts.raw import RawBookmarkFile  # noqa: E402
+from bookmarks_to_shortcuts.tree import BookmarkTreeBuilder  # noqa: E402
+
+
+def synthetic_file(bookmarks: int, per_folder: int = 200) -> RawBookmarkFile:
+    folders = []
+    for start in range(0, bookmarks, per_folder):
+        children = [
+            {"id": str(idx), "name": f"Site {idx % 50}", "type": "url", "url": f"https://{idx}.example/"}
+            for idx in range(start, min(start + per_folder, bookmarks))
+        ]
+        folders.append({"id": f"f{start}", "name": f"Folder {start}", "type": "folder", "children": children})
+    roots = {"bookmark_bar": {"id": "1", "name": "Bookmarks bar", "type": "folder", "children": folders}}
+    return RawBookmarkFile(source_path=Path("Bookmarks"), data={"roots": roots})
+
+
+def measure(label: str, run) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    created = run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {created:>9} files  {elapsed:8.2f} s  peak {peak / 2**20:8.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookmarks", type=int, default=20_000)
+    args = parser.parse_args()
+    raw = synthetic_file(args.bookmarks)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tree_exporter = BookmarkExporter(Path(tmp) / "tree")
+        measure(
+            "tree",
+            lambda: len(tree_exporter.export(BookmarkTreeBuilder(raw).build()).created_files),
+        )
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_exporter = BookmarkExporter(Path(tmp) / "raw")
+        measure("raw stream", lambda: len(raw_exporter.export_raw(raw).created_files))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare a full second export with a snapshot that hard-links unchanged shortcuts::
+
+    python benchmarks/bench_snapshots.py [--bookmarks N] [--changed PERCENT]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bookmarks_to_shortcuts.exporter import BookmarkExporter  # noqa: E402
+from bookmarks_to_shortcuts.model import BookmarkNode  # noqa: E402
+
+
+def synthetic_tree(bookmarks: int, changed: int = 0, per_folder: int = 100) -> BookmarkNode:
+    root = BookmarkNode(id="root", name="Bookmarks bar", type="folder")
+    for start in range(0, bookmarks, per_folder):
+        folder = BookmarkNode(id=f"f{start}", name=f"Folder {start}", type="folder")
+        root.add_child(folder)
+        for idx in range(start, min(start + per_folder, bookmarks)):
+            address = f"https://{idx}.example/" + ("v2" if idx < changed else "")
+            folder.add_child(
+                BookmarkNode(id=str(idx), name=f"Bookmark {idx}", type="url", url=address)
+            )
+    return root
+
+
+def new_inodes(folder: Path, seen: set) -> int:
+    """Count files below ``folder`` whose inode no earlier folder shares."""
+    count = 0
+    for dirpath, _, names in os.walk(folder):
+        for name in names:
+            inode = os.stat(os.path.join(dirpath, name)).st_ino
+            if inode not in seen:
+                seen.add(inode)
+                count += 1
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookmarks", type=int, default=20_000)
+    parser.add_argument("--changed", type=float, default=1.0, help="percent of URLs changed")
+    args = parser.parse_args()
+    first = synthetic_tree(args.bookmarks)
+    second = synthetic_tree(args.bookmarks, changed=int(args.bookmarks * args.changed / 100))
+    options = dict(journal=True, track_paths=False)
+    with tempfile.TemporaryDirectory(dir=Path.cwd()) as tmp:
+        base = Path(tmp) / "base"
+        BookmarkExporter(base, **options).export([first])
+        seen: set = set()
+        new_inodes(base, seen)
+
+        start = time.perf_counter()
+        BookmarkExporter(Path(tmp) / "full", **options).export([second])
+        full = time.perf_counter() - start
+        full_files = new_inodes(Path(tmp) / "full", seen)
+
+        start = time.perf_counter()
+        result = BookmarkExporter(Path(tmp) / "linked", link_dest=base, **options).export([second])
+        linked = time.perf_counter() - start
+        linked_files = new_inodes(Path(tmp) / "linked", seen)
+    print(f"full copy: {full:.2f} s, {full_files} new files")
+    print(f"snapshot:  {linked:.2f} s, {linked_files} new files ({result.linked_count} hard-linked)")
+
+
+if __name__ == "__main__":
+    main()
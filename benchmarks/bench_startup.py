@@ -0,0 +1,61 @@
+"""Measure CLI start-up: wall time of ``--help`` and the slowest imports.
+
+Run from the repository root::
+
+    python benchmarks/bench_startup.py [--runs N]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def wall_time(args: list, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=REPO_ROOT, capture_output=True, check=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def slowest_imports(statement: str, limit: int) -> list:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    baseline = wall_time(["-c", "pass"], args.runs)
+    cli = wall_time(["-m", "bookmarks_to_shortcuts.cli", "--help"], args.runs)
+    print(f"interpreter only:  {baseline * 1000:7.1f} ms")
+    print(f"cli --help:        {cli * 1000:7.1f} ms  (+{(cli - baseline) * 1000:.1f} ms)")
+    print()
+    print(f"{'cumulative us':>14} {'self us':>9}  module")
+    for cumulative, self_us, name in slowest_imports("import bookmarks_to_shortcuts.cli", args.top):
+        print(f"{cumulative:>14} {self_us:>9}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,24 @@
 """Core package for exporting Brave bookmarks to Windows shortcuts."""
+from __future__ import annotations
 
-from .model import BookmarkNode
-from .raw import RawBookmarkFile
-from .tree import BookmarkTreeBuilder
-from .exporter import BookmarkExporter, DuplicateStrategy
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .exporter import BookmarkExporter, DuplicateStrategy
+    from .model import BookmarkNode
+    from .raw import RawBookmarkFile
+    from .tree import BookmarkTreeBuilder
+
+# Public names are resolved on first access so that ``python -m
+# bookmarks_to_shortcuts.cli`` only imports the modules a command needs.
+_LAZY_ATTRIBUTES = {
+    "BookmarkNode": ".model",
+    "RawBookmarkFile": ".raw",
+    "BookmarkTreeBuilder": ".tree",
+    "BookmarkExporter": ".exporter",
+    "DuplicateStrategy": ".exporter",
+}
 
 __all__ = [
     "BookmarkNode",
@@ -12,3 +27,16 @@ __all__ = [
     "BookmarkExporter",
     "DuplicateStrategy",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -2,17 +2,25 @@
 from __future__ import annotations
 
 import argparse
+import json
+import sys
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-from .exporter import BookmarkExporter, DuplicateStrategy
-from .raw import RawBookmarkFile
-from .tree import BookmarkTreeBuilder
+# Mirrors DuplicateStrategy; kept literal so parsing arguments does not import the exporter.
+DUPLICATE_STRATEGIES = ("unique", "overwrite", "skip")
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Export Brave bookmarks to .url files")
     parser.add_argument("bookmarks", type=Path, help="Path to Brave Bookmarks JSON file")
-    parser.add_argument("output", type=Path, help="Output directory for exported shortcuts")
+    parser.add_argument(
+        "output",
+        type=Path,
+        nargs="?",
+        help="Output directory for exported shortcuts (omit to write only --ndjson/--csv)",
+    )
     parser.add_argument(
         "--include-roots",
         nargs="*",
@@ -26,25 +34,610 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--duplicate-strategy",
-        choices=[d.value for d in DuplicateStrategy],
-        default=DuplicateStrategy.UNIQUE.value,
+        choices=DUPLICATE_STRATEGIES,
+        default="unique",
         help="How to handle duplicate filenames",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Finish an interrupted export into the same output directory",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what the export would write without touching the output directory",
+    )
+    parser.add_argument(
+        "--ndjson",
+        metavar="PATH",
+        help="Also write one JSON record per bookmark; use - for standard output",
+    )
+    parser.add_argument(
+        "--csv",
+        metavar="PATH",
+        help="Also write id,name,url,folder rows; use - for standard output",
+    )
+    parser.add_argument(
+        "--sqlite",
+        metavar="PATH",
+        help="Also upsert bookmarks into a SQLite database with full-text search",
+    )
+    parser.add_argument(
+        "--manifest",
+        metavar="PATH",
+        help="List every created or skipped shortcut path in PATH (one tab-separated line each)",
+    )
+    parser.add_argument(
+        "--mirror",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Also write the shortcuts into DIR (repeatable); planned once, written concurrently. "
+        "With --snapshot each DIR keeps its own snapshots",
+    )
+    parser.add_argument(
+        "--durability",
+        choices=("none", "batched", "full"),
+        default="none",
+        help="How hard shortcut writes try to survive a power loss: none (no fsync; the "
+        "default), batched (fsync each folder once per journal batch) or full (fsync every "
+        "file and folder)",
+    )
+    parser.add_argument(
+        "--link-dest",
+        metavar="DIR",
+        help="Hard-link shortcuts that are unchanged since the export in DIR instead of "
+        "writing them again",
+    )
+    snapshots = parser.add_argument_group(
+        "snapshots", "Keep a history of exports that share unchanged shortcuts"
+    )
+    snapshots.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="Export into a new timestamped folder inside the output directory, hard-linking "
+        "unchanged shortcuts to the newest earlier snapshot there",
+    )
+    keep_help = {
+        "last": "keep the N newest snapshots",
+        "daily": "keep the newest snapshot of each of the last N days with one",
+        "weekly": "keep the newest snapshot of each of the last N weeks with one",
+        "monthly": "keep the newest snapshot of each of the last N months with one",
+    }
+    for period, text in keep_help.items():
+        snapshots.add_argument(
+            f"--keep-{period}",
+            type=int,
+            default=0,
+            metavar="N",
+            help=f"After a snapshot, {text}; older snapshots are deleted",
+        )
+    parser.add_argument(
+        "--html-shards",
+        metavar="DIR",
+        help="Also write an HTML index plus one page per top-level folder into DIR",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=5000,
+        metavar="N",
+        help="Split HTML pages after N bookmarks (default: 5000; 0 for no limit)",
+    )
+    parser.add_argument(
+        "--since",
+        type=parse_when,
+        metavar="WHEN",
+        help="Only export bookmarks added at or after WHEN: YYYY-MM-DD, an ISO time, "
+        "or an age such as 7d or 12h",
+    )
+    parser.add_argument(
+        "--until",
+        type=parse_when,
+        metavar="WHEN",
+        help="Only export bookmarks added before WHEN",
+    )
+    parser.add_argument(
+        "--skip-dead-links",
+        action="store_true",
+        help="Check every URL first and leave out bookmarks whose server answers with an error",
+    )
+    parser.add_argument(
+        "--skip-unreachable-links",
+        action="store_true",
+        help="Also leave out bookmarks whose host cannot be reached (DNS, connection or timeout)",
+    )
+    _add_filter_arguments(parser)
+    _add_link_arguments(parser)
+    _add_server_argument(parser)
+    args = parser.parse_args(argv)
+    args.filters = _filter_options(args, parser)
+    if args.server and "-" in (args.ndjson, args.csv):
+        parser.error("--server cannot stream records to standard output; write to a file instead")
+    if args.output is None and not (args.ndjson or args.csv or args.sqlite or args.html_shards):
+        parser.error(
+            "an output directory is required unless --ndjson, --csv, --sqlite or --html-shards is given"
+        )
+    if args.ndjson == "-" and args.csv == "-":
+        parser.error("only one of --ndjson and --csv can write to standard output")
+    if args.dry_run and args.output is None:
+        parser.error("--dry-run needs an output directory")
+    keeps = (args.keep_last, args.keep_daily, args.keep_weekly, args.keep_monthly)
+    if any(keep < 0 for keep in keeps):
+        parser.error("--keep-* counts cannot be negative")
+    if args.shard_size < 0:
+        parser.error("--shard-size cannot be negative")
+    if any(keeps) and not args.snapshot:
+        parser.error("--keep-* only applies to --snapshot exports")
+    if args.snapshot and args.output is None:
+        parser.error("--snapshot needs an output directory to keep the snapshots in")
+    return args
+
+
+def parse_when(value: str) -> datetime:
+    """Parse an ISO date/time, or a relative age such as ``7d`` or ``12h``, as local time."""
+    units = {"d": "days", "h": "hours", "w": "weeks"}
+    amount, unit = value[:-1], value[-1:].lower()
+    if unit in units and amount.isdigit():
+        return datetime.now() - timedelta(**{units[unit]: int(amount)})
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date {value!r}; use YYYY-MM-DD or e.g. 7d") from None
+
+
+def import_main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="bookmarks_to_shortcuts.cli import",
+        description="Rebuild a Brave Bookmarks file from an exported .url folder",
+    )
+    parser.add_argument("export_root", type=Path, help="Folder containing exported shortcuts")
+    parser.add_argument("bookmarks", type=Path, help="Path of the Bookmarks file to write")
+    parser.add_argument("--workers", type=int, default=None, help="Scanner threads")
+    parser.add_argument(
+        "--force", action="store_true", help="Overwrite the Bookmarks file if it exists"
+    )
+    args = parser.parse_args(argv)
+    if args.bookmarks.exists() and not args.force:
+        parser.error(f"{args.bookmarks} already exists; pass --force to overwrite it")
+
+    from .importer import ShortcutImporter
+
+    raw = ShortcutImporter(args.export_root, workers=args.workers).write(args.bookmarks)
+    print(f"Wrote {raw.source_path} (checksum {raw.data['checksum']})")
+
+
+def merge_main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="bookmarks_to_shortcuts.cli merge",
+        description="Merge several Bookmarks files into one tree without duplicate links",
+    )
+    parser.add_argument(
+        "inputs", type=Path, nargs="+", help="Bookmarks files to merge; earlier files win"
+    )
+    parser.add_argument("--output", type=Path, metavar="FILE", help="Write the merged Bookmarks file")
+    parser.add_argument(
+        "--export", type=Path, metavar="DIR", help="Export the merged tree as shortcuts into DIR"
+    )
+    parser.add_argument(
+        "--include-full-path",
+        action="store_true",
+        help="Include root names in exported directory paths",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Overwrite the output file if it exists"
+    )
+    args = parser.parse_args(argv)
+    if args.output is None and args.export is None:
+        parser.error("give --output, --export or both")
+    if args.output is not None and args.output.exists() and not args.force:
+        parser.error(f"{args.output} already exists; pass --force to overwrite it")
+
+    from .merge import merge_files
+
+    merger = merge_files(args.inputs)
+    print(merger.result.describe())
+    if args.output is not None:
+        raw = merger.write(args.output)
+        print(f"Wrote {raw.source_path} (checksum {raw.data['checksum']})")
+    if args.export is not None:
+        from .exporter import BookmarkExporter
+
+        exporter = BookmarkExporter(
+            args.export, include_full_path=args.include_full_path, journal=True, track_paths=False
+        )
+        result = exporter.export(merger.nodes())
+        print(f"Created {result.created_count} shortcuts; skipped {result.skipped_count}")
+
+
+def undo_main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="bookmarks_to_shortcuts.cli undo",
+        description="Restore the bookmarks removed by the most recent delete-after-export",
+    )
+    parser.add_argument("bookmarks", type=Path, help="Path to Brave Bookmarks JSON file (close Brave first)")
+    args = parser.parse_args(argv)
 
+    from .deleter import BookmarkDeleter
+    from .durability import Durability
+    from .raw import RawBookmarkFile
+    from .undo import UndoJournal
 
-def main() -> None:
-    args = parse_args()
+    journal = UndoJournal(args.bookmarks)
+    removed = journal.peek()
+    if removed is None:
+        parser.error(f"nothing to undo for {args.bookmarks}")
     raw = RawBookmarkFile.load(args.bookmarks)
-    tree = BookmarkTreeBuilder(raw)
-    nodes = tree.build(include_roots=args.include_roots)
-    exporter = BookmarkExporter(
-        output_root=args.output,
-        include_full_path=args.include_full_path,
-        duplicate_strategy=DuplicateStrategy(args.duplicate_strategy),
-    )
-    result = exporter.export(nodes)
-    print(f"Created {len(result.created_files)} shortcuts; skipped {len(result.skipped)}")
+    try:
+        BookmarkDeleter(raw).restore(removed)
+    except ValueError as exc:
+        parser.error(str(exc))
+    raw.save(Durability.FULL)
+    journal.drop_last()
+    bookmarks = sum(1 for entry in removed if entry.node.get("type") != "folder")
+    print(
+        f"Restored {bookmarks} bookmarks and {len(removed) - bookmarks} folders; "
+        f"{journal.steps()} earlier deletions can still be undone"
+    )
+
+
+def diff_main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="bookmarks_to_shortcuts.cli diff",
+        description="Show what changed between two Bookmarks files",
+    )
+    parser.add_argument("old", type=Path, help="Earlier Bookmarks file (e.g. a backup)")
+    parser.add_argument("new", type=Path, help="Later Bookmarks file")
+    parser.add_argument("--json", action="store_true", help="Print the change set as JSON")
+    args = parser.parse_args(argv)
+
+    from .diff import diff_bookmarks
+    from .raw import RawBookmarkFile
+
+    result = diff_bookmarks(RawBookmarkFile.load(args.old), RawBookmarkFile.load(args.new))
+    if args.json:
+        print(json.dumps(result.to_json(), indent=2, ensure_ascii=False))
+    else:
+        print(result.describe())
+
+
+def serve_main(argv: List[str]) -> None:
+    from .service import DEFAULT_HOST, DEFAULT_PORT, make_server
+
+    parser = argparse.ArgumentParser(
+        prog="bookmarks_to_shortcuts.cli serve",
+        description="Keep parsed bookmark trees resident and answer requests over localhost HTTP",
+    )
+    parser.add_argument(
+        "--host", default=DEFAULT_HOST, help="Loopback address to bind (default: 127.0.0.1)"
+    )
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+    args = parser.parse_args(argv)
+    try:
+        server = make_server(args.host, args.port)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(f"Serving bookmark requests on http://{args.host}:{server.server_address[1]}")
+    print(f"Clients authenticate with the token in {server.token_file}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.token_file.unlink(missing_ok=True)
+
+
+def search_main(argv: List[str]) -> None:
+    parser = _query_parser("search", "Search bookmark names and URLs")
+    parser.add_argument("query", help="Case-insensitive text to look for")
+    parser.add_argument("--limit", type=int, default=50, help="Maximum number of results")
+    args = parser.parse_args(argv)
+    response = _call(args.server, "search", {
+        "bookmarks": str(args.bookmarks.resolve()),
+        "include_roots": args.include_roots,
+        "query": args.query,
+        "limit": args.limit,
+    })
+    for result in response["results"]:
+        print(f"{' / '.join(result['folder'])}: {result['name']} - {result['url']}")
+
+
+def count_main(argv: List[str]) -> None:
+    parser = _query_parser("count", "Count bookmarks and folders")
+    args = parser.parse_args(argv)
+    response = _call(args.server, "count", {
+        "bookmarks": str(args.bookmarks.resolve()),
+        "include_roots": args.include_roots,
+    })
+    print(f"{response['bookmarks']} bookmarks in {response['folders']} folders")
+
+
+def _query_parser(command: str, description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog=f"bookmarks_to_shortcuts.cli {command}", description=description)
+    parser.add_argument("bookmarks", type=Path, help="Path to Brave Bookmarks JSON file")
+    parser.add_argument("--include-roots", nargs="*", default=None, help="Limit to these Brave roots")
+    _add_server_argument(parser)
+    return parser
+
+
+def _add_server_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--server",
+        metavar="URL",
+        help="Send the request to a running 'serve' process (e.g. http://127.0.0.1:8765)",
+    )
+
+
+def check_links_main(argv: List[str]) -> None:
+    parser = _query_parser("check-links", "Find bookmarks whose links are dead or unreachable")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    _add_link_arguments(parser)
+    args = parser.parse_args(argv)
+    response = _call(args.server, "links", {
+        "bookmarks": str(args.bookmarks.resolve()),
+        "include_roots": args.include_roots,
+        "links": _link_options(args),
+    })
+    if args.json:
+        print(json.dumps(response, indent=2, ensure_ascii=False))
+        return
+    for problem in response["problems"]:
+        reason = problem["code"] or problem["error"]
+        print(f"{problem['status']} ({reason}) {' / '.join(problem['folder'])}: {problem['name']} - {problem['url']}")
+    print(_link_summary(response["summary"]))
+
+
+# (flag, FilterSpec field, metavar, help)
+FILTER_FLAGS = (
+    ("--include-folder", "include_folders", "GLOB",
+     "Only export folders matching GLOB, e.g. 'Bookmarks bar/Work' or '**/Reading'"),
+    ("--exclude-folder", "exclude_folders", "GLOB",
+     "Skip folders matching GLOB and everything below them"),
+    ("--include-domain", "include_domains", "DOMAIN",
+     "Only export URLs on DOMAIN or its subdomains (*.DOMAIN: subdomains only)"),
+    ("--exclude-domain", "exclude_domains", "DOMAIN", "Skip URLs on DOMAIN or its subdomains"),
+    ("--include-url", "include_urls", "REGEX", "Only export URLs matching REGEX"),
+    ("--exclude-url", "exclude_urls", "REGEX", "Skip URLs matching REGEX"),
+    ("--exclude-scheme", "exclude_schemes", "SCHEME", "Skip URLs with this scheme, e.g. javascript"),
+)
+
+
+def _add_filter_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group(
+        "filters",
+        "Each flag can be repeated (any match counts); bookmarks must pass every kind of rule given",
+    )
+    for flag, dest, metavar, help_text in FILTER_FLAGS:
+        group.add_argument(
+            flag, dest=dest, action="append", default=[], metavar=metavar, help=help_text
+        )
+    group.add_argument(
+        "--filter-file",
+        type=Path,
+        metavar="PATH",
+        help="JSON object of rule lists keyed like the flags (include_folders, exclude_urls, ...)",
+    )
+
+
+def _filter_options(args: argparse.Namespace, parser: argparse.ArgumentParser) -> Optional[dict]:
+    """Merge the filter flags with ``--filter-file`` and check that the rules compile."""
+    from .filters import FilterSpec
+
+    spec = FilterSpec(**{dest: getattr(args, dest) for _, dest, _, _ in FILTER_FLAGS})
+    try:
+        if args.filter_file is not None:
+            spec = FilterSpec.load(args.filter_file).merged(spec)
+        spec.compile()
+    except (OSError, TypeError, ValueError) as exc:
+        parser.error(f"invalid filters: {exc}")
+    return spec.to_dict() or None
+
+
+def _add_link_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--link-cache",
+        metavar="PATH",
+        help="Where link results are cached (default: ~/.bookmarks_to_shortcuts/link_cache.json)",
+    )
+    parser.add_argument(
+        "--no-link-cache", action="store_true", help="Check every link again and cache nothing"
+    )
+    parser.add_argument(
+        "--link-ttl", type=float, default=168, metavar="HOURS", help="Reuse cached results this long"
+    )
+    parser.add_argument(
+        "--link-concurrency", type=int, default=100, metavar="N", help="Links checked at once"
+    )
+    parser.add_argument(
+        "--link-timeout", type=float, default=10.0, metavar="SECONDS", help="Give up on a link after this"
+    )
+
+
+def _link_options(args: argparse.Namespace, skip: Optional[List[str]] = None) -> dict:
+    options = {
+        "skip": skip or [],
+        "ttl": args.link_ttl * 3600,
+        "concurrency": args.link_concurrency,
+        "timeout": args.link_timeout,
+    }
+    if args.no_link_cache:
+        options["cache"] = None
+    elif args.link_cache:
+        options["cache"] = str(Path(args.link_cache).resolve())
+    return options
+
+
+def _link_summary(summary: dict) -> str:
+    return (
+        f"Checked links: {summary['alive']} alive, {summary['dead']} dead, "
+        f"{summary['unreachable']} unreachable, {summary['skipped']} not http(s)"
+    )
+
+
+def _snapshot_target(
+    args: argparse.Namespace,
+) -> Tuple[Path, Optional[Path], Dict[Path, Optional[Path]]]:
+    """The snapshot folder to export into, the earlier snapshot to link to, and the same per mirror.
+
+    Every ``--mirror`` keeps its own history: the snapshot goes into a folder
+    of the same name there and links to that mirror's newest snapshot.
+    """
+    from .snapshots import latest_snapshot, next_snapshot_path, unfinished_snapshot
+
+    base = Path(args.output)
+    target = unfinished_snapshot(base) if args.resume else None
+    if args.resume and target is None:
+        raise SystemExit(f"no unfinished snapshot to resume in {base}")
+    if target is None:
+        target = next_snapshot_path(base)
+    link_dest = Path(args.link_dest) if args.link_dest else latest_snapshot(base)
+    mirrors = {
+        Path(mirror) / target.name: latest_snapshot(Path(mirror), exclude=Path(mirror) / target.name)
+        for mirror in args.mirror
+    }
+    return target, link_dest, mirrors
+
+
+def _call(server: Optional[str], operation: str, request: dict) -> dict:
+    """Run ``operation`` on a resident service if given, otherwise in-process."""
+    if server:
+        from .service import ServiceClient
+
+        try:
+            return ServiceClient(server).call(operation, request)
+        except RuntimeError as exc:
+            raise SystemExit(str(exc)) from None
+    from .service import BookmarkService
+
+    return BookmarkService().handle(operation, request)
+
+
+COMMANDS = {
+    "import": import_main,
+    "merge": merge_main,
+    "undo": undo_main,
+    "diff": diff_main,
+    "serve": serve_main,
+    "search": search_main,
+    "count": count_main,
+    "check-links": check_links_main,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        COMMANDS[argv[0]](argv[1:])
+        return
+    args = parse_args(argv)
+
+    def absolute(path):
+        return None if path is None or str(path) == "-" else str(Path(path).resolve())
+
+    skip = ["dead"] * args.skip_dead_links + ["unreachable"] * args.skip_unreachable_links
+    output, link_dest = args.output, args.link_dest
+    mirrors: Dict[Path, Optional[Path]] = {Path(mirror): None for mirror in args.mirror}
+    if args.snapshot:
+        output, link_dest, mirrors = _snapshot_target(args)
+    response = _call(args.server, "export", {
+        "bookmarks": absolute(args.bookmarks),
+        "output": absolute(output),
+        "include_roots": args.include_roots,
+        "include_full_path": args.include_full_path,
+        "duplicate_strategy": args.duplicate_strategy,
+        "resume": args.resume,
+        "dry_run": args.dry_run,
+        "ndjson": absolute(args.ndjson) if args.ndjson != "-" else "-",
+        "csv": absolute(args.csv) if args.csv != "-" else "-",
+        "sqlite": absolute(args.sqlite),
+        "html_shards": absolute(args.html_shards),
+        "manifest": absolute(args.manifest),
+        "durability": args.durability,
+        "mirrors": [absolute(mirror) for mirror in mirrors],
+        "link_dest": absolute(link_dest),
+        "mirror_link_dests": {
+            absolute(mirror): absolute(dest) for mirror, dest in mirrors.items() if dest is not None
+        },
+        "filters": args.filters,
+        "shard_size": args.shard_size,
+        "since": args.since.isoformat() if args.since else None,
+        "until": args.until.isoformat() if args.until else None,
+        # a one-shot in-process run has no use for the cached tree
+        "stream": args.server is None,
+        "links": _link_options(args, skip),
+    })
+    if args.dry_run:
+        print(response["plan"])
+        return
+    # Keep standard output clean when it carries exported records.
+    report = sys.stderr if "-" in (args.ndjson, args.csv) else sys.stdout
+    if response.get("links") is not None:
+        print(_link_summary(response["links"]), file=report)
+    if response["shortcuts"] is not None:
+        shortcuts = response["shortcuts"]
+        print(
+            f"Created {shortcuts['created']} shortcuts ({shortcuts['bytes']:,} bytes) "
+            f"in {shortcuts['seconds']:.1f} s; skipped {shortcuts['skipped']}",
+            file=report,
+        )
+        if link_dest is not None:
+            print(
+                f"Hard-linked {shortcuts['linked']} unchanged shortcuts to {link_dest}",
+                file=report,
+            )
+        for mirror in shortcuts["mirrors"]:
+            if mirror["error"] is None:
+                linked = f" ({mirror['linked']} hard-linked)" if mirror["linked"] else ""
+                print(
+                    f"Mirrored {mirror['created']} shortcuts to {mirror['root']}{linked}",
+                    file=report,
+                )
+            else:
+                print(
+                    f"Mirror {mirror['root']} failed after {mirror['created']} shortcuts: "
+                    f"{mirror['error']}",
+                    file=report,
+                )
+    if args.snapshot and response["shortcuts"] is not None:
+        from .snapshots import RetentionPolicy, is_finished, prune_snapshots
+
+        policy = RetentionPolicy(
+            args.keep_last, args.keep_daily, args.keep_weekly, args.keep_monthly
+        )
+        # Only a finished snapshot may push older ones out; a failed mirror keeps
+        # the journal, so nothing is pruned until --resume completes it.
+        if is_finished(Path(output)):
+            print(f"Snapshot {output}", file=report)
+            for base in [Path(args.output), *(mirror.parent for mirror in mirrors)]:
+                removed = prune_snapshots(base, policy)
+                if removed:
+                    print(f"Removed {len(removed)} old snapshots from {base}", file=report)
+        else:
+            print(f"Snapshot {output} is unfinished; run again with --resume", file=report)
+    if response["ndjson"] is not None:
+        print(f"Exported {response['ndjson']} bookmarks as NDJSON", file=report)
+    if response["csv"] is not None:
+        print(f"Exported {response['csv']} bookmarks as CSV", file=report)
+    if response.get("html_shards") is not None:
+        shards = response["html_shards"]
+        print(
+            f"Exported {shards['bookmarks']} bookmarks to {shards['pages']} HTML pages; "
+            f"open {shards['index']}",
+            file=report,
+        )
+    if response["sqlite"] is not None:
+        stats = response["sqlite"]
+        print(
+            f"Stored {stats['bookmarks']} bookmarks in SQLite; "
+            f"{stats['changed']} rows changed, {stats['removed']} removed",
+            file=report,
+        )
+    if response.get("errors"):
+        for label, error in response["errors"].items():
+            print(f"{label}: {error}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
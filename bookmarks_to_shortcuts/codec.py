@@ -0,0 +1,113 @@
+"""JSON codecs for reading and writing bookmark and config files.
+
+Files are read as bytes (memory-mapped for backends that parse buffers in
+place) and handed to the fastest available backend, so the whole file is never decoded into a ``str``
+first. Writing always goes through the stdlib encoder: its ``indent`` and
+ASCII-escaping output is what Brave itself produces, and no faster backend
+can reproduce it byte for byte.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Type
+
+
+class JsonCodec:
+    """Stdlib ``json`` backend; always available."""
+
+    name = "json"
+    # Whether loads() parses a memoryview in place; otherwise the file is read
+    # into bytes, since mapping it would only add a copy.
+    accepts_buffer = False
+
+    def loads(self, data: bytes | memoryview) -> Any:
+        # json.loads detects UTF-8/16/32 (and a UTF-8 BOM) from raw bytes
+        return json.loads(bytes(data))
+
+    def dumps(self, obj: Any, *, indent: Optional[int] = None) -> bytes:
+        """Encode exactly like ``json.dumps(obj, indent=indent)``, as UTF-8."""
+        return json.dumps(obj, indent=indent).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """Parses with ``orjson`` straight from a memory map, without copying."""
+
+    name = "orjson"
+    accepts_buffer = True
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads = orjson.loads
+
+    def loads(self, data: bytes | memoryview) -> Any:
+        if bytes(data[:3]) == b"\xef\xbb\xbf":
+            # orjson rejects a BOM that json.loads accepts; release the slice
+            # promptly so the caller can close its memory map
+            with memoryview(data)[3:] as trimmed:
+                return self._loads(trimmed)
+        return self._loads(data)
+
+
+# Preferred first; a backend whose import fails is skipped.
+CODECS: Dict[str, Type[JsonCodec]] = {"orjson": OrjsonCodec, "json": JsonCodec}
+
+_default: Optional[JsonCodec] = None
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """Return the named codec, or the fastest installed one.
+
+    The ``BOOKMARKS_JSON_CODEC`` environment variable overrides the default.
+    """
+    global _default
+    name = name or os.environ.get("BOOKMARKS_JSON_CODEC")
+    if name is not None:
+        if name not in CODECS:
+            raise ValueError(f"Unknown JSON codec: {name}")
+        return CODECS[name]()
+    if _default is None:
+        for codec_class in CODECS.values():
+            try:
+                _default = codec_class()
+            except ImportError:
+                continue
+            break
+    return _default
+
+
+def read_json(path: str | Path, codec: Optional[JsonCodec] = None) -> Any:
+    """Parse the JSON file at ``path``, from a read-only memory map if the codec allows."""
+    codec = codec or get_codec()
+    with open(path, "rb") as fh:
+        if not codec.accepts_buffer:
+            return codec.loads(fh.read())
+        try:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # empty files and special files cannot be mapped
+            return codec.loads(fh.read())
+        with mapped, memoryview(mapped) as view:
+            return codec.loads(view)
+
+
+def write_json(
+    path: str | Path,
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    codec: Optional[JsonCodec] = None,
+    fsync: bool = False,
+) -> None:
+    """Write ``obj`` with the platform's line endings, as a text-mode ``json.dump`` would."""
+    data = (codec or get_codec()).dumps(obj, indent=indent)
+    if os.linesep != "\n":
+        data = data.replace(b"\n", os.linesep.encode("ascii"))
+    with open(path, "wb") as fh:
+        fh.write(data)
+        if fsync:
+            fh.flush()
+            os.fsync(fh.fileno())
@@ -1,10 +1,11 @@
 """Persistent configuration for the Bookmarks to Shortcuts application."""
 from __future__ import annotations
 
-import json
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
+from .codec import read_json, write_json
+
 
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.json"
 
@@ -15,6 +16,9 @@ class AppConfig:
 
     bookmarks_path: str = ""
     output_path: str = ""
+    mirror_paths: str = ""  # extra shortcut destinations, separated by ";"
+    snapshot_links: bool = False  # hard-link unchanged shortcuts to the previous export
+    keep_snapshots: int = 0  # previous exports to keep; 0 keeps all
     theme: str = "dark"
 
     @classmethod
@@ -22,11 +26,13 @@ class AppConfig:
         """Load config from disk, returning defaults if the file is missing or invalid."""
         if CONFIG_PATH.exists():
             try:
-                with CONFIG_PATH.open("r", encoding="utf-8") as fh:
-                    data = json.load(fh)
+                data = read_json(CONFIG_PATH)
                 return cls(
                     bookmarks_path=data.get("bookmarks_path", ""),
                     output_path=data.get("output_path", ""),
+                    mirror_paths=data.get("mirror_paths", ""),
+                    snapshot_links=data.get("snapshot_links", False),
+                    keep_snapshots=data.get("keep_snapshots", 0),
                     theme=data.get("theme", "dark"),
                 )
             except Exception:
@@ -35,5 +41,4 @@ class AppConfig:
 
     def save(self) -> None:
         """Write the current config to disk."""
-        with CONFIG_PATH.open("w", encoding="utf-8") as fh:
-            json.dump(asdict(self), fh, indent=2)
+        write_json(CONFIG_PATH, asdict(self), indent=2)
@@ -1,67 +1,241 @@
 """Delete exported bookmarks from the Brave Bookmarks JSON file."""
 from __future__ import annotations
 
-import hashlib
-import json
-from typing import Any, Dict, List, Set
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 
 from .raw import RawBookmarkFile
 
+_Folder = Dict[str, Any]
+
+
+@dataclass
+class RemovedNode:
+    """A node dropped by :meth:`BookmarkDeleter.delete` and where it used to be."""
+
+    parent_id: str
+    index: int  # position among the parent's children before the deletion
+    node: Dict[str, Any]
+
 
 class BookmarkDeleter:
     """Removes specific bookmarks from a Brave Bookmarks file."""
 
     def __init__(self, raw: RawBookmarkFile):
         self.raw = raw
+        # inverse patch of the last delete(), in removal order
+        self.removed_nodes: List[RemovedNode] = []
 
-    def delete(self, ids_to_delete: Set[str], *, prune_empty_folders: bool = True) -> int:
-        """Remove bookmarks with the given IDs and optionally prune empty folders.
+    def delete(
+        self,
+        ids_to_delete: Set[str],
+        *,
+        prune_empty_folders: bool = True,
+        ancestors: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> int:
+        """Remove bookmarks with the given IDs and optionally prune folders they empty.
 
-        Returns the number of bookmarks actually removed.
+        Only the folders holding the bookmarks are rebuilt, and pruning walks
+        up from them. ``ancestors`` maps a bookmark id to the ids of its
+        folders from the root down, as a :class:`BookmarkNode` tree knows
+        them; bookmarks found that way cost a walk down their own path
+        rather than a search of the file. Every dropped bookmark and pruned
+        folder is recorded in ``removed_nodes`` so :meth:`restore` can undo
+        the deletion. Returns the number of bookmarks actually removed.
         """
-        removed = 0
-        roots = self.raw.roots()
-        for key in list(roots.keys()):
-            root_node = roots[key]
-            if "children" in root_node:
-                removed += self._remove_from_children(
-                    root_node, ids_to_delete, prune_empty_folders
-                )
-
-        self._update_checksum()
+        self.removed_nodes = []
+        # parent of every folder seen while locating, by identity (None for roots)
+        parents: Dict[int, Optional[_Folder]] = {}
+        # folder (by identity) -> (folder, identities of the children to drop)
+        affected: Dict[int, Tuple[_Folder, Set[int]]] = {}
+        wanted = {str(node_id) for node_id in ids_to_delete}
+        if ancestors:
+            self._locate_by_path(wanted, ancestors, parents, affected)
+        if wanted:
+            self._locate_by_scan(wanted, parents, affected)
+        removed = sum(len(doomed) for _, doomed in affected.values())
+        if not removed:
+            return 0
+
+        if prune_empty_folders:
+            # Walk up from each emptied folder; roots are never pruned.
+            pending = list(affected.values())
+            while pending:
+                folder, doomed = pending.pop()
+                parent = parents[id(folder)]
+                if parent is None or len(doomed) != len(folder.get("children", [])):
+                    continue
+                entry = affected.setdefault(id(parent), (parent, set()))
+                if id(folder) not in entry[1]:
+                    entry[1].add(id(folder))
+                    pending.append(entry)
+
+        positions = self._positions([folder for folder, _ in affected.values()], parents)
+        keyed: List[Tuple[Tuple[int, ...], RemovedNode]] = []
+        for folder, doomed in affected.values():
+            folder_id = str(folder.get("id", ""))
+            surviving: List[Dict[str, Any]] = []
+            for index, child in enumerate(folder.get("children", [])):
+                if id(child) not in doomed:
+                    surviving.append(child)
+                    continue
+                # document order, with a pruned folder after the nodes removed inside it
+                key = positions[id(folder)] + (index,)
+                if child.get("type") == "folder":
+                    key += (sys.maxsize,)
+                keyed.append((key, RemovedNode(folder_id, index, child)))
+            folder["children"] = surviving
+        keyed.sort(key=lambda item: item[0])
+        self.removed_nodes = [entry for _, entry in keyed]
+
+        self.raw.update_checksum()
         return removed
 
-    def _remove_from_children(
+    def _locate_by_path(
         self,
-        parent: Dict[str, Any],
-        ids_to_delete: Set[str],
-        prune_empty: bool,
-    ) -> int:
-        """Walk children, remove matching IDs, optionally prune empty folders."""
-        removed = 0
-        surviving: List[Dict[str, Any]] = []
-        for child in parent.get("children", []):
-            child_id = str(child.get("id", ""))
-            is_folder = child.get("type") == "folder"
-
-            if is_folder:
-                # Recurse into folder first
-                removed += self._remove_from_children(child, ids_to_delete, prune_empty)
-                # Keep the folder unless it's now empty and pruning is on
-                if prune_empty and not child.get("children", []):
-                    continue  # drop the empty folder
-                surviving.append(child)
-            elif child_id in ids_to_delete:
-                removed += 1  # drop this bookmark
-            else:
-                surviving.append(child)
-
-        parent["children"] = surviving
-        return removed
+        wanted: Set[str],
+        ancestors: Mapping[str, Sequence[str]],
+        parents: Dict[int, Optional[_Folder]],
+        affected: Dict[int, Tuple[_Folder, Set[int]]],
+    ) -> None:
+        """Find bookmarks below their recorded folders; found ids leave ``wanted``."""
+        # folder path -> folder, so bookmarks sharing a folder resolve it once
+        folders: Dict[Tuple[str, ...], Optional[_Folder]] = {}
+        # folder (by identity) -> {bookmark id: bookmark}
+        listings: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        for node_id in list(wanted):
+            path = tuple(ancestors.get(node_id, ()))
+            folder = self._resolve(path, folders, parents) if path else None
+            if folder is None:
+                continue
+            listing = listings.get(id(folder))
+            if listing is None:
+                listing = listings[id(folder)] = {
+                    str(child.get("id", "")): child
+                    for child in folder.get("children", [])
+                    if child.get("type") != "folder"
+                }
+            node = listing.get(node_id)
+            if node is not None:
+                affected.setdefault(id(folder), (folder, set()))[1].add(id(node))
+                wanted.discard(node_id)
+
+    def _resolve(
+        self,
+        path: Tuple[str, ...],
+        folders: Dict[Tuple[str, ...], Optional[_Folder]],
+        parents: Dict[int, Optional[_Folder]],
+    ) -> Optional[_Folder]:
+        if path in folders:
+            return folders[path]
+        if len(path) == 1:
+            parent = None
+            candidates = list(self.raw.roots().values())
+        else:
+            parent = self._resolve(path[:-1], folders, parents)
+            candidates = parent.get("children", []) if parent is not None else []
+        folder = next(
+            (
+                child
+                for child in candidates
+                if str(child.get("id", "")) == path[-1] and "children" in child
+            ),
+            None,
+        )
+        if folder is not None:
+            parents[id(folder)] = parent
+        folders[path] = folder
+        return folder
+
+    def _locate_by_scan(
+        self,
+        wanted: Set[str],
+        parents: Dict[int, Optional[_Folder]],
+        affected: Dict[int, Tuple[_Folder, Set[int]]],
+    ) -> None:
+        """Search the file for ``wanted`` without changing it, stopping once all are found."""
+        stack: List[_Folder] = []
+        for root in self.raw.roots().values():
+            if "children" in root:
+                parents.setdefault(id(root), None)
+                stack.append(root)
+        while stack and wanted:
+            folder = stack.pop()
+            for child in folder.get("children", []):
+                if child.get("type") == "folder":
+                    parents[id(child)] = folder
+                    stack.append(child)
+                else:
+                    child_id = str(child.get("id", ""))
+                    if child_id in wanted:
+                        affected.setdefault(id(folder), (folder, set()))[1].add(id(child))
+                        wanted.discard(child_id)
+
+    def _positions(
+        self, folders: List[_Folder], parents: Dict[int, Optional[_Folder]]
+    ) -> Dict[int, Tuple[int, ...]]:
+        """Child-index paths from the roots for ``folders`` and their ancestors."""
+        roots = list(self.raw.roots().values())
+        positions: Dict[int, Tuple[int, ...]] = {}
+
+        def position(folder: _Folder) -> Tuple[int, ...]:
+            known = positions.get(id(folder))
+            if known is None:
+                parent = parents[id(folder)]
+                siblings = roots if parent is None else parent["children"]
+                offset = next(index for index, child in enumerate(siblings) if child is folder)
+                known = (offset,) if parent is None else position(parent) + (offset,)
+                positions[id(folder)] = known
+            return known
+
+        for folder in folders:
+            position(folder)
+        return positions
+
+    def restore(self, removed_nodes: List[RemovedNode]) -> int:
+        """Put back nodes recorded by :meth:`delete`; returns how many were restored.
+
+        Raises ``ValueError`` without changing anything if a parent folder no
+        longer exists or a node to restore is still present.
+        """
+        pending: Dict[str, List[RemovedNode]] = {}
+        for entry in removed_nodes:
+            pending.setdefault(entry.parent_id, []).append(entry)
+        restored_ids = {str(entry.node.get("id", "")) for entry in removed_nodes}
+        node_ids, folder_ids = self._existing_ids()
+        present = restored_ids & node_ids
+        if present:
+            raise ValueError(f"Bookmarks to restore are still present: {', '.join(sorted(present))}")
+        missing = set(pending) - restored_ids - folder_ids
+        if missing:
+            raise ValueError(f"Cannot restore into missing folders: {', '.join(sorted(missing))}")
+
+        # Top-down, so pruned folders are back before their own children are.
+        stack = list(self.raw.roots().values())
+        while stack:
+            folder = stack.pop()
+            entries = pending.pop(str(folder.get("id", "")), None)
+            if entries:
+                children = folder.setdefault("children", [])
+                # ascending original indices rebuild the original order exactly
+                for entry in sorted(entries, key=lambda item: item.index):
+                    children.insert(min(entry.index, len(children)), entry.node)
+            stack.extend(child for child in folder.get("children", []) if "children" in child)
+
+        self.raw.update_checksum()
+        return len(removed_nodes)
 
-    def _update_checksum(self) -> None:
-        """Recalculate the checksum field the way Brave/Chromium does."""
-        roots = self.raw.roots()
-        content = json.dumps(roots, separators=(",", ":"), ensure_ascii=False)
-        checksum = hashlib.md5(content.encode("utf-8")).hexdigest()
-        self.raw.data["checksum"] = checksum
+    def _existing_ids(self) -> Tuple[Set[str], Set[str]]:
+        """Ids of all nodes and of folders currently in the file."""
+        node_ids: Set[str] = set()
+        folder_ids: Set[str] = set()
+        stack = list(self.raw.roots().values())
+        while stack:
+            node = stack.pop()
+            node_id = str(node.get("id", ""))
+            node_ids.add(node_id)
+            if "children" in node:
+                folder_ids.add(node_id)
+                stack.extend(node["children"])
+        return node_ids, folder_ids
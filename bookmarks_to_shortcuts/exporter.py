@@ -1,18 +1,46 @@
 """Bookmark export engine."""
 from __future__ import annotations
 
+import csv
+import errno
+import hashlib
 import html
 import itertools
+import json
+import os
 import re
+import sys
+import time
 from collections import defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, TextIO, Tuple, Union
 
+from .durability import Durability, SyncedWriter
+from .filters import BookmarkFilter, FilterSpec, FolderState
+from .journal import ExportJournal
 from .model import BookmarkNode
+from .raw import RawBookmarkFile
+from .tree import BookmarkTreeBuilder, chrome_time, chrome_time_from_datetime, raw_node_type
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    # sqlite3 is imported only when a SQLite export runs
+    from .sqlite_export import SqliteExportResult
 
 INVALID_CHARS = re.compile(r"[\\/:*?\"<>|]")
+SLUG_CHARS = re.compile(r"[^\w]+")
+HTML_SHARD_SIZE = 5000
+HTML_INDEX_NAME = "index.html"
+CSV_COLUMNS = ("id", "name", "url", "folder")
+
+# A file path, "-" for standard output, or an already open text stream.
+OutputTarget = Union[str, Path, TextIO]
 
 
 class DuplicateStrategy(str, Enum):
@@ -39,13 +67,354 @@ class StructureMode(str, Enum):
         raise ValueError(f"Unknown structure mode label: {label}")
 
 
+@contextmanager
+def _open_output(output: OutputTarget) -> Iterator[TextIO]:
+    if hasattr(output, "write"):
+        yield output
+    elif str(output) == "-":
+        yield sys.stdout
+        sys.stdout.flush()
+    else:
+        path = Path(output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8", newline="") as fh:
+            yield fh
+
+
 @dataclass
 class ExportResult:
-    created_files: List[Path]
-    skipped: List[Path]
+    """Outcome of a shortcut export.
+
+    Counts, bytes and timing are always recorded. The path lists are only
+    filled when the exporter runs with ``track_paths``; otherwise they stay
+    empty and the paths can be streamed to a ``manifest`` file instead.
+    """
+
+    created_files: List[Path] = field(default_factory=list)
+    skipped: List[Path] = field(default_factory=list)
+    created_count: int = 0
+    skipped_count: int = 0
+    bytes_written: int = 0
+    elapsed: float = 0.0  # seconds spent planning and writing
+    mirrors: List["MirrorResult"] = field(default_factory=list)
+    linked_count: int = 0  # created shortcuts hard-linked to ``link_dest`` instead of written
+
+
+@dataclass
+class MirrorResult:
+    """What one mirror root received; ``error`` is set if writing to it stopped."""
+
+    root: Path
+    created_count: int = 0
+    bytes_written: int = 0
+    error: Optional[str] = None
+    linked_count: int = 0  # created shortcuts hard-linked to the mirror's own earlier export
+
+
+@dataclass(slots=True)
+class PlannedShortcut:
+    """A bookmark's resolved place in a shortcut export."""
+
+    node: BookmarkNode
+    folder: Path
+    name: str
+    final_name: Optional[str]
+    collision: bool = False
+    key: str = ""
+    completed: bool = False
+
+    @property
+    def target(self) -> Path:
+        return self.folder / self.name
+
+    @property
+    def path(self) -> Optional[Path]:
+        if self.final_name is None:
+            return None
+        return self.folder / self.final_name
+
+    @property
+    def skipped(self) -> bool:
+        return self.final_name is None
+
+
+@dataclass
+class ExportPlan:
+    """Everything a shortcut export will do, resolved without writing to disk."""
+
+    output_root: Path
+    shortcuts: List[PlannedShortcut]
+    directories: List[Path]
+    total_bytes: int = 0
+    resume: bool = False
+
+    @property
+    def file_count(self) -> int:
+        return sum(1 for shortcut in self.shortcuts if shortcut.final_name is not None)
+
+    @property
+    def skipped(self) -> List[Path]:
+        return [shortcut.target for shortcut in self.shortcuts if shortcut.final_name is None]
+
+    @property
+    def collisions(self) -> List[PlannedShortcut]:
+        return [shortcut for shortcut in self.shortcuts if shortcut.collision]
+
+    @property
+    def longest_path(self) -> Optional[Path]:
+        longest: Optional[PlannedShortcut] = None
+        longest_length = -1
+        for shortcut in self.shortcuts:
+            if shortcut.final_name is None:
+                continue
+            length = len(str(shortcut.folder)) + 1 + len(shortcut.final_name)
+            if length > longest_length:
+                longest, longest_length = shortcut, length
+        return None if longest is None else longest.path
+
+    def describe(self) -> str:
+        longest = self.longest_path
+        lines = [
+            f"Shortcuts to write: {self.file_count}",
+            f"Skipped: {len(self.skipped)}",
+            f"Name collisions: {len(self.collisions)}",
+            f"Folders to create: {len(self.directories)}",
+            f"Total size: {self.total_bytes} bytes",
+        ]
+        if longest is not None:
+            lines.append(f"Longest path: {len(str(longest))} characters ({longest})")
+        return "\n".join(lines)
+
+
+class _Mirror:
+    """Copies the shortcuts written below ``source_root`` into another root.
+
+    The first ``OSError`` (a full or missing volume, say) is recorded in
+    :attr:`result` and the mirror ignores all later batches, so one failing
+    destination never stops the export or the other mirrors. Batches from
+    then on are not journaled as done, so ``resume`` writes them again.
+
+    Names come from the plan made against ``source_root``: a mirror does not
+    apply ``duplicate_strategy`` itself, so files already in the mirror under
+    a planned name are overwritten, and shortcuts skipped in the source root
+    are not written to the mirror either.
+
+    With ``link_dest`` (the mirror's own earlier snapshot) unchanged shortcuts
+    are hard-linked there, as in ``source_root``.
+    """
+
+    def __init__(
+        self,
+        source_root: Path,
+        root: Path,
+        durability: Durability,
+        link_dest: Optional[Path] = None,
+        resuming: bool = False,
+    ) -> None:
+        self.source_root = source_root
+        self.result = MirrorResult(root)
+        self._writer = SyncedWriter(root, durability)
+        self._linker = _LinkSource(source_root, link_dest) if link_dest is not None else None
+        # files left by an interrupted run may be links into another snapshot
+        self._replace = resuming or self._linker is not None
+
+    def write(
+        self, shortcuts: List[PlannedShortcut], payloads: List[Optional[bytes]], *, sync: bool
+    ) -> None:
+        if self.result.error is not None:
+            return
+        root = self.result.root
+        last_folder: Optional[Path] = None
+        folder = root
+        try:
+            for shortcut, payload in zip(shortcuts, payloads):
+                if payload is None:
+                    continue
+                if shortcut.folder is not last_folder:
+                    last_folder = shortcut.folder
+                    folder = root / shortcut.folder.relative_to(self.source_root)
+                    self._writer.enter_directory(folder)
+                    if self._linker is not None:
+                        self._linker.enter_directory(shortcut.folder)
+                path = folder / shortcut.final_name  # type: ignore[operator]
+                if self._replace:
+                    path.unlink(missing_ok=True)
+                linker = self._linker
+                if linker is not None and linker.enabled and linker.link(path, payload):
+                    self.result.linked_count += 1
+                else:
+                    self._writer.write(path, payload)
+                    self.result.bytes_written += len(payload)
+                self.result.created_count += 1
+        except OSError as exc:
+            self.result.error = str(exc)
+            return
+        if sync:
+            self.sync()
+
+    def sync(self) -> None:
+        if self.result.error is not None:
+            return
+        try:
+            self._writer.sync()
+        except OSError as exc:
+            self.result.error = str(exc)
+
+
+class _LinkSource:
+    """Hard-links unchanged shortcuts to their copies in an earlier export.
+
+    A shortcut is linked when the file at the same relative path below
+    ``root`` holds exactly the bytes about to be written. An error saying the
+    two folders cannot share files (another volume, FAT) stops linking for the
+    rest of the export, and shortcuts are written instead.
+    """
+
+    def __init__(self, source_root: Path, root: Path) -> None:
+        self.source_root = source_root
+        self.root = root
+        self.enabled = True
+        self._folder = root
+
+    def enter_directory(self, folder: Path) -> None:
+        self._folder = self.root / folder.relative_to(self.source_root)
+
+    def link(self, path: Path, payload: bytes) -> bool:
+        """Link ``path`` to its earlier copy if that is unchanged; ``False`` means write it."""
+        previous = self._folder / path.name
+        try:
+            with open(previous, "rb") as fh:
+                if fh.read(len(payload) + 1) != payload:
+                    return False
+        except OSError:
+            return False  # new since the earlier export
+        try:
+            os.link(previous, path)
+        except OSError as exc:
+            # EMLINK: this file has too many links already; only that one is written
+            if exc.errno not in (errno.EMLINK, errno.EEXIST):
+                self.enabled = False
+            return False
+        return True
+
+
+class _TargetIndex:
+    """Answers "is this name taken?" from cached directory listings.
+
+    Each directory is listed at most once; names claimed by the current plan are
+    added to the cached listing so planning never has to stat individual files.
+    """
+
+    def __init__(self) -> None:
+        self._listings: Dict[str, Set[str]] = {}
+        self._last_folder: Optional[Path] = None
+        self._last_names: Set[str] = set()
+
+    def _names(self, folder: Path) -> Set[str]:
+        # Entries arrive folder by folder, so the previous lookup usually matches.
+        if folder is self._last_folder:
+            return self._last_names
+        key = os.path.normcase(str(folder))
+        names = self._listings.get(key)
+        if names is None:
+            try:
+                names = {os.path.normcase(name) for name in os.listdir(folder)}
+            except OSError:
+                names = set()
+            self._listings[key] = names
+        self._last_folder, self._last_names = folder, names
+        return names
+
+    def is_taken(self, folder: Path, name: str) -> bool:
+        return os.path.normcase(name) in self._names(folder)
+
+    def claim(self, folder: Path, name: str) -> None:
+        self._names(folder).add(os.path.normcase(name))
+
+
+@dataclass
+class MultiFormatResult:
+    """Outcome of :meth:`BookmarkExporter.export_formats`; unset formats stay ``None``.
+
+    A format that failed also stays ``None``; its error message is in ``errors``
+    under the format's label, and the other formats were still written.
+    """
+
+    shortcuts: Optional[ExportResult] = None
+    html_count: Optional[int] = None
+    text_count: Optional[int] = None
+    ndjson_count: Optional[int] = None
+    csv_count: Optional[int] = None
+    sqlite: Optional[SqliteExportResult] = None
+    html_shards: Optional[HtmlShardResult] = None
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class HtmlShardResult:
+    """Pages written by :meth:`BookmarkExporter.export_html_shards`."""
+
+    index: Path
+    pages: List[Path]
+    bookmark_count: int
+
+
+@dataclass(slots=True)
+class _RawBookmark:
+    """The fields of a raw bookmark dict that shortcut exports need."""
+
+    id: str
+    name: str
+    url: Optional[str]
+
+
+def _raw_bookmark(raw_node: Dict) -> _RawBookmark:
+    return _RawBookmark(str(raw_node.get("id", "")), raw_node.get("name", ""), raw_node.get("url"))
+
+
+def _added_before(folder: BookmarkNode, since: int) -> bool:
+    """True if every bookmark below ``folder`` is known to predate ``since``."""
+    return folder.latest_added is not None and folder.latest_added < since
+
+
+# (bookmark, folder path, shortcut folder relative to the output root or None)
+_Record = Tuple[BookmarkNode, Tuple[str, ...], Optional[Tuple[str, ...]]]
+_Section = Tuple[Tuple[str, ...], List[BookmarkNode]]
+
+
+class _BookmarkCollection:
+    """Bookmarks gathered by a single traversal of the export nodes.
+
+    ``records`` keeps tree order. The sorted and grouped views are computed at
+    most once and shared by every output format.
+    """
+
+    def __init__(self, records: List[_Record]) -> None:
+        self.records = records
+
+    @cached_property
+    def bookmarks(self) -> List[BookmarkNode]:
+        return [node for node, _, _ in self.records if node.url]
+
+    @cached_property
+    def sorted_bookmarks(self) -> List[BookmarkNode]:
+        return sorted(self.bookmarks, key=BookmarkExporter._bookmark_sort_key)
+
+    @cached_property
+    def sections(self) -> List[Tuple[Tuple[str, ...], List[BookmarkNode]]]:
+        grouped: Dict[Tuple[str, ...], List[BookmarkNode]] = defaultdict(list)
+        for node, path, _ in self.records:
+            if node.url:
+                grouped[path].append(node)
+        return [
+            (path, sorted(grouped[path], key=BookmarkExporter._bookmark_sort_key))
+            for path in sorted(grouped, key=BookmarkExporter._section_sort_key)
+        ]
 
 
 class BookmarkExporter:
+    JOURNAL_BATCH_SIZE = 500
+
     def __init__(
         self,
         output_root: str | Path,
@@ -53,50 +422,435 @@ class BookmarkExporter:
         duplicate_strategy: DuplicateStrategy = DuplicateStrategy.UNIQUE,
         max_name_length: int = 120,
         structure_mode: StructureMode = StructureMode.PRESERVE,
+        journal: bool = False,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        exclude_urls: Optional[Iterable[str]] = None,
+        track_paths: bool = True,
+        manifest: Path | str | None = None,
+        durability: Durability = Durability.NONE,
+        mirror_roots: Optional[Iterable[Path | str]] = None,
+        filters: Optional[FilterSpec] = None,
+        link_dest: Path | str | None = None,
+        mirror_link_dests: Optional[Mapping[Path | str, Path | str]] = None,
     ) -> None:
         self.output_root = Path(output_root)
         self.include_full_path = include_full_path
         self.duplicate_strategy = duplicate_strategy
         self.max_name_length = max_name_length
         self.structure_mode = structure_mode
+        self.journal = journal
+        self.since = since
+        self.until = until
+        # Only bookmarks added in [since, until) are exported, as Chromium timestamps.
+        self._date_range: Optional[Tuple[int, int]] = None
+        if since is not None or until is not None:
+            self._date_range = (
+                chrome_time_from_datetime(since) if since is not None else 0,
+                chrome_time_from_datetime(until) if until is not None else sys.maxsize,
+            )
+        # Bookmarks pointing at these URLs (e.g. dead links) are left out.
+        self.exclude_urls: Optional[frozenset] = frozenset(exclude_urls) if exclude_urls else None
+        # Folder, domain and URL rules, applied while walking so excluded
+        # folders are never entered.
+        self.filters = filters if filters else None
+        self._matcher: Optional[BookmarkFilter] = filters.compile() if filters else None
+        # Keeping a Path per shortcut costs memory at millions of bookmarks;
+        # without track_paths only counters are kept, and ``manifest`` (if
+        # set) receives one "created|skipped<TAB>path" line per shortcut.
+        self.track_paths = track_paths
+        self.manifest = Path(manifest) if manifest is not None else None
+        # NONE skips every fsync, journal included; see SyncedWriter.
+        self.durability = Durability(durability)
+        # Shortcut exports are planned once against output_root (which keeps
+        # the journal and manifest) and copied into each mirror root as well;
+        # duplicate_strategy is only checked against output_root (see _Mirror).
+        self.mirror_roots: List[Path] = [Path(root) for root in mirror_roots or ()]
+        # An earlier export (a snapshot) whose unchanged shortcuts are
+        # hard-linked rather than written again, like ``rsync --link-dest``.
+        self.link_dest = Path(link_dest) if link_dest is not None else None
+        # The same per mirror root: each links to an earlier export on its own volume.
+        self.mirror_link_dests: Dict[Path, Path] = {
+            Path(root): Path(dest) for root, dest in (mirror_link_dests or {}).items()
+        }
+
+    def plan(self, nodes: Iterable[BookmarkNode], *, resume: bool = False) -> ExportPlan:
+        """Resolve target paths, duplicates and folders without writing anything."""
+        journal = self._open_journal(resume=True) if self.journal and resume else None
+        entries = self._shortcut_entries(self._collect(nodes))
+        shortcuts = list(self._plan_shortcuts(entries, journal))
+
+        directories: List[Path] = []
+        seen: Set[Path] = set()
+        last_folder: Optional[Path] = None
+        total_bytes = 0
+        for shortcut in shortcuts:
+            if shortcut.final_name is not None:
+                total_bytes += len(self._shortcut_payload(shortcut.node.url or ""))
+            if shortcut.folder is last_folder:
+                continue
+            last_folder = folder = shortcut.folder
+            while folder not in seen and not folder.is_dir():
+                seen.add(folder)
+                directories.append(folder)
+                folder = folder.parent
+            seen.add(folder)
+        if self.structure_mode == StructureMode.COMBINED and not self.output_root.is_dir():
+            directories.append(self.output_root)
+        directories.sort(key=lambda path: len(path.parts))
+        return ExportPlan(
+            output_root=self.output_root,
+            shortcuts=shortcuts,
+            directories=directories,
+            total_bytes=total_bytes,
+            resume=resume,
+        )
+
+    def execute(self, plan: ExportPlan) -> ExportResult:
+        """Write the shortcuts of a plan produced by :meth:`plan`."""
+        journal = self._open_journal(plan.resume, load=False) if self.journal else None
+        return self._write_shortcuts(plan.shortcuts, journal, resuming=plan.resume)
 
-    def export(self, nodes: Iterable[BookmarkNode]) -> ExportResult:
+    def export(self, nodes: Iterable[BookmarkNode], *, resume: bool = False) -> ExportResult:
+        """Write one ``.url`` shortcut per bookmark below ``output_root``.
+
+        Planning and writing are interleaved batch by batch, so the whole plan is
+        never held in memory. With ``journal`` enabled, writes are journaled and
+        ``resume`` continues an interrupted export into the same folder.
+        """
+        return self._export_shortcuts(self._collect(nodes), resume)
+
+    def export_raw(
+        self,
+        raw: RawBookmarkFile,
+        include_roots: Optional[List[str]] = None,
+        *,
+        resume: bool = False,
+    ) -> ExportResult:
+        """Like :meth:`export`, but straight from the raw JSON without building nodes.
+
+        The bookmark dicts are walked with an explicit stack and only a batch
+        of shortcuts is held at a time (``COMBINED`` keeps one small record per
+        bookmark for sorting), so bulk exports avoid a full ``BookmarkNode``
+        copy of the file. Produces the same files as :meth:`export`.
+        """
+        roots = BookmarkTreeBuilder(raw).selected_roots(include_roots)
         if self.structure_mode == StructureMode.COMBINED:
-            return self._export_combined(nodes)
+            bookmarks = [bookmark for bookmark, _ in self._walk_raw(roots) if bookmark.url]
+            bookmarks.sort(key=self._bookmark_sort_key)
+            entries = self._combined_entries(bookmarks)
+        else:
+            entries = self._preserve_entries(self._walk_raw(roots))
+        journal = self._open_journal(resume) if self.journal else None
+        return self._write_shortcuts(
+            self._plan_shortcuts(entries, journal), journal, resuming=resume
+        )
+
+    def export_formats(
+        self,
+        nodes: Iterable[BookmarkNode],
+        *,
+        shortcuts: bool = True,
+        html_file: Path | str | None = None,
+        text_file: Path | str | None = None,
+        ndjson_file: OutputTarget | None = None,
+        csv_file: OutputTarget | None = None,
+        sqlite_file: Path | str | None = None,
+        html_shard_dir: Path | str | None = None,
+        shard_size: int = HTML_SHARD_SIZE,
+        resume: bool = False,
+    ) -> MultiFormatResult:
+        """Export several formats from one traversal, grouping and sort of ``nodes``.
+
+        Each format is written on its own: one that fails is recorded in
+        :attr:`MultiFormatResult.errors` and the remaining formats still run.
+        """
+        collection = self._collect(nodes)
+        result = MultiFormatResult()
+        # (label, result attribute, writer) for every requested format, in write order
+        steps: List[Tuple[str, str, Callable[[], Any]]] = []
+        if shortcuts:
+            steps.append(
+                ("Shortcuts", "shortcuts", lambda: self._export_shortcuts(collection, resume))
+            )
+        if html_file is not None:
+            steps.append(("HTML", "html_count", lambda: self._write_html(collection, html_file)))
+        if html_shard_dir is not None:
+            steps.append((
+                "HTML pages",
+                "html_shards",
+                lambda: self._write_html_shards(collection, html_shard_dir, shard_size),
+            ))
+        if text_file is not None:
+            steps.append(("Text", "text_count", lambda: self._write_text(collection, text_file)))
+        if ndjson_file is not None:
+            steps.append((
+                "NDJSON", "ndjson_count", lambda: self._write_ndjson(collection.records, ndjson_file)
+            ))
+        if csv_file is not None:
+            steps.append(
+                ("CSV", "csv_count", lambda: self._write_csv(collection.records, csv_file))
+            )
+        if sqlite_file is not None:
+            steps.append(("SQLite", "sqlite", lambda: self._write_sqlite(collection, sqlite_file)))
+        for label, attribute, write in steps:
+            try:
+                setattr(result, attribute, write())
+            except Exception as exc:  # one failing format must not cost the others
+                result.errors[label] = str(exc) or exc.__class__.__name__
+        return result
+
+    def _write_sqlite(
+        self, collection: _BookmarkCollection, sqlite_file: Path | str
+    ) -> SqliteExportResult:
+        from .sqlite_export import write_sqlite
+
+        return write_sqlite(((node, path) for node, path, _ in collection.records), sqlite_file)
 
+    def _export_shortcuts(self, collection: _BookmarkCollection, resume: bool) -> ExportResult:
+        journal = self._open_journal(resume) if self.journal else None
+        entries = self._shortcut_entries(collection)
+        return self._write_shortcuts(
+            self._plan_shortcuts(entries, journal), journal, resuming=resume
+        )
+
+    def _plan_shortcuts(
+        self,
+        entries: Iterable[Tuple[BookmarkNode, Path, str]],
+        journal: Optional[ExportJournal],
+    ) -> Iterator[PlannedShortcut]:
+        index = _TargetIndex()
+        if journal is not None:
+            for relpath in journal.reserved_paths():
+                folder, _, name = relpath.rpartition("/")
+                index.claim(self.output_root / folder, name)
+        keys: Dict[str, int] = {}
+        last_folder: Optional[Path] = None
+        prefix = ""
+        for node, folder, name in entries:
+            key = ""
+            if self.journal:
+                if folder is not last_folder:
+                    last_folder = folder
+                    relative = folder.relative_to(self.output_root).as_posix()
+                    prefix = "" if relative == "." else relative + "/"
+                key = self._journal_key(node, prefix + name, keys)
+            if journal is not None:
+                known, relpath = journal.target_for(key)
+                if known:
+                    final_name = None if relpath is None else relpath.rpartition("/")[2]
+                    yield PlannedShortcut(
+                        node, folder, name, final_name, final_name != name, key,
+                        key in journal.completed,
+                    )
+                    continue
+            collision = index.is_taken(folder, name)
+            final_name = self._handle_duplicates(folder, name, index) if collision else name
+            if final_name is not None:
+                index.claim(folder, final_name)
+            yield PlannedShortcut(node, folder, name, final_name, collision, key)
+
+    def _write_shortcuts(
+        self,
+        shortcuts: Iterable[PlannedShortcut],
+        journal: Optional[ExportJournal],
+        *,
+        resuming: bool = False,
+    ) -> ExportResult:
+        started = time.perf_counter()
+        track = self.track_paths
         created: List[Path] = []
         skipped: List[Path] = []
-        for node in nodes:
-            if not node.is_folder:
-                continue
-            if self.include_full_path:
-                self._export_folder(node, created, skipped, base_components=[])
-            else:
-                # Skip the root folder name — export children directly
-                for child in node.children:
-                    if child.is_folder:
-                        self._export_folder(child, created, skipped, base_components=[])
-                    elif child.url:
-                        self.output_root.mkdir(parents=True, exist_ok=True)
-                        target = self.output_root / f"{self._sanitize(child.name)}.url"
-                        final_path = self._handle_duplicates(target)
-                        if final_path is None:
-                            skipped.append(target)
-                        else:
-                            content = self._shortcut_contents(child.url)
-                            final_path.write_text(content, encoding="utf-8")
-                            created.append(final_path)
-        return ExportResult(created_files=created, skipped=skipped)
+        created_count = skipped_count = bytes_written = linked_count = 0
+        writer = SyncedWriter(self.output_root, self.durability)
+        linker = (
+            _LinkSource(self.output_root, self.link_dest) if self.link_dest is not None else None
+        )
+        # When resuming, a path that may exist already could be a hard link into
+        # another snapshot; it is unlinked first so writing never changes that copy.
+        if self.structure_mode == StructureMode.COMBINED:
+            writer.enter_directory(self.output_root)
+        manifest: Optional[TextIO] = None
+        if self.manifest is not None:
+            self.manifest.parent.mkdir(parents=True, exist_ok=True)
+            manifest = self.manifest.open("w", encoding="utf-8")
+        mirrors = [
+            _Mirror(
+                self.output_root, root, self.durability, self.mirror_link_dests.get(root), resuming
+            )
+            for root in self.mirror_roots
+        ]
+        pool = None
+        if mirrors:
+            pool = ThreadPoolExecutor(max_workers=len(mirrors), thread_name_prefix="mirror")
+
+        last_folder: Optional[Path] = None
+        shortcuts = iter(shortcuts)
+        try:
+            while True:
+                batch = list(itertools.islice(shortcuts, self.JOURNAL_BATCH_SIZE))
+                if not batch:
+                    break
+                pending: List[PlannedShortcut] = []
+                for shortcut in batch:
+                    if not shortcut.completed:
+                        pending.append(shortcut)
+                    elif shortcut.final_name is None:
+                        skipped_count += 1
+                        if track:
+                            skipped.append(shortcut.target)
+                        if manifest is not None:
+                            manifest.write(f"skipped\t{shortcut.target}\n")
+                    else:
+                        created_count += 1
+                        if track:
+                            created.append(shortcut.path)  # type: ignore[arg-type]
+                        if manifest is not None:
+                            manifest.write(f"created\t{shortcut.path}\n")
+
+                if journal is not None:
+                    journal.record_planned(
+                        (shortcut.key, shortcut.final_name) for shortcut in pending
+                    )
+                # encoded once, then written to every destination concurrently
+                payloads = [
+                    None if shortcut.final_name is None
+                    else self._shortcut_payload(shortcut.node.url or "")
+                    for shortcut in pending
+                ]
+                futures = []
+                if pool is not None:
+                    futures = [
+                        pool.submit(mirror.write, pending, payloads, sync=journal is not None)
+                        for mirror in mirrors
+                    ]
+                for shortcut, payload in zip(pending, payloads):
+                    if shortcut.folder is not last_folder:
+                        writer.enter_directory(shortcut.folder)
+                        if linker is not None:
+                            linker.enter_directory(shortcut.folder)
+                        last_folder = shortcut.folder
+                    if shortcut.final_name is None:
+                        skipped_count += 1
+                        if track:
+                            skipped.append(shortcut.target)
+                        if manifest is not None:
+                            manifest.write(f"skipped\t{shortcut.target}\n")
+                        continue
+                    path = shortcut.folder / shortcut.final_name
+                    if shortcut.collision or resuming:
+                        path.unlink(missing_ok=True)
+                    linked = linker is not None and linker.enabled and linker.link(
+                        path, payload  # type: ignore[arg-type]
+                    )
+                    if linked:
+                        linked_count += 1
+                    else:
+                        writer.write(path, payload)  # type: ignore[arg-type]
+                        bytes_written += len(payload)
+                    created_count += 1
+                    if track:
+                        created.append(path)
+                    if manifest is not None:
+                        manifest.write(f"created\t{path}\n")
+                for future in futures:
+                    future.result()
+                if journal is not None:
+                    writer.sync()  # a "done" record must not outlive its files
+                    # a batch is only done once every mirror has it; after a
+                    # mirror failed the rest stays pending for --resume
+                    if not any(mirror.result.error for mirror in mirrors):
+                        journal.record_completed(shortcut.key for shortcut in pending)
+            writer.sync()
+            for mirror in mirrors:
+                mirror.sync()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            if journal is not None:
+                journal.close()
+            if manifest is not None:
+                manifest.close()
+
+        if journal is not None and not any(mirror.result.error for mirror in mirrors):
+            journal.finish()
+        return ExportResult(
+            created_files=created,
+            skipped=skipped,
+            created_count=created_count,
+            skipped_count=skipped_count,
+            bytes_written=bytes_written,
+            elapsed=time.perf_counter() - started,
+            mirrors=[mirror.result for mirror in mirrors],
+            linked_count=linked_count,
+        )
 
     def export_html(self, nodes: Iterable[BookmarkNode], output_file: Path | str) -> int:
         """Create a standalone HTML document listing all bookmarks."""
 
+        return self._write_html(self._collect(nodes), output_file)
+
+    def export_html_shards(
+        self,
+        nodes: Iterable[BookmarkNode],
+        output_dir: Path | str,
+        *,
+        shard_size: int = HTML_SHARD_SIZE,
+        workers: Optional[int] = None,
+    ) -> HtmlShardResult:
+        """Write an index page plus one HTML page per top-level folder.
+
+        Folders holding more than ``shard_size`` bookmarks (and combined
+        exports) are split into pages of at most ``shard_size`` entries, so no
+        page grows with the size of the collection. Pages render concurrently.
+        """
+
+        return self._write_html_shards(self._collect(nodes), output_dir, shard_size, workers)
+
+    def export_text(self, nodes: Iterable[BookmarkNode], output_file: Path | str) -> int:
+        """Create a newline-delimited list of bookmark URLs."""
+
+        return self._write_text(self._collect(nodes), output_file)
+
+    def export_ndjson(self, nodes: Iterable[BookmarkNode], output: OutputTarget) -> int:
+        """Stream one JSON object per bookmark, in tree order.
+
+        ``output`` is a path, ``"-"`` for standard output, or an open text stream.
+        Records carry ``id``, ``name``, ``url`` and ``folder`` (a list of names).
+        """
+
+        return self._write_ndjson(self._walk(nodes), output)
+
+    def export_csv(self, nodes: Iterable[BookmarkNode], output: OutputTarget) -> int:
+        """Stream ``id,name,url,folder`` rows, in tree order.
+
+        ``output`` is a path, ``"-"`` for standard output, or an open text stream.
+        The folder column joins the folder names with ``" / "``.
+        """
+
+        return self._write_csv(self._walk(nodes), output)
+
+    def export_sqlite(
+        self, nodes: Iterable[BookmarkNode], database: Path | str, *, prune: bool = True
+    ) -> SqliteExportResult:
+        """Upsert bookmarks and folders into a SQLite database with an FTS5 index.
+
+        Rows are keyed by bookmark/folder ``id`` and rewritten only when they
+        changed; with ``prune`` rows missing from this export are deleted.
+        """
+        from .sqlite_export import write_sqlite
+
+        return write_sqlite(
+            ((node, path) for node, path, _ in self._walk(nodes)), database, prune=prune
+        )
+
+    def _write_html(self, collection: _BookmarkCollection, output_file: Path | str) -> int:
         if self.structure_mode == StructureMode.COMBINED:
-            bookmarks = self._sorted_bookmarks(nodes)
+            bookmarks = collection.sorted_bookmarks
             bookmark_count = len(bookmarks)
             document = self._html_flat_document(bookmarks)
         else:
-            sections = self._bookmarks_grouped_by_folder(nodes)
+            sections = collection.sections
             bookmark_count = sum(len(bookmarks) for _, bookmarks in sections)
             document = self._html_document(sections)
         output_path = Path(output_file)
@@ -104,15 +858,97 @@ class BookmarkExporter:
         output_path.write_text(document, encoding="utf-8")
         return bookmark_count
 
-    def export_text(self, nodes: Iterable[BookmarkNode], output_file: Path | str) -> int:
-        """Create a newline-delimited list of bookmark URLs."""
+    def _write_html_shards(
+        self,
+        collection: _BookmarkCollection,
+        output_dir: Path | str,
+        shard_size: int,
+        workers: Optional[int] = None,
+    ) -> HtmlShardResult:
+        # Rendering is pure Python and holds the GIL, but threads still overlap
+        # the encoding and file writes; pickling bookmarks into worker
+        # processes would cost about as much as rendering them.
+        output_root = Path(output_dir)
+        output_root.mkdir(parents=True, exist_ok=True)
+        shards = self._html_shards(collection, shard_size)
+        names = [
+            f"{number:04d}-{SLUG_CHARS.sub('-', label.casefold()).strip('-')[:40] or 'bookmarks'}.html"
+            for number, (label, _) in enumerate(shards, 1)
+        ]
+
+        def write_page(number: int) -> Path:
+            label, sections = shards[number]
+            if self.structure_mode == StructureMode.COMBINED:
+                document = self._html_flat_document(sections[0][1], title=label, index=HTML_INDEX_NAME)
+            else:
+                document = self._html_document(sections, title=label, index=HTML_INDEX_NAME)
+            page = output_root / names[number]
+            page.write_text(document, encoding="utf-8")
+            return page
+
+        with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1)) as pool:
+            pages = list(pool.map(write_page, range(len(shards))))
+
+        counts = [sum(len(bookmarks) for _, bookmarks in sections) for _, sections in shards]
+        lines = _html_head("Bookmarks Export") + ["  <ul>"]
+        for name, (label, _), count in zip(names, shards, counts):
+            lines.append(f'    <li><a href="{name}">{html.escape(label)}</a> ({count})</li>')
+        lines.extend(["  </ul>", "</body>", "</html>"])
+        index = output_root / HTML_INDEX_NAME
+        index.write_text("\n".join(lines), encoding="utf-8")
+        return HtmlShardResult(index=index, pages=pages, bookmark_count=sum(counts))
+
+    def _html_shards(
+        self, collection: _BookmarkCollection, shard_size: int
+    ) -> List[Tuple[str, List[_Section]]]:
+        """``(page title, sections)`` per page, split every ``shard_size`` bookmarks.
+
+        Sections are paths from the root, so a top-level folder is ``path[:2]``;
+        bookmarks directly in a root share that root's page.
+        """
+        if shard_size < 0:
+            raise ValueError(f"shard_size cannot be negative: {shard_size}")
+        if self.structure_mode == StructureMode.COMBINED:
+            bookmarks = collection.sorted_bookmarks
+            groups: List[Tuple[str, List[_Section]]] = [("Bookmarks", [((), bookmarks)])] if bookmarks else []
+        else:
+            # grouped by key rather than by run: sections sort case-insensitively,
+            # so "Work" and "work" may interleave
+            by_folder: Dict[Tuple[str, ...], List[_Section]] = {}
+            for section in collection.sections:
+                by_folder.setdefault(section[0][:2], []).append(section)
+            groups = [(self._section_label(top), sections) for top, sections in by_folder.items()]
+
+        shards: List[Tuple[str, List[_Section]]] = []
+        for label, sections in groups:
+            pages: List[List[_Section]] = [[]]
+            room = shard_size
+            for path, bookmarks in sections:
+                start = 0
+                while start < len(bookmarks):
+                    if shard_size and room == 0:
+                        pages.append([])
+                        room = shard_size
+                    end = len(bookmarks) if not shard_size else start + room
+                    chunk = bookmarks[start:end]
+                    pages[-1].append((path, chunk))
+                    room -= len(chunk)
+                    start += len(chunk)
+            if len(pages) == 1:
+                shards.append((label, pages[0]))
+            else:
+                shards.extend(
+                    (f"{label} ({number}/{len(pages)})", page) for number, page in enumerate(pages, 1)
+                )
+        return shards
 
+    def _write_text(self, collection: _BookmarkCollection, output_file: Path | str) -> int:
         if self.structure_mode == StructureMode.COMBINED:
-            bookmarks = self._sorted_bookmarks(nodes)
+            bookmarks = collection.sorted_bookmarks
             bookmark_count = len(bookmarks)
             document = self._text_flat_document(bookmarks)
         else:
-            sections = self._bookmarks_grouped_by_folder(nodes)
+            sections = collection.sections
             bookmark_count = sum(len(bookmarks) for _, bookmarks in sections)
             document = self._text_document(sections)
         output_path = Path(output_file)
@@ -120,60 +956,227 @@ class BookmarkExporter:
         output_path.write_text(document, encoding="utf-8")
         return bookmark_count
 
-    def _export_folder(
+    def _write_ndjson(self, records: Iterable[_Record], output: OutputTarget) -> int:
+        count = 0
+        with _open_output(output) as fh:
+            for node, path, _ in records:
+                if not node.url:
+                    continue
+                record = {"id": node.id, "name": node.name, "url": node.url, "folder": list(path)}
+                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    def _write_csv(self, records: Iterable[_Record], output: OutputTarget) -> int:
+        count = 0
+        with _open_output(output) as fh:
+            writer = csv.writer(fh, lineterminator="\n")
+            writer.writerow(CSV_COLUMNS)
+            for node, path, _ in records:
+                if not node.url:
+                    continue
+                writer.writerow((node.id, node.name, node.url, " / ".join(path)))
+                count += 1
+        return count
+
+    def iter_bookmarks(self, nodes: Iterable[BookmarkNode]) -> Iterator[BookmarkNode]:
+        """The bookmarks an export of ``nodes`` includes, in tree order.
+
+        Date, URL and folder filters are applied, so this is what to check
+        before excluding links.
+        """
+        return (node for node, _, _ in self._walk(nodes))
+
+    def _collect(self, nodes: Iterable[BookmarkNode]) -> _BookmarkCollection:
+        """Walk ``nodes`` once, recording every bookmark with its folder paths."""
+        return _BookmarkCollection(list(self._walk(nodes)))
+
+    def _walk(self, nodes: Iterable[BookmarkNode]) -> Iterator[_Record]:
+        dates, excluded, matcher = self._date_range, self.exclude_urls, self._matcher
+        for node in nodes:
+            if not node.is_folder:
+                if (
+                    node.url
+                    and (dates is None or dates[0] <= node.date_added < dates[1])
+                    and (excluded is None or node.url not in excluded)
+                    and (
+                        matcher is None
+                        or matcher.accepts(node.url, matcher.enter_path(node.path_components[:-1]))
+                    )
+                ):
+                    yield node, tuple(node.path_components[:-1]), None
+                continue
+            if dates is not None and _added_before(node, dates[0]):
+                continue
+            path = tuple(node.path_components)
+            state = None
+            if matcher is not None:
+                state = matcher.enter_path(path)
+                if state is None:
+                    continue
+            if self.include_full_path:
+                yield from self._walk_folder(node, path, path, top_level=False, state=state)
+            else:
+                # Skip the root folder name — export children directly
+                yield from self._walk_folder(node, path, (), top_level=True, state=state)
+
+    def _walk_folder(
         self,
         folder: BookmarkNode,
-        created: List[Path],
-        skipped: List[Path],
-        base_components: List[str],
-    ) -> None:
-        if not self._folder_contains_bookmarks(folder):
-            return
-        components = base_components + folder.path_components if self.include_full_path else base_components + [folder.name]
-        folder_path = self.output_root.joinpath(*map(self._sanitize, components))
-        folder_path.mkdir(parents=True, exist_ok=True)
-
+        path: Tuple[str, ...],
+        relative: Tuple[str, ...],
+        top_level: bool,
+        state: Optional[FolderState] = None,
+    ) -> Iterator[_Record]:
+        dates, excluded, matcher = self._date_range, self.exclude_urls, self._matcher
         for child in folder.children:
             if child.is_folder:
-                next_base = base_components if self.include_full_path else base_components + [self._sanitize(folder.name)]
-                self._export_folder(child, created, skipped, next_base)
-            else:
-                target = folder_path / f"{self._sanitize(child.name)}.url"
-                final_path = self._handle_duplicates(target)
-                if final_path is None:
-                    skipped.append(target)
+                if dates is not None and _added_before(child, dates[0]):
+                    continue  # nothing below was added recently enough
+                child_state = None
+                if matcher is not None:
+                    child_state = matcher.enter(state, child.name)
+                    if child_state is None:
+                        continue  # excluded by the folder rules
+                child_relative = relative + (child.name,)
+                # With full paths both tuples are equal; share one object per folder.
+                child_path = child_relative if path is relative else path + (child.name,)
+                yield from self._walk_folder(
+                    child, child_path, child_relative, top_level=False, state=child_state
+                )
+            elif child.url or not top_level:
+                if (
+                    (dates is None or dates[0] <= child.date_added < dates[1])
+                    and (excluded is None or child.url not in excluded)
+                    and (matcher is None or matcher.accepts(child.url, state))
+                ):
+                    yield child, path, relative
+
+    def _walk_raw(
+        self, roots: Iterable[Dict]
+    ) -> Iterator[Tuple[_RawBookmark, Optional[Tuple[str, ...]]]]:
+        """Yield ``(bookmark, shortcut folder or None)`` like :meth:`_walk`, from raw dicts."""
+        dates, excluded, matcher = self._date_range, self.exclude_urls, self._matcher
+        for root in roots:
+            if raw_node_type(root) != "folder":
+                if (
+                    root.get("url")
+                    and (dates is None or dates[0] <= chrome_time(root.get("date_added")) < dates[1])
+                    and (excluded is None or root.get("url") not in excluded)
+                    and (matcher is None or matcher.accepts(root.get("url"), matcher.root_state))
+                ):
+                    yield _raw_bookmark(root), None
+                continue
+            state = None
+            if matcher is not None:
+                state = matcher.enter(matcher.root_state, root.get("name", ""))
+                if state is None:
                     continue
-                content = self._shortcut_contents(child.url or "")
-                final_path.write_text(content, encoding="utf-8")
-                created.append(final_path)
+            relative: Tuple[str, ...] = (root.get("name", ""),) if self.include_full_path else ()
+            # (remaining children, shortcut folder, directly below a skipped root name, filter state)
+            stack = [(iter(root.get("children", [])), relative, not self.include_full_path, state)]
+            while stack:
+                children, relative, top_level, state = stack[-1]
+                for child in children:
+                    if raw_node_type(child) == "folder":
+                        child_state = None
+                        if matcher is not None:
+                            child_state = matcher.enter(state, child.get("name", ""))
+                            if child_state is None:
+                                continue  # excluded by the folder rules
+                        child_relative = relative + (child.get("name", ""),)
+                        stack.append(
+                            (iter(child.get("children", [])), child_relative, False, child_state)
+                        )
+                        break
+                    if child.get("url") or not top_level:
+                        if (
+                            (dates is None or dates[0] <= chrome_time(child.get("date_added")) < dates[1])
+                            and (excluded is None or child.get("url") not in excluded)
+                            and (matcher is None or matcher.accepts(child.get("url"), state))
+                        ):
+                            yield _raw_bookmark(child), relative
+                else:
+                    stack.pop()
 
-    def _export_combined(self, nodes: Iterable[BookmarkNode]) -> ExportResult:
-        created: List[Path] = []
-        skipped: List[Path] = []
-        self.output_root.mkdir(parents=True, exist_ok=True)
-        for bookmark in self._sorted_bookmarks(nodes):
-            target = self.output_root / f"{self._sanitize(bookmark.name or bookmark.url or 'Bookmark')}.url"
-            final_path = self._handle_duplicates(target)
-            if final_path is None:
-                skipped.append(target)
+    def _shortcut_entries(
+        self, collection: _BookmarkCollection
+    ) -> Iterator[Tuple[BookmarkNode, Path, str]]:
+        """Yield ``(bookmark, folder, file name)`` in export order.
+
+        Consecutive entries of one folder share a single ``Path`` object.
+        """
+        if self.structure_mode == StructureMode.COMBINED:
+            return self._combined_entries(collection.sorted_bookmarks)
+        return self._preserve_entries((node, relative) for node, _, relative in collection.records)
+
+    def _combined_entries(
+        self, bookmarks: Iterable[BookmarkNode]
+    ) -> Iterator[Tuple[BookmarkNode, Path, str]]:
+        for bookmark in bookmarks:
+            name = bookmark.name or bookmark.url or "Bookmark"
+            yield bookmark, self.output_root, f"{self._sanitize(name)}.url"
+
+    def _preserve_entries(
+        self, records: Iterable[Tuple[BookmarkNode, Optional[Tuple[str, ...]]]]
+    ) -> Iterator[Tuple[BookmarkNode, Path, str]]:
+        last_relative: Optional[Tuple[str, ...]] = None
+        folder_path = self.output_root
+        for node, relative in records:
+            if relative is None:
                 continue
-            content = self._shortcut_contents(bookmark.url or "")
-            final_path.write_text(content, encoding="utf-8")
-            created.append(final_path)
-        return ExportResult(created_files=created, skipped=skipped)
-
-    def _handle_duplicates(self, target: Path) -> Path | None:
-        if not target.exists():
-            return target
+            if relative is not last_relative:
+                last_relative = relative
+                folder_path = self.output_root.joinpath(*map(self._sanitize, relative))
+            yield node, folder_path, f"{self._sanitize(node.name)}.url"
+
+    def _open_journal(self, resume: bool, *, load: bool = True) -> ExportJournal:
+        journal = ExportJournal(
+            self.output_root, self._journal_options(), sync=self.durability is not Durability.NONE
+        )
+        if resume:
+            if load:
+                journal.load()
+        elif journal.path.exists():
+            journal.path.unlink()
+        return journal
+
+    def _journal_options(self) -> Dict[str, object]:
+        options: Dict[str, object] = {
+            "include_full_path": self.include_full_path,
+            "duplicate_strategy": self.duplicate_strategy.value,
+            "max_name_length": self.max_name_length,
+            "structure_mode": self.structure_mode.value,
+        }
+        if self._date_range is not None:
+            options["date_range"] = list(self._date_range)
+        if self.exclude_urls is not None:
+            digest = hashlib.blake2b(digest_size=16)
+            for url in sorted(self.exclude_urls):
+                digest.update(url.encode("utf-8") + b"\0")
+            options["excluded_urls"] = digest.hexdigest()
+        if self.filters is not None:
+            options["filters"] = self.filters.to_dict()
+        return options
+
+    @staticmethod
+    def _journal_key(node: BookmarkNode, relpath: str, seen: Dict[str, int]) -> str:
+        key = f"{node.id}:{relpath}"
+        occurrence = seen.get(key, 0) + 1
+        seen[key] = occurrence
+        return key if occurrence == 1 else f"{key}#{occurrence}"
+
+    def _handle_duplicates(self, folder: Path, name: str, index: _TargetIndex) -> str | None:
+        if not index.is_taken(folder, name):
+            return name
         if self.duplicate_strategy == DuplicateStrategy.SKIP:
             return None
         if self.duplicate_strategy == DuplicateStrategy.OVERWRITE:
-            return target
-        stem = target.stem
-        suffix = target.suffix
+            return name
+        stem, suffix = os.path.splitext(name)
         for idx in itertools.count(2):
-            candidate = target.with_name(f"{stem} ({idx}){suffix}")
-            if not candidate.exists():
+            candidate = f"{stem} ({idx}){suffix}"
+            if not index.is_taken(folder, candidate):
                 return candidate
         raise RuntimeError("Failed to resolve duplicate filename")
 
@@ -189,40 +1192,14 @@ class BookmarkExporter:
     def _shortcut_contents(url: str) -> str:
         return f"[InternetShortcut]\nURL={url}\n"
 
-    def _folder_contains_bookmarks(self, folder: BookmarkNode) -> bool:
-        for child in folder.children:
-            if not child.is_folder:
-                return True
-            if self._folder_contains_bookmarks(child):
-                return True
-        return False
-
-    def _iter_bookmark_nodes(self, nodes: Iterable[BookmarkNode]) -> Iterable[BookmarkNode]:
-        for node in nodes:
-            if not node.is_folder and node.url:
-                yield node
-            for descendant in node.iter_descendants():
-                if descendant.is_folder:
-                    continue
-                if not descendant.url:
-                    continue
-                yield descendant
-
-    def _sorted_bookmarks(self, nodes: Iterable[BookmarkNode]) -> List[BookmarkNode]:
-        return sorted(self._iter_bookmark_nodes(nodes), key=self._bookmark_sort_key)
+    def _shortcut_payload(self, url: str) -> bytes:
+        # Encoded exactly as a text-mode write would produce on this platform.
+        return self._shortcut_contents(url).replace("\n", os.linesep).encode("utf-8")
 
     def _bookmarks_grouped_by_folder(
         self, nodes: Iterable[BookmarkNode]
     ) -> List[Tuple[Tuple[str, ...], List[BookmarkNode]]]:
-        sections: Dict[Tuple[str, ...], List[BookmarkNode]] = defaultdict(list)
-        for bookmark in self._iter_bookmark_nodes(nodes):
-            path = tuple(bookmark.path_components[:-1])
-            sections[path].append(bookmark)
-
-        ordered_sections: List[Tuple[Tuple[str, ...], List[BookmarkNode]]] = []
-        for path in sorted(sections, key=self._section_sort_key):
-            ordered_sections.append((path, sorted(sections[path], key=self._bookmark_sort_key)))
-        return ordered_sections
+        return self._collect(nodes).sections
 
     @staticmethod
     def _section_sort_key(path: Sequence[str]) -> Tuple[str, ...]:
@@ -240,17 +1217,13 @@ class BookmarkExporter:
         return "Bookmarks"
 
     def _html_document(
-        self, sections: List[Tuple[Tuple[str, ...], List[BookmarkNode]]]
+        self,
+        sections: List[Tuple[Tuple[str, ...], List[BookmarkNode]]],
+        *,
+        title: str = "Bookmarks Export",
+        index: Optional[str] = None,
     ) -> str:
-        lines = [
-            "<!DOCTYPE html>",
-            "<html lang=\"en\">",
-            "<head>",
-            "  <meta charset=\"utf-8\" />",
-            "  <title>Bookmarks Export</title>",
-            "</head>",
-            "<body>",
-        ]
+        lines = _html_head(title, index)
         for path, bookmarks in sections:
             section_label = html.escape(self._section_label(path))
             lines.append(f"  <h2>{section_label}</h2>")
@@ -263,17 +1236,14 @@ class BookmarkExporter:
         lines.extend(["</body>", "</html>"])
         return "\n".join(lines)
 
-    def _html_flat_document(self, bookmarks: List[BookmarkNode]) -> str:
-        lines = [
-            "<!DOCTYPE html>",
-            "<html lang=\"en\">",
-            "<head>",
-            "  <meta charset=\"utf-8\" />",
-            "  <title>Bookmarks Export</title>",
-            "</head>",
-            "<body>",
-            "  <ul>",
-        ]
+    def _html_flat_document(
+        self,
+        bookmarks: List[BookmarkNode],
+        *,
+        title: str = "Bookmarks Export",
+        index: Optional[str] = None,
+    ) -> str:
+        lines = _html_head(title, index) + ["  <ul>"]
         for bookmark in bookmarks:
             url = html.escape(bookmark.url or "#", quote=True)
             label = html.escape(bookmark.name or bookmark.url or "Bookmark")
@@ -297,3 +1267,19 @@ class BookmarkExporter:
 
     def _text_flat_document(self, bookmarks: List[BookmarkNode]) -> str:
         return "\n".join(bookmark.url or "" for bookmark in bookmarks)
+
+
+def _html_head(title: str, index: Optional[str] = None) -> List[str]:
+    """Opening lines of an HTML page, with a link back to ``index`` for shards."""
+    lines = [
+        "<!DOCTYPE html>",
+        "<html lang=\"en\">",
+        "<head>",
+        "  <meta charset=\"utf-8\" />",
+        f"  <title>{html.escape(title)}</title>",
+        "</head>",
+        "<body>",
+    ]
+    if index is not None:
+        lines.append(f'  <p><a href="{html.escape(index, quote=True)}">All bookmarks</a></p>')
+    return lines
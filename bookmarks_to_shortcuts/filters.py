@@ -0,0 +1,244 @@
+"""Include/exclude rules for exports, compiled into a single matcher."""
+from __future__ import annotations
+
+import re
+from dataclasses import asdict, dataclass, field, fields
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .codec import read_json
+
+# Group 1 is the authority of a "scheme://authority/..." URL.
+AUTHORITY = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://([^/?#]*)")
+
+# (pattern index, segment position) pairs the folder globs have reached
+_GlobStates = FrozenSet[Tuple[int, int]]
+_NO_STATES: _GlobStates = frozenset()
+
+
+@dataclass
+class FilterSpec:
+    """Which bookmarks an export keeps.
+
+    Folder globs match the ``/``-separated folder path from the root name
+    (``Bookmarks bar/Work``), case-insensitively, and apply to the whole
+    subtree: ``*`` matches within one folder name and ``**`` any number of
+    folders. Domains match the host and its subdomains; ``*.corp.example``
+    matches subdomains only. URL patterns are regular expressions searched
+    anywhere in the URL. Empty include lists keep everything.
+    """
+
+    include_folders: List[str] = field(default_factory=list)
+    exclude_folders: List[str] = field(default_factory=list)
+    include_domains: List[str] = field(default_factory=list)
+    exclude_domains: List[str] = field(default_factory=list)
+    include_urls: List[str] = field(default_factory=list)
+    exclude_urls: List[str] = field(default_factory=list)
+    exclude_schemes: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FilterSpec":
+        names = {item.name for item in fields(cls)}
+        unknown = set(data) - names
+        if unknown:
+            raise ValueError(f"Unknown filter rules: {', '.join(sorted(unknown))}")
+        for name, values in data.items():
+            # a bare string would otherwise become one rule per character
+            if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+                raise ValueError(f"Filter rule {name} must be a list of strings")
+        return cls(**{name: list(values) for name, values in data.items()})
+
+    @classmethod
+    def load(cls, path: str | Path) -> "FilterSpec":
+        """Read a JSON object with the same keys as the fields of this class."""
+        return cls.from_dict(read_json(path))
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        return {name: values for name, values in asdict(self).items() if values}
+
+    def merged(self, other: "FilterSpec") -> "FilterSpec":
+        return FilterSpec(
+            **{item.name: getattr(self, item.name) + getattr(other, item.name) for item in fields(self)}
+        )
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, item.name) for item in fields(self))
+
+    def compile(self) -> "BookmarkFilter":
+        return BookmarkFilter(self)
+
+
+class _DomainTrie:
+    """Domain suffixes stored label by label from the top-level domain down."""
+
+    _END = ""  # key marking a rule; its value says whether the bare domain matches too
+
+    def __init__(self, domains: Iterable[str]) -> None:
+        self._root: Dict[str, Any] = {}
+        for domain in domains:
+            domain = domain.strip().lower().rstrip(".")
+            subdomains_only = domain.startswith("*.")
+            node = self._root
+            for label in reversed((domain[2:] if subdomains_only else domain).split(".")):
+                node = node.setdefault(label, {})
+            # a plain rule wins over a subdomain-only rule for the same domain
+            node[self._END] = node.get(self._END, False) or not subdomains_only
+
+    def __bool__(self) -> bool:
+        return bool(self._root)
+
+    def matches(self, host: str) -> bool:
+        node = self._root
+        labels = host.split(".")
+        for depth in range(len(labels) - 1, -1, -1):
+            node = node.get(labels[depth])  # type: ignore[assignment]
+            if node is None:
+                return False
+            if self._END in node and (depth > 0 or node[self._END]):
+                return True
+        return False
+
+
+def _host(authority: str) -> str:
+    host = authority.rpartition("@")[2]
+    if host.startswith("["):
+        return host[1:].partition("]")[0].lower()  # IPv6 literal
+    return host.partition(":")[0].lower().rstrip(".")
+
+
+def _combined_regex(patterns: List[str], rule: str) -> Optional["re.Pattern[str]"]:
+    if not patterns:
+        return None
+    for pattern in patterns:
+        try:
+            re.compile(pattern)
+        except re.error as exc:
+            raise ValueError(f"Invalid {rule} pattern {pattern!r}: {exc}") from None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+class _FolderGlobs:
+    """Folder path globs matched one path segment at a time.
+
+    A state records how far each glob has matched the folders entered so
+    far, so a child folder costs one step per live glob instead of a match
+    of its full path, and a folder no glob can still reach is known at once.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: List[Tuple[str, ...]] = [
+            tuple(part.casefold() for part in pattern.strip("/").split("/") if part)
+            for pattern in patterns
+        ]
+        self.start: _GlobStates = self._closure((index, 0) for index in range(len(self.patterns)))
+
+    def _closure(self, states: Iterable[Tuple[int, int]]) -> _GlobStates:
+        result = set()
+        for index, position in states:
+            pattern = self.patterns[index]
+            result.add((index, position))
+            while position < len(pattern) and pattern[position] == "**":
+                position += 1  # "**" may match no folders at all
+                result.add((index, position))
+        return frozenset(result)
+
+    def step(self, states: _GlobStates, name: str) -> _GlobStates:
+        name = name.casefold()
+        following = []
+        for index, position in states:
+            pattern = self.patterns[index]
+            if position == len(pattern):
+                continue
+            if pattern[position] == "**":
+                following.append((index, position))
+            elif fnmatchcase(name, pattern[position]):
+                following.append((index, position + 1))
+        return self._closure(following)
+
+    def matched(self, states: _GlobStates) -> bool:
+        return any(position == len(self.patterns[index]) for index, position in states)
+
+
+@dataclass(frozen=True, slots=True)
+class FolderState:
+    """Where a folder stands with respect to the folder rules."""
+
+    included: bool  # bookmarks directly inside pass the folder rules
+    _include: _GlobStates = _NO_STATES
+    _exclude: _GlobStates = _NO_STATES
+
+
+class BookmarkFilter:
+    """A compiled :class:`FilterSpec`.
+
+    Walkers call :meth:`enter` for every folder, starting from
+    :attr:`root_state`; ``None`` means the folder and everything below it is
+    excluded and need not be visited. :meth:`accepts` then decides each
+    bookmark from its URL and its folder's state.
+    """
+
+    def __init__(self, spec: FilterSpec) -> None:
+        self.spec = spec
+        self._include_folders = _FolderGlobs(spec.include_folders)
+        self._exclude_folders = _FolderGlobs(spec.exclude_folders)
+        self._include_domains = _DomainTrie(spec.include_domains)
+        self._exclude_domains = _DomainTrie(spec.exclude_domains)
+        self._include_urls = _combined_regex(spec.include_urls, "include URL")
+        self._exclude_urls = _combined_regex(spec.exclude_urls, "exclude URL")
+        self._exclude_schemes = frozenset(
+            scheme.strip().lower().rstrip(":") for scheme in spec.exclude_schemes
+        )
+        # URL authority -> domain verdict; bookmarks share hosts heavily
+        self._domain_verdicts: Dict[str, bool] = {}
+        self.root_state = FolderState(
+            not spec.include_folders, self._include_folders.start, self._exclude_folders.start
+        )
+
+    def enter(self, state: Optional[FolderState], name: str) -> Optional[FolderState]:
+        """The state of folder ``name`` inside a folder in ``state``, or ``None`` to prune it."""
+        if state is None:
+            return None
+        exclude = state._exclude
+        if exclude:
+            exclude = self._exclude_folders.step(exclude, name)
+            if self._exclude_folders.matched(exclude):
+                return None
+        if state.included:
+            # without live exclude globs every folder below shares this state
+            return state if exclude is state._exclude else FolderState(True, _NO_STATES, exclude)
+        include = self._include_folders.step(state._include, name)
+        if self._include_folders.matched(include):
+            return FolderState(True, _NO_STATES, exclude)
+        if not include:
+            return None  # no include glob can match anything below
+        return FolderState(False, include, exclude)
+
+    def enter_path(self, names: Iterable[str]) -> Optional[FolderState]:
+        """The state of the folder at ``names`` below the roots."""
+        state: Optional[FolderState] = self.root_state
+        for name in names:
+            state = self.enter(state, name)
+        return state
+
+    def _domain_allowed(self, host: str) -> bool:
+        if self._include_domains and not self._include_domains.matches(host):
+            return False
+        return not (self._exclude_domains and self._exclude_domains.matches(host))
+
+    def accepts(self, url: Optional[str], state: Optional[FolderState]) -> bool:
+        if state is None or not state.included or not url:
+            return False
+        if self._exclude_schemes and url.partition(":")[0].lower() in self._exclude_schemes:
+            return False
+        if self._include_domains or self._exclude_domains:
+            match = AUTHORITY.match(url)
+            authority = match.group(1) if match is not None else ""
+            verdict = self._domain_verdicts.get(authority)
+            if verdict is None:
+                verdict = self._domain_verdicts[authority] = self._domain_allowed(_host(authority))
+            if not verdict:
+                return False
+        if self._include_urls is not None and self._include_urls.search(url) is None:
+            return False
+        return self._exclude_urls is None or self._exclude_urls.search(url) is None
@@ -5,21 +5,28 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .config import AppConfig
-from .deleter import BookmarkDeleter
 from .exporter import BookmarkExporter, DuplicateStrategy, StructureMode
 from .model import BookmarkNode
-from .raw import RawBookmarkFile
+from .selection import SelectionModel
+from .session import BookmarkSession
+from .snapshots import (
+    RetentionPolicy,
+    is_finished,
+    latest_snapshot,
+    next_snapshot_path,
+    prune_snapshots,
+    unfinished_snapshot,
+)
 from .theme import THEMES, apply_theme
-from .tree import BookmarkTreeBuilder
+from .tree import folder_hash
 
 
 @dataclass
@@ -28,6 +35,10 @@ class ExportContext:
     nodes: list
     base_output: Path
     timestamp_suffix: str
+    session: BookmarkSession
+    resume: bool = False
+    link_dest: Optional[Path] = None  # earlier export whose unchanged shortcuts are hard-linked
+    snapshot: Optional[Path] = None  # the snapshot folder written, when hard-linking is on
 
 
 class BookmarkExporterGUI(tk.Tk):
@@ -51,19 +62,24 @@ class BookmarkExporterGUI(tk.Tk):
 
         self.bookmarks_var = tk.StringVar(value=bookmarks_path)
         self.output_var = tk.StringVar(value=output_path)
+        self.mirror_var = tk.StringVar(value=self._config.mirror_paths)
+        self.snapshot_var = tk.BooleanVar(value=self._config.snapshot_links)
+        self.keep_snapshots_var = tk.IntVar(value=self._config.keep_snapshots)
         self.include_full_path_var = tk.BooleanVar(value=False)
         self.duplicate_strategy_var = tk.StringVar(value=DuplicateStrategy.UNIQUE.value)
         self.structure_mode_var = tk.StringVar(value=StructureMode.PRESERVE.label)
         self.export_shortcuts_var = tk.BooleanVar(value=True)
         self.export_html_var = tk.BooleanVar(value=True)
+        self.split_html_var = tk.BooleanVar(value=False)
         self.export_text_var = tk.BooleanVar(value=True)
         self.delete_after_export_var = tk.BooleanVar(value=True)
+        self.record_undo_var = tk.BooleanVar(value=True)
         self.backup_before_delete_var = tk.BooleanVar(value=False)
         self.status_var = tk.StringVar(value="Select your Bookmarks file and destination.")
 
+        self._session: Optional[BookmarkSession] = None
         self._tree_roots: List[BookmarkNode] = []
-        self._folder_selection: Dict[str, bool] = {}
-        self._node_lookup: Dict[str, BookmarkNode] = {}
+        self._selection = SelectionModel()
         self._node_to_item: Dict[str, str] = {}
         self._item_to_node: Dict[str, str] = {}
         self._checkbox_images: Dict[str, tk.PhotoImage] = {}
@@ -128,12 +144,19 @@ class BookmarkExporterGUI(tk.Tk):
         )
         self._delete_warning_label.grid(column=1, row=0, sticky="w")
 
+        self._undo_checkbox = ttk.Checkbutton(
+            delete_toggle_frame,
+            text="Record deleted bookmarks for undo",
+            variable=self.record_undo_var,
+        )
+        self._undo_checkbox.grid(column=0, row=1, sticky="w", padx=(20, 0))
+
         self._backup_checkbox = ttk.Checkbutton(
             delete_toggle_frame,
             text="Back up Bookmarks file before deletion",
             variable=self.backup_before_delete_var,
         )
-        self._backup_checkbox.grid(column=0, row=1, sticky="w", padx=(20, 0))
+        self._backup_checkbox.grid(column=0, row=2, sticky="w", padx=(20, 0))
 
         ttk.Label(options_frame, text="Duplicate handling:").grid(column=0, row=2, sticky="w", pady=(10, 0))
         duplicate_combo = ttk.Combobox(
@@ -164,12 +187,42 @@ class BookmarkExporterGUI(tk.Tk):
         ttk.Checkbutton(
             export_frame, text="Export Shortcuts", variable=self.export_shortcuts_var
         ).grid(column=0, row=0, sticky="w", padx=5, pady=2)
+        mirror_frame = ttk.Frame(export_frame)
+        mirror_frame.grid(column=1, row=0, sticky="w", padx=5, pady=2)
+        ttk.Label(mirror_frame, text="Also write to:").grid(column=0, row=0, sticky="w")
+        ttk.Entry(mirror_frame, textvariable=self.mirror_var, width=28).grid(
+            column=1, row=0, sticky="w", padx=(5, 0)
+        )
+        ttk.Button(mirror_frame, text="Add…", command=self._add_mirror).grid(
+            column=2, row=0, padx=(5, 0)
+        )
         ttk.Checkbutton(
             export_frame, text="Export as HTML", variable=self.export_html_var
         ).grid(column=0, row=1, sticky="w", padx=5, pady=2)
+        ttk.Checkbutton(
+            export_frame, text="Split into one page per folder", variable=self.split_html_var
+        ).grid(column=1, row=1, sticky="w", padx=5, pady=2)
         ttk.Checkbutton(
             export_frame, text="Export as text document", variable=self.export_text_var
         ).grid(column=0, row=2, sticky="w", padx=5, pady=2)
+        ttk.Checkbutton(
+            export_frame,
+            text="Hard-link unchanged shortcuts to the previous export",
+            variable=self.snapshot_var,
+            command=self._save_config,
+        ).grid(column=0, row=3, sticky="w", padx=5, pady=2)
+        keep_frame = ttk.Frame(export_frame)
+        keep_frame.grid(column=1, row=3, sticky="w", padx=5, pady=2)
+        ttk.Label(keep_frame, text="Keep last").grid(column=0, row=0, sticky="w")
+        ttk.Spinbox(
+            keep_frame,
+            from_=0,
+            to=999,
+            width=5,
+            textvariable=self.keep_snapshots_var,
+            command=self._save_config,
+        ).grid(column=1, row=0, padx=(5, 5))
+        ttk.Label(keep_frame, text="exports (0 keeps all)").grid(column=2, row=0, sticky="w")
 
         bottom_frame = ttk.Frame(frame)
         bottom_frame.grid(column=0, row=9, columnspan=2, sticky="we", **padding)
@@ -178,12 +231,15 @@ class BookmarkExporterGUI(tk.Tk):
         ttk.Button(bottom_frame, text="Export", command=self._export_selected).grid(
             column=0, row=0, sticky="we"
         )
+        ttk.Button(bottom_frame, text="Preview", command=self._preview_export).grid(
+            column=1, row=0, sticky="e", padx=(8, 0)
+        )
 
         theme_label = "☀ Light" if self._current_theme == "dark" else "🌙 Dark"
         self._theme_button = ttk.Button(
             bottom_frame, text=theme_label, command=self._toggle_theme, width=9
         )
-        self._theme_button.grid(column=1, row=0, sticky="e", padx=(8, 0))
+        self._theme_button.grid(column=2, row=0, sticky="e", padx=(8, 0))
 
         self.status_text = tk.Text(frame, height=4, wrap="word", state="disabled",
                                     relief="sunken", borderwidth=1,
@@ -269,19 +325,14 @@ class BookmarkExporterGUI(tk.Tk):
         self.folder_tree.delete(*self.folder_tree.get_children())
         self.folder_tree.insert("", "end", text=message, tags=("placeholder",))
         self._tree_roots = []
-        self._node_lookup.clear()
         self._node_to_item.clear()
         self._item_to_node.clear()
 
     def _select_all_folders(self) -> None:
-        for node_id in self._folder_selection:
-            self._folder_selection[node_id] = True
-        self._refresh_checkbox_icons()
+        self._update_checkbox_icons(self._selection.set_all(True))
 
     def _deselect_all_folders(self) -> None:
-        for node_id in self._folder_selection:
-            self._folder_selection[node_id] = False
-        self._refresh_checkbox_icons()
+        self._update_checkbox_icons(self._selection.set_all(False))
 
     def _on_tree_click(self, event):  # pragma: no cover - GUI-only
         if not self.folder_tree:
@@ -297,53 +348,21 @@ class BookmarkExporterGUI(tk.Tk):
         node_id = self._item_to_node.get(item_id)
         if not node_id:
             return
-        new_value = not self._folder_selection.get(node_id, False)
-        self._apply_folder_state(node_id, new_value)
-        self._refresh_checkbox_icons()
+        # Only the toggled subtree and its ancestors can change icon.
+        self._update_checkbox_icons(self._selection.toggle(node_id))
         return "break"
 
-    def _apply_folder_state(self, node_id: str, value: bool) -> None:
-        node = self._node_lookup.get(node_id)
-        if node is None:
-            return
-        self._folder_selection[node_id] = value
-        for child in node.children:
-            if child.is_folder:
-                self._apply_folder_state(child.id, value)
-
     def _refresh_checkbox_icons(self) -> None:
-        for node in self._tree_roots:
-            if node.is_folder:
-                self._update_branch_icon(node)
+        self._update_checkbox_icons(self._selection.ids())
 
-    def _update_branch_icon(self, node: BookmarkNode) -> str:
-        child_states: List[str] = []
-        for child in node.children:
-            if child.is_folder:
-                child_states.append(self._update_branch_icon(child))
-        current_state = "checked" if self._folder_selection.get(node.id, False) else "unchecked"
-        if child_states:
-            if all(state == "checked" for state in child_states) and current_state == "checked":
-                display = "checked"
-            elif all(state == "unchecked" for state in child_states) and current_state == "unchecked":
-                display = "unchecked"
-            else:
-                display = "mixed"
-        else:
-            display = current_state
-        item_id = self._node_to_item.get(node.id)
-        if item_id and self.folder_tree is not None:
-            image = self._checkbox_images.get(display)
-            if image is not None:
+    def _update_checkbox_icons(self, folder_ids: Iterable[str]) -> None:
+        if self.folder_tree is None:
+            return
+        for folder_id in folder_ids:
+            item_id = self._node_to_item.get(folder_id)
+            image = self._checkbox_images.get(self._selection.state(folder_id).value)
+            if item_id and image is not None:
                 self.folder_tree.item(item_id, image=image)
-        return display
-
-    def _iter_folder_nodes(self, nodes: Iterable[BookmarkNode]) -> Iterable[BookmarkNode]:
-        for node in nodes:
-            if not node.is_folder:
-                continue
-            yield node
-            yield from self._iter_folder_nodes(node.children)
 
     def _load_folder_tree(self, initial: bool = False, *, silent: bool = False) -> None:
         if not self.folder_tree:
@@ -358,23 +377,51 @@ class BookmarkExporterGUI(tk.Tk):
                 )
             return
         try:
-            raw = RawBookmarkFile.load(bookmarks_path)
-            tree = BookmarkTreeBuilder(raw)
-            nodes = tree.build()
+            nodes = self._open_session(bookmarks_path).nodes
         except Exception as exc:  # pragma: no cover - GUI-only
             self._show_tree_placeholder("Unable to load folders from the selected file.")
             if not (initial or silent):
                 messagebox.showerror("Failed to load bookmarks", str(exc))
             return
 
+        previous_roots = self._tree_roots
         self._tree_roots = nodes
-        lookup = {node.id: node for node in self._iter_folder_nodes(nodes)}
-        self._node_lookup = lookup
-        new_selection: Dict[str, bool] = {}
-        for node_id in lookup:
-            new_selection[node_id] = self._folder_selection.get(node_id, False)
-        self._folder_selection = new_selection
-        self._populate_folder_tree(nodes)
+        # Folders that survive the reload keep their checked state.
+        self._selection = SelectionModel(nodes, selected=self._selection.selected())
+        unchanged = (
+            len(self._selection) > 0
+            and self._node_to_item.keys() == set(self._selection.ids())
+            and [folder_hash(node) for node in previous_roots] == [folder_hash(node) for node in nodes]
+        )
+        if not unchanged:
+            # Rebuilding the Treeview is the slow part; skip it when nothing moved.
+            self._populate_folder_tree(nodes)
+
+    def _open_session(self, bookmarks_path: Path) -> BookmarkSession:
+        """The current session, re-parsed only if the path or the file changed."""
+        session = self._session
+        if session is None or session.path != bookmarks_path or session.is_stale():
+            session = BookmarkSession(bookmarks_path)
+            self._session = session
+        return session
+
+    def _remove_deleted_folders(self, session: BookmarkSession, removed_ids: set) -> None:
+        """Drop deleted folders from the Treeview without rebuilding it."""
+        if self.folder_tree is None or self._tree_roots is not session.nodes:
+            self._load_folder_tree(silent=True)
+            return
+        for node_id in removed_ids:
+            item_id = self._node_to_item.pop(node_id, None)
+            if item_id is None:
+                continue
+            self._item_to_node.pop(item_id, None)
+            if self.folder_tree.exists(item_id):
+                self.folder_tree.delete(item_id)
+        self._selection = SelectionModel(session.nodes, selected=self._selection.selected())
+        if self._node_to_item:
+            self._refresh_checkbox_icons()
+        else:
+            self._show_tree_placeholder("No folders found in the selected file.")
 
     def _populate_folder_tree(self, nodes: List[BookmarkNode]) -> None:
         if not self.folder_tree:
@@ -414,8 +461,8 @@ class BookmarkExporterGUI(tk.Tk):
         return filtered
 
     def _clone_node(self, node: BookmarkNode) -> Optional[BookmarkNode]:
-        folder_selected = not node.is_folder or self._folder_selection.get(node.id, False)
-        clone = BookmarkNode(id=node.id, name=node.name, type=node.type, url=node.url)
+        folder_selected = not node.is_folder or self._selection.is_checked(node.id)
+        clone = self._copy_node(node)
         for child in node.children:
             if child.is_folder:
                 child_clone = self._clone_node(child)
@@ -423,37 +470,57 @@ class BookmarkExporterGUI(tk.Tk):
                     clone.add_child(child_clone)
             elif folder_selected:
                 # Only include direct bookmarks when the folder itself is selected
-                bookmark = BookmarkNode(
-                    id=child.id,
-                    name=child.name,
-                    type=child.type,
-                    url=child.url,
-                )
-                clone.add_child(bookmark)
+                clone.add_child(self._copy_node(child))
         # Include this folder if it's selected, or if it has any surviving children
         # (i.e., a descendant folder was selected even though this one wasn't)
         if not folder_selected and not clone.children:
             return None
         return clone
 
-    def _collect_url_ids(self, nodes: List[BookmarkNode]) -> set:
-        """Collect the IDs of all URL bookmarks in the filtered node tree."""
-        ids: set = set()
-        for node in nodes:
+    @staticmethod
+    def _copy_node(node: BookmarkNode) -> BookmarkNode:
+        """``node`` without its children; dates are kept so date filters still apply.
+
+        A folder's ``latest_added`` is left unknown, since the copy may hold
+        fewer bookmarks than the original.
+        """
+        return BookmarkNode(
+            id=node.id,
+            name=node.name,
+            type=node.type,
+            url=node.url,
+            guid=node.guid,
+            date_added=node.date_added,
+            date_modified=node.date_modified,
+            date_last_used=node.date_last_used,
+        )
+
+    def _collect_url_paths(self, nodes: List[BookmarkNode]) -> Dict[str, Tuple[str, ...]]:
+        """Map the IDs of all URL bookmarks in the filtered node tree to their folder IDs.
+
+        The folder IDs run from the root down, letting the deleter go straight
+        to each bookmark's folder instead of searching the file.
+        """
+        paths: Dict[str, Tuple[str, ...]] = {}
+        stack = [(node, ()) for node in nodes]
+        while stack:
+            node, ancestors = stack.pop()
             if not node.is_folder:
-                ids.add(node.id)
-            for desc in node.iter_descendants():
-                if not desc.is_folder:
-                    ids.add(desc.id)
-        return ids
+                paths[node.id] = ancestors
+                continue
+            below = ancestors + (node.id,)
+            stack.extend((child, below) for child in node.children)
+        return paths
 
     def _update_delete_warning(self) -> None:
-        """Show or hide the Brave warning label and backup option based on toggle state."""
+        """Show or hide the Brave warning label and undo/backup options based on toggle state."""
         if self.delete_after_export_var.get():
             self._delete_warning_label.grid()
+            self._undo_checkbox.grid()
             self._backup_checkbox.grid()
         else:
             self._delete_warning_label.grid_remove()
+            self._undo_checkbox.grid_remove()
             self._backup_checkbox.grid_remove()
 
     def _is_brave_running(self) -> bool:
@@ -493,10 +560,29 @@ class BookmarkExporterGUI(tk.Tk):
             self.output_var.set(path)
             self._save_config()
 
+    def _add_mirror(self) -> None:
+        path = filedialog.askdirectory(title="Select a folder to mirror shortcuts into")
+        if path:
+            self.mirror_var.set(";".join(str(root) for root in self._mirror_paths() + [Path(path)]))
+            self._save_config()
+
+    def _mirror_paths(self) -> List[Path]:
+        parts = (part.strip() for part in self.mirror_var.get().split(";"))
+        return [Path(part).expanduser() for part in parts if part]
+
+    def _keep_snapshots(self) -> int:
+        try:
+            return max(0, self.keep_snapshots_var.get())
+        except tk.TclError:  # the spinbox holds something that is not a number
+            return 0
+
     def _save_config(self) -> None:
         """Persist the current paths and theme to the config file."""
         self._config.bookmarks_path = self.bookmarks_var.get()
         self._config.output_path = self.output_var.get()
+        self._config.mirror_paths = self.mirror_var.get()
+        self._config.snapshot_links = self.snapshot_var.get()
+        self._config.keep_snapshots = self._keep_snapshots()
         self._config.theme = self._current_theme
         self._config.save()
 
@@ -521,10 +607,9 @@ class BookmarkExporterGUI(tk.Tk):
         if self.folder_tree is not None:
             self.folder_tree.tag_configure("placeholder", foreground=colors.status_fg)
 
-        # Regenerate checkbox images for the new theme and reload tree
+        # Regenerate checkbox images for the new theme; the folders stay as they are
         self._create_checkbox_images()
-        if self._tree_roots:
-            self._load_folder_tree(silent=True)
+        self._refresh_checkbox_icons()
 
         self._save_config()
 
@@ -550,69 +635,131 @@ class BookmarkExporterGUI(tk.Tk):
             )
             return
 
-        context = self._prepare_export_context(create_destination=do_shortcuts)
+        resume_folder = None
+        if do_shortcuts:
+            unfinished = unfinished_snapshot(Path(self.output_var.get()).expanduser())
+            if unfinished is not None:
+                answer = messagebox.askyesnocancel(
+                    "Resume export",
+                    f"The export into {unfinished.name} did not finish.\n\n"
+                    "Resume it? Choose No to start a new export folder.",
+                )
+                if answer is None:
+                    return
+                if answer:
+                    resume_folder = unfinished
+
+        context = self._prepare_export_context(
+            create_destination=do_shortcuts, resume_folder=resume_folder
+        )
         if context is None:
             return
 
         exporter = context.exporter
         nodes = context.nodes
         messages: List[str] = []
-        errors: List[str] = []
-
-        def run_shortcuts():
-            result = exporter.export(nodes)
-            return f"Created {len(result.created_files)} shortcuts; skipped {len(result.skipped)}"
-
-        def run_html():
-            html_path = context.base_output / f"{context.timestamp_suffix}_Bookmarks.html"
-            count = exporter.export_html(nodes, html_path)
-            return f"Exported {count} bookmarks to {html_path.name}"
+        html_path = context.base_output / f"{context.timestamp_suffix}_Bookmarks.html"
+        split_html = do_html and self.split_html_var.get()
+        html_dir = context.base_output / f"{context.timestamp_suffix}_Bookmarks_html"
+        text_path = context.base_output / f"{context.timestamp_suffix}_Bookmarks.txt"
 
-        def run_text():
-            text_path = context.base_output / f"{context.timestamp_suffix}_Bookmarks.txt"
-            count = exporter.export_text(nodes, text_path)
-            return f"Exported {count} bookmarks to {text_path.name}"
+        try:
+            # One traversal of the selected tree feeds every chosen format.
+            result = exporter.export_formats(
+                nodes,
+                shortcuts=do_shortcuts,
+                html_file=html_path if do_html and not split_html else None,
+                html_shard_dir=html_dir if split_html else None,
+                text_file=text_path if do_text else None,
+                resume=context.resume,
+            )
+        except Exception as exc:
+            messagebox.showerror("Export failed", str(exc))
+            self._set_status_text("Export failed. See error message above.")
+            return
 
-        tasks = []
-        if do_shortcuts:
-            tasks.append(("Shortcuts", run_shortcuts))
-        if do_html:
-            tasks.append(("HTML", run_html))
-        if do_text:
-            tasks.append(("Text", run_text))
-
-        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
-            futures = {pool.submit(fn): label for label, fn in tasks}
-            for future in as_completed(futures):
-                label = futures[future]
+        if result.shortcuts is not None:
+            messages.append(
+                f"Created {result.shortcuts.created_count} shortcuts; "
+                f"skipped {result.shortcuts.skipped_count}"
+            )
+            for mirror in result.shortcuts.mirrors:
+                if mirror.error is None:
+                    messages.append(f"Mirrored {mirror.created_count} shortcuts to {mirror.root}")
+                else:
+                    messages.append(f"Mirror {mirror.root} failed: {mirror.error}")
+            if context.link_dest is not None:
+                messages.append(
+                    f"Hard-linked {result.shortcuts.linked_count} unchanged shortcuts to "
+                    f"{context.link_dest.name}"
+                )
+            keep = self._keep_snapshots()
+            # an unfinished snapshot (a mirror failed) must not push out older ones
+            if context.snapshot is not None and keep and is_finished(context.snapshot):
+                policy = RetentionPolicy(keep_last=keep)
                 try:
-                    messages.append(future.result())
-                except Exception as exc:
-                    errors.append(f"{label}: {exc}")
+                    removed = [
+                        snapshot
+                        for base in [context.base_output, *self._mirror_paths()]
+                        for snapshot in prune_snapshots(base, policy)
+                    ]
+                except OSError as exc:
+                    messages.append(f"Removing old exports failed: {exc}")
+                else:
+                    if removed:
+                        messages.append(f"Removed {len(removed)} old exports")
+        if result.html_count is not None:
+            messages.append(f"Exported {result.html_count} bookmarks to {html_path.name}")
+        if result.html_shards is not None:
+            messages.append(
+                f"Exported {result.html_shards.bookmark_count} bookmarks to "
+                f"{len(result.html_shards.pages)} pages; open {html_dir.name}/index.html"
+            )
+        if result.text_count is not None:
+            messages.append(f"Exported {result.text_count} bookmarks to {text_path.name}")
 
-        if errors:
+        if result.errors:
+            errors = [f"{label}: {error}" for label, error in result.errors.items()]
             messagebox.showerror("Export failed", "\n".join(errors))
-            self._set_status_text("Export failed. See error message above.")
+            messages.append("Export failed. See error message above.")
+            self._set_status_text("\n".join(messages))
             return
 
         # Delete exported bookmarks from Brave if requested
         if self.delete_after_export_var.get():
             try:
-                exported_ids = self._collect_url_ids(nodes)
-                bookmarks_path = Path(self.bookmarks_var.get()).expanduser()
-                raw = RawBookmarkFile.load(bookmarks_path)
+                # The session parsed for the export is reused; nothing is re-read.
+                session = context.session
+                paths = self._collect_url_paths(nodes)
                 if self.backup_before_delete_var.get():
-                    raw.backup()
-                deleter = BookmarkDeleter(raw)
-                removed = deleter.delete(exported_ids)
-                raw.save()
-                messages.append(f"Deleted {removed} bookmarks from Brave")
-                self._load_folder_tree(silent=True)
+                    session.raw.backup()
+                deleted = session.delete(
+                    set(paths), record_undo=self.record_undo_var.get(), ancestors=paths
+                )
+                messages.append(f"Deleted {deleted.removed} bookmarks from Brave")
+                if self.record_undo_var.get() and deleted.removed:
+                    messages.append(
+                        "Undo with: python -m bookmarks_to_shortcuts.cli undo "
+                        f"\"{session.path}\""
+                    )
+                self._remove_deleted_folders(session, deleted.removed_ids)
             except Exception as exc:
                 messages.append(f"Delete failed: {exc}")
 
         self._set_status_text("\n".join(messages))
 
+    def _preview_export(self) -> None:
+        """Show the shortcut export plan without writing anything."""
+        context = self._prepare_export_context(create_destination=False, preview=True)
+        if context is None:
+            return
+        try:
+            plan = context.exporter.plan(context.nodes)
+        except Exception as exc:  # pragma: no cover - GUI-only
+            messagebox.showerror("Preview failed", str(exc))
+            return
+        self._set_status_text(plan.describe())
+
     def _export(self) -> None:
         context = self._prepare_export_context(create_destination=True)
         if context is None:
@@ -627,7 +774,7 @@ class BookmarkExporterGUI(tk.Tk):
             self.status_var.set("Export failed. See error message above.")
             return
 
-        message = f"Created {len(result.created_files)} shortcuts; skipped {len(result.skipped)}"
+        message = f"Created {result.created_count} shortcuts; skipped {result.skipped_count}"
         self.status_var.set(message)
 
     def _export_html(self) -> None:
@@ -666,14 +813,19 @@ class BookmarkExporterGUI(tk.Tk):
         message = f"Exported {count} bookmarks to {text_path.name}"
         self.status_var.set(message)
 
-    def _prepare_export_context(self, create_destination: bool):
+    def _prepare_export_context(
+        self,
+        create_destination: bool,
+        resume_folder: Optional[Path] = None,
+        preview: bool = False,
+    ):
         bookmarks_path = Path(self.bookmarks_var.get()).expanduser()
         output_path = Path(self.output_var.get()).expanduser()
 
         if not bookmarks_path.exists():
             messagebox.showerror("Invalid path", "Please select a valid Brave Bookmarks file.")
             return None
-        if not output_path.exists():
+        if not output_path.exists() and not preview:
             try:
                 output_path.mkdir(parents=True, exist_ok=True)
             except OSError as exc:
@@ -681,15 +833,13 @@ class BookmarkExporterGUI(tk.Tk):
                 return None
 
         try:
-            raw = RawBookmarkFile.load(bookmarks_path)
-            tree = BookmarkTreeBuilder(raw)
-            nodes = tree.build()
+            session = self._open_session(bookmarks_path)
         except Exception as exc:  # pragma: no cover - GUI-only
             messagebox.showerror("Export failed", str(exc))
             self.status_var.set("Export failed. See error message above.")
             return None
 
-        filtered_nodes = self._filter_nodes_for_export(nodes)
+        filtered_nodes = self._filter_nodes_for_export(session.nodes)
         if not filtered_nodes:
             messagebox.showwarning(
                 "No folders selected",
@@ -698,7 +848,12 @@ class BookmarkExporterGUI(tk.Tk):
             return None
 
         try:
-            if create_destination:
+            if resume_folder is not None:
+                destination = resume_folder
+                timestamp_suffix = self._destination_label(resume_folder)
+            elif preview:
+                destination, timestamp_suffix = self._next_destination_folder(output_path)
+            elif create_destination:
                 destination, timestamp_suffix = self._create_destination_folder(output_path)
             else:
                 destination = output_path
@@ -707,17 +862,36 @@ class BookmarkExporterGUI(tk.Tk):
             messagebox.showerror("Invalid destination", str(exc))
             return None
 
+        snapshot = link_dest = None
+        # each mirror gets a folder named like the timestamped destination
+        mirror_roots = [root / destination.name for root in self._mirror_paths()]
+        mirror_link_dests = {}
+        if self.snapshot_var.get() and (create_destination or resume_folder is not None):
+            snapshot = destination
+            link_dest = latest_snapshot(output_path, exclude=destination)
+            for root in mirror_roots:
+                mirror_link_dests[root] = latest_snapshot(root.parent, exclude=root)
+
         exporter = BookmarkExporter(
             output_root=destination,
             include_full_path=self.include_full_path_var.get(),
             duplicate_strategy=DuplicateStrategy(self.duplicate_strategy_var.get()),
             structure_mode=StructureMode.from_label(self.structure_mode_var.get()),
+            journal=True,
+            track_paths=False,
+            mirror_roots=mirror_roots,
+            link_dest=link_dest,
+            mirror_link_dests={root: dest for root, dest in mirror_link_dests.items() if dest},
         )
         return ExportContext(
             exporter=exporter,
             nodes=filtered_nodes,
             base_output=output_path,
             timestamp_suffix=timestamp_suffix,
+            session=session,
+            resume=resume_folder is not None,
+            link_dest=link_dest,
+            snapshot=snapshot,
         )
 
     def _create_destination_folder(self, base_path: Path) -> tuple[Path, str]:
@@ -735,26 +909,19 @@ class BookmarkExporterGUI(tk.Tk):
         counter = 2
         while any(
             (base_path / f"{suffix}_Bookmarks{extension}").exists()
-            for extension in (".html", ".txt")
+            for extension in (".html", ".txt", "_html")
         ):
             suffix = f"{timestamp}_{counter}"
             counter += 1
         return suffix
 
     def _next_destination_folder(self, base_path: Path) -> tuple[Path, str]:
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M")
-        base_name = f"{timestamp}_Bookmarks"
-        candidate = base_path / base_name
-        suffix = 2
-        while candidate.exists():
-            candidate = base_path / f"{base_name}_{suffix}"
-            suffix += 1
-        label = (
-            candidate.name.replace("_Bookmarks", "", 1)
-            if "_Bookmarks" in candidate.name
-            else candidate.name
-        )
-        return candidate, label
+        candidate = next_snapshot_path(base_path)
+        return candidate, self._destination_label(candidate)
+
+    @staticmethod
+    def _destination_label(folder: Path) -> str:
+        return folder.name.replace("_Bookmarks", "", 1) if "_Bookmarks" in folder.name else folder.name
 
 
 def hide_console_window() -> None:
@@ -0,0 +1,151 @@
+"""Rebuild a Brave Bookmarks file from an exported ``.url`` shortcut tree."""
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .model import BookmarkNode
+from .raw import RawBookmarkFile
+from .tree import BookmarkTreeSerializer
+
+# Top-level export folders that correspond to Brave's permanent roots.
+ROOT_FOLDER_NAMES = {
+    "bookmarks bar": "bookmark_bar",
+    "other bookmarks": "other",
+    "mobile bookmarks": "synced",
+}
+
+
+class ShortcutImporter:
+    """Scans an export folder in parallel and rebuilds the bookmark hierarchy.
+
+    Directories are listed with ``os.scandir`` on a thread pool, and shortcut
+    files are read and parsed in batches on the same pool, so a tree with
+    millions of files never waits on one file at a time.
+    """
+
+    def __init__(
+        self,
+        export_root: str | Path,
+        *,
+        workers: Optional[int] = None,
+        batch_size: int = 512,
+    ) -> None:
+        self.export_root = Path(export_root)
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self.batch_size = batch_size
+
+    def build(self) -> Dict[str, BookmarkNode]:
+        """Return ``{root key: folder}`` for the shortcuts found below ``export_root``."""
+        if not self.export_root.is_dir():
+            raise FileNotFoundError(f"Export folder not found: {self.export_root}")
+
+        subdirs: Dict[str, List[str]] = {}
+        shortcuts: Dict[str, List[Tuple[str, str]]] = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending: Set[Future] = {pool.submit(_scan_directory, str(self.export_root))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result[0] == "dir":
+                        _, directory, children, files = result
+                        subdirs[directory] = children
+                        shortcuts.setdefault(directory, [])
+                        for child in children:
+                            pending.add(pool.submit(_scan_directory, child))
+                        for start in range(0, len(files), self.batch_size):
+                            batch = files[start : start + self.batch_size]
+                            pending.add(pool.submit(_parse_batch, directory, batch))
+                    else:
+                        _, directory, parsed = result
+                        shortcuts.setdefault(directory, []).extend(parsed)
+
+        roots = {
+            key: BookmarkNode(id="", name=name, type="folder")
+            for key, name in BookmarkTreeSerializer.ROOT_NAMES.items()
+        }
+        top = str(self.export_root)
+        for child in sorted(subdirs[top], key=_name_key):
+            folder = self._build_folder(child, subdirs, shortcuts)
+            root_key = ROOT_FOLDER_NAMES.get(folder.name.casefold())
+            if root_key is None:
+                roots["bookmark_bar"].add_child(folder)
+                continue
+            # exported with "include root name": unwrap into the matching root
+            for grandchild in folder.children:
+                roots[root_key].add_child(grandchild)
+        for name, url in sorted(shortcuts[top], key=lambda item: item[0].casefold()):
+            roots["bookmark_bar"].add_child(BookmarkNode(id="", name=name, type="url", url=url))
+        return roots
+
+    def write(self, bookmarks_path: str | Path) -> RawBookmarkFile:
+        """Build the hierarchy and save it as a Bookmarks file with a valid checksum."""
+        roots = BookmarkTreeSerializer().serialize_roots(self.build())
+        raw = RawBookmarkFile.create(bookmarks_path, roots)
+        raw.save()
+        return raw
+
+    def _build_folder(
+        self,
+        directory: str,
+        subdirs: Dict[str, List[str]],
+        shortcuts: Dict[str, List[Tuple[str, str]]],
+    ) -> BookmarkNode:
+        folder = BookmarkNode(id="", name=os.path.basename(directory), type="folder")
+        for child in sorted(subdirs.get(directory, []), key=_name_key):
+            folder.add_child(self._build_folder(child, subdirs, shortcuts))
+        for name, url in sorted(shortcuts.get(directory, []), key=lambda item: item[0].casefold()):
+            folder.add_child(BookmarkNode(id="", name=name, type="url", url=url))
+        return folder
+
+
+def _name_key(path: str) -> str:
+    return os.path.basename(path).casefold()
+
+
+def _scan_directory(directory: str) -> Tuple[str, str, List[str], List[str]]:
+    children: List[str] = []
+    files: List[str] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue  # export journals and other hidden files
+            if entry.is_dir(follow_symlinks=False):
+                children.append(entry.path)
+            elif entry.name.lower().endswith(".url") and entry.is_file():
+                files.append(entry.path)
+    return "dir", directory, children, files
+
+
+def _parse_batch(directory: str, files: List[str]) -> Tuple[str, str, List[Tuple[str, str]]]:
+    parsed: List[Tuple[str, str]] = []
+    for path in files:
+        url = parse_shortcut(path)
+        if url is not None:
+            name = os.path.basename(path)[: -len(".url")]
+            parsed.append((name, url))
+    return "files", directory, parsed
+
+
+def parse_shortcut(path: str | Path) -> Optional[str]:
+    """Return the ``URL=`` value of an ``[InternetShortcut]`` file, if present."""
+    try:
+        with open(path, "rb") as fh:
+            data = fh.read()
+    except OSError:
+        return None
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1")
+    in_section = False
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("["):
+            in_section = line.lower() == "[internetshortcut]"
+        elif in_section and line[:4].upper() == "URL=":
+            return line[4:]
+    return None
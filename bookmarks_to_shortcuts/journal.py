@@ -0,0 +1,124 @@
+"""Append-only journal that makes shortcut exports resumable."""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+JOURNAL_NAME = ".bookmarks_export.journal"
+JOURNAL_VERSION = 1
+
+
+class ExportJournal:
+    """Records planned and completed shortcut writes in an export folder.
+
+    Every batch of shortcuts is journaled as a single ``plan`` line before any of
+    its files are written and as a single ``done`` line afterwards. A resumed
+    export replays the recorded target paths, so duplicate resolution produces
+    exactly the names an uninterrupted run would have chosen.
+    """
+
+    def __init__(
+        self, output_root: str | Path, options: Dict[str, Any], *, sync: bool = True
+    ) -> None:
+        self.output_root = Path(output_root)
+        self.path = self.output_root / JOURNAL_NAME
+        self.options = options
+        # without sync records are only flushed, surviving a crash but not power loss
+        self.sync = sync
+        # journal key -> final file name, or None when the entry was skipped
+        self.planned: Dict[str, Optional[str]] = {}
+        self.completed: Set[str] = set()
+        self._fh = None
+
+    @classmethod
+    def exists(cls, output_root: str | Path) -> bool:
+        return (Path(output_root) / JOURNAL_NAME).is_file()
+
+    def load(self) -> None:
+        """Read an existing journal so the export can skip finished work."""
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as fh:
+            lines = fh.read().splitlines()
+        for index, line in enumerate(lines):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                if index == len(lines) - 1:
+                    break  # torn final write from the interrupted run
+                raise ValueError(f"Corrupt export journal: {self.path}")
+            if "header" in record:
+                self._check_header(record["header"])
+            elif "plan" in record:
+                for key, name in record["plan"]:
+                    self.planned[key] = name
+            elif "done" in record:
+                self.completed.update(record["done"])
+
+    def _check_header(self, header: Dict[str, Any]) -> None:
+        if header.get("version") != JOURNAL_VERSION:
+            raise ValueError(f"Unsupported export journal version in {self.path}")
+        if header.get("options") != self.options:
+            raise ValueError(
+                f"Export journal {self.path} was written with different export options"
+            )
+
+    def reserved_paths(self) -> Iterable[str]:
+        """Relative paths claimed by planned entries that were not written yet."""
+        for key, name in self.planned.items():
+            if name is not None and key not in self.completed:
+                folder = self._key_folder(key)
+                yield f"{folder}/{name}" if folder else name
+
+    def target_for(self, key: str) -> Tuple[bool, Optional[str]]:
+        """Return ``(known, relative path)`` for an entry recorded by an earlier run."""
+        if key not in self.planned:
+            return False, None
+        name = self.planned[key]
+        if name is None:
+            return True, None
+        folder = self._key_folder(key)
+        return True, f"{folder}/{name}" if folder else name
+
+    def record_planned(self, entries: Iterable[Tuple[str, Optional[str]]]) -> None:
+        """Record ``(key, final file name)`` pairs before their files are written."""
+        plan = [[key, name] for key, name in entries]
+        if plan:
+            self._append({"plan": plan})
+
+    def record_completed(self, keys: Iterable[str]) -> None:
+        done = list(keys)
+        if done:
+            self._append({"done": done})
+
+    def finish(self) -> None:
+        """Close and remove the journal once every entry has been written."""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    @staticmethod
+    def _key_folder(key: str) -> str:
+        # keys look like "<bookmark id>:<relative folder>/<requested name>[#n]"
+        relpath = key.split(":", 1)[1]
+        return relpath.rpartition("/")[0]
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if self._fh is None:
+            new_file = not self.path.exists()
+            self.output_root.mkdir(parents=True, exist_ok=True)
+            self._fh = self.path.open("a", encoding="utf-8")
+            if new_file:
+                header = {"version": JOURNAL_VERSION, "options": self.options}
+                self._fh.write(json.dumps({"header": header}) + "\n")
+        self._fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._fh.flush()
+        if self.sync:
+            os.fsync(self._fh.fileno())
@@ -0,0 +1,319 @@
+"""Concurrent dead-link checking for bookmark URLs."""
+from __future__ import annotations
+
+import asyncio
+import http.client
+import itertools
+import socket
+import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import SplitResult, quote, urljoin, urlsplit
+
+from .codec import read_json, write_json
+
+DEFAULT_CACHE_PATH = Path.home() / ".bookmarks_to_shortcuts" / "link_cache.json"
+DEFAULT_TTL = 7 * 24 * 3600
+CACHE_VERSION = 1
+MAX_REDIRECTS = 5
+USER_AGENT = "Mozilla/5.0 (compatible; BookmarksToShortcuts link checker)"
+REQUEST_HEADERS = {"User-Agent": USER_AGENT, "Accept": "*/*"}
+
+# The resource exists, the server just will not hand it to a bot.
+ALIVE_ERROR_CODES = {401, 403, 429}
+# Servers that reject or mishandle HEAD get a second chance with GET.
+RETRY_WITH_GET_CODES = {400, 403, 404, 405, 501}
+
+
+class LinkStatus(str, Enum):
+    ALIVE = "alive"
+    DEAD = "dead"  # the server answered with an error status
+    UNREACHABLE = "unreachable"  # DNS, connection, TLS or timeout failure
+    SKIPPED = "skipped"  # not an http(s) URL
+
+
+@dataclass
+class LinkResult:
+    url: str
+    status: LinkStatus
+    code: Optional[int] = None
+    error: Optional[str] = None
+    checked_at: float = 0.0
+
+
+class LinkCache:
+    """Link results persisted as JSON and reused until they are ``ttl`` seconds old."""
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self._entries: Dict[str, list] = {}
+
+    def load(self) -> None:
+        try:
+            data = read_json(self.path)
+        except (OSError, ValueError):
+            return  # a missing or corrupt cache just means checking again
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self._entries = data.get("links", {})
+
+    def get(self, url: str, now: Optional[float] = None) -> Optional[LinkResult]:
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        status, code, error, checked_at = entry
+        if (now if now is not None else time.time()) - checked_at > self.ttl:
+            return None
+        return LinkResult(url, LinkStatus(status), code, error, checked_at)
+
+    def put(self, result: LinkResult) -> None:
+        if result.status is not LinkStatus.SKIPPED:
+            self._entries[result.url] = [result.status.value, result.code, result.error, result.checked_at]
+
+    def save(self) -> None:
+        now = time.time()
+        links = {url: entry for url, entry in self._entries.items() if now - entry[3] <= self.ttl}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(self.path, {"version": CACHE_VERSION, "links": links})
+
+
+@dataclass
+class _HostPool:
+    """Connections and limits for one ``(scheme, host, port)``."""
+
+    semaphore: asyncio.Semaphore
+    idle: List[http.client.HTTPConnection] = field(default_factory=list)
+    resolved: bool = False
+    resolve_error: Optional[str] = None
+    resolving: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class _ProbeError(Exception):
+    """A probe failed before the server produced a usable response."""
+
+
+class LinkChecker:
+    """Probes URLs with HEAD (falling back to GET) on a bounded asyncio worker pool.
+
+    Each host gets its own small pool of keep-alive connections and its own
+    concurrency limit, and its name is resolved only once, so checking many
+    URLs of the same site neither floods it nor pays for new connections.
+    Requests are made with :mod:`http.client` in worker threads; asyncio only
+    schedules them and enforces the limits and timeouts.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = 100,
+        per_host: int = 8,
+        timeout: float = 10.0,
+        cache: Optional[LinkCache] = None,
+        save_cache: bool = True,
+        verify_tls: bool = True,
+    ) -> None:
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.cache = cache
+        # with False the cache is only read, so a preview leaves nothing behind
+        self.save_cache = save_cache
+        self.verify_tls = verify_tls
+        self.cached_hits = 0
+        self._pools: Dict[Tuple[str, str, int], _HostPool] = {}
+        self._ssl: Optional[ssl.SSLContext] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def check(self, urls: Iterable[str]) -> Dict[str, LinkResult]:
+        """Synchronous wrapper around :meth:`check_urls`."""
+        return asyncio.run(self.check_urls(urls))
+
+    async def check_urls(self, urls: Iterable[str]) -> Dict[str, LinkResult]:
+        """Return a result per distinct URL, taking fresh ones from the cache."""
+        if self.cache is not None:
+            self.cache.load()
+        results: Dict[str, LinkResult] = {}
+        pending: List[str] = []
+        now = time.time()
+        for url in dict.fromkeys(urls):
+            cached = self.cache.get(url, now) if self.cache is not None else None
+            if cached is not None:
+                results[url] = cached
+                self.cached_hits += 1
+            else:
+                pending.append(url)
+
+        queue = _interleave_by_host(pending)
+
+        async def worker() -> None:
+            for url in queue:  # the shared iterator hands each URL to one worker
+                results[url] = await self._check_one(url)
+
+        workers = min(self.concurrency, len(pending))
+        self._executor = ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="linkcheck")
+        try:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        finally:
+            self._close_idle()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self.cache is not None and self.save_cache:
+            for url in pending:
+                self.cache.put(results[url])
+            self.cache.save()
+        return results
+
+    async def _check_one(self, url: str) -> LinkResult:
+        try:
+            result = await asyncio.wait_for(self._probe(url), self.timeout)
+        except asyncio.TimeoutError:
+            result = LinkResult(url, LinkStatus.UNREACHABLE, error="timed out")
+        except _ProbeError as exc:
+            result = LinkResult(url, LinkStatus.UNREACHABLE, error=str(exc))
+        except ValueError as exc:  # urlsplit rejects malformed URLs such as "http://[::1"
+            result = LinkResult(url, LinkStatus.UNREACHABLE, error=f"invalid URL: {exc}")
+        result.checked_at = time.time()
+        return result
+
+    async def _probe(self, url: str) -> LinkResult:
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(current)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                if current is url:
+                    return LinkResult(url, LinkStatus.SKIPPED)
+                return LinkResult(url, LinkStatus.ALIVE, error=f"redirects to {current}")
+            code, location = await self._request(parts, "HEAD")
+            if code in RETRY_WITH_GET_CODES:
+                code, location = await self._request(parts, "GET")
+            if 300 <= code < 400 and location:
+                current = urljoin(current, location)
+                continue
+            if code < 400 or code in ALIVE_ERROR_CODES:
+                return LinkResult(url, LinkStatus.ALIVE, code)
+            return LinkResult(url, LinkStatus.DEAD, code)
+        return LinkResult(url, LinkStatus.UNREACHABLE, error="too many redirects")
+
+    async def _request(self, parts: SplitResult, method: str) -> Tuple[int, Optional[str]]:
+        """Send one request; returns ``(status code, Location header)``."""
+        try:
+            host = parts.hostname.encode("idna").decode("ascii")  # type: ignore[union-attr]
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+        except (UnicodeError, ValueError) as exc:
+            raise _ProbeError(f"invalid URL: {exc}") from None
+        pool = self._pools.get((parts.scheme, host, port))
+        if pool is None:
+            pool = _HostPool(asyncio.Semaphore(self.per_host))
+            self._pools[(parts.scheme, host, port)] = pool
+        await self._resolve(pool, host, port)
+
+        target = _request_target(parts)
+        loop = asyncio.get_running_loop()
+        async with pool.semaphore:
+            # An idle keep-alive connection may have been closed by the server,
+            # so a failure on a reused connection is retried once on a new one.
+            for attempt in range(2):
+                connection = pool.idle.pop() if pool.idle and attempt == 0 else None
+                reused = connection is not None
+                if connection is None:
+                    connection = self._connection(parts.scheme, host, port)
+                try:
+                    code, location, keep_alive = await loop.run_in_executor(
+                        self._executor, _send, connection, method, target
+                    )
+                except (OSError, http.client.HTTPException) as exc:
+                    connection.close()
+                    if reused:
+                        continue
+                    raise _ProbeError(str(exc) or exc.__class__.__name__) from None
+                except BaseException:
+                    # a timeout cancelled us mid-request; closing the socket
+                    # also wakes the worker thread still blocked on it
+                    connection.close()
+                    raise
+                if keep_alive:
+                    pool.idle.append(connection)
+                else:
+                    connection.close()
+                return code, location
+        raise _ProbeError("connection closed")  # pragma: no cover - loop always returns
+
+    async def _resolve(self, pool: _HostPool, host: str, port: int) -> None:
+        """Look ``host`` up once, so every URL of an unknown host fails fast."""
+        async with pool.resolving:
+            if not pool.resolved:
+                pool.resolved = True
+                try:
+                    await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+                except OSError as exc:
+                    pool.resolve_error = f"cannot resolve {host}: {exc}"
+        if pool.resolve_error is not None:
+            raise _ProbeError(pool.resolve_error)
+
+    def _connection(self, scheme: str, host: str, port: int) -> http.client.HTTPConnection:
+        if scheme == "https":
+            return http.client.HTTPSConnection(
+                host, port, timeout=self.timeout, context=self._ssl_context()
+            )
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        if self._ssl is None:
+            self._ssl = ssl.create_default_context()
+            if not self.verify_tls:
+                self._ssl.check_hostname = False
+                self._ssl.verify_mode = ssl.CERT_NONE
+        return self._ssl
+
+    def _close_idle(self) -> None:
+        for pool in self._pools.values():
+            for connection in pool.idle:
+                connection.close()
+            pool.idle.clear()
+        self._pools.clear()
+
+
+def summarize(results: Iterable[LinkResult]) -> Dict[str, int]:
+    counts = {status.value: 0 for status in LinkStatus}
+    for result in results:
+        counts[result.status.value] += 1
+    return counts
+
+
+def _request_target(parts: SplitResult) -> str:
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+    # escape spaces and non-ASCII characters, keep existing escapes and delimiters
+    return quote(target, safe="/%?=&:@!$'()*+,;~-._[]")
+
+
+def _send(
+    connection: http.client.HTTPConnection, method: str, target: str
+) -> Tuple[int, Optional[str], bool]:
+    """Blocking, run in a worker thread: ``(status, Location, whether to keep the connection)``."""
+    connection.request(method, target, headers=REQUEST_HEADERS)
+    response = connection.getresponse()
+    location = response.getheader("Location")
+    if method != "HEAD":
+        response.close()  # the body of a GET fallback is never needed
+        return response.status, location, False
+    response.read()
+    return response.status, location, not response.will_close
+
+
+def _interleave_by_host(urls: List[str]) -> Iterator[str]:
+    """Round-robin over hosts so workers are not all queued on one busy site."""
+    by_host: Dict[str, List[str]] = {}
+    for url in urls:
+        try:
+            host = urlsplit(url).hostname or ""
+        except ValueError:
+            host = ""
+        by_host.setdefault(host, []).append(url)
+    for batch in itertools.zip_longest(*by_host.values()):
+        yield from (url for url in batch if url is not None)
@@ -0,0 +1,191 @@
+"""Merge several Bookmarks files into one deduplicated tree."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from .model import BookmarkNode
+from .raw import RawBookmarkFile
+from .tree import (
+    BookmarkTreeBuilder,
+    BookmarkTreeSerializer,
+    chrome_time,
+    raw_node_type,
+    update_folder_summary,
+)
+
+DEFAULT_PORTS = {"http": "80", "https": "443", "ws": "80", "wss": "443", "ftp": "21"}
+# scheme, authority and the rest of a "scheme://authority/..." URL
+_HIERARCHICAL_URL = re.compile(r"([A-Za-z][A-Za-z0-9+.\-]*)://([^/?#]*)(.*)", re.DOTALL)
+
+
+def normalize_url(url: str) -> str:
+    """The form bookmarks are deduplicated by.
+
+    Scheme and host are lower-cased, a default port is dropped and an empty
+    path becomes ``/``; path, query and fragment are kept as they are. Only
+    the start of the URL is looked at, so this costs one regex match.
+    """
+    url = url.strip()
+    match = _HIERARCHICAL_URL.match(url)
+    if match is None:
+        scheme, colon, rest = url.partition(":")
+        return scheme.lower() + colon + rest if colon else url
+    scheme, authority, rest = match.groups()
+    scheme = scheme.lower()
+    userinfo, at, host = authority.rpartition("@")
+    host = host.lower()
+    port = DEFAULT_PORTS.get(scheme)
+    if port is not None and host.endswith(":" + port):
+        host = host[: -len(port) - 1]
+    if not rest or rest[0] != "/":
+        rest = "/" + rest
+    return f"{scheme}://{userinfo}{at}{host}{rest}"
+
+
+@dataclass
+class MergeResult:
+    """Counts for a merge; ``duplicates`` were dropped in favour of an earlier copy."""
+
+    files: int = 0
+    folders: int = 0
+    bookmarks: int = 0
+    duplicates: int = 0
+
+    def describe(self) -> str:
+        return (
+            f"Merged {self.files} files: {self.bookmarks} bookmarks in {self.folders} folders; "
+            f"dropped {self.duplicates} duplicates"
+        )
+
+
+@dataclass(slots=True)
+class _MergedFolder:
+    """A merged folder plus hashed indexes of what it holds."""
+
+    node: BookmarkNode
+    folders: Dict[str, "_MergedFolder"] = field(default_factory=dict)  # casefolded name ->
+    urls: Dict[str, BookmarkNode] = field(default_factory=dict)  # normalized URL ->
+
+
+class BookmarkMerger:
+    """Unions Bookmarks files folder path by folder path.
+
+    Folders with the same path (names compared case-insensitively, as the
+    exported folders are on Windows) become one folder, and within each folder
+    a bookmark whose normalized URL is already there is dropped. Files added
+    first win: their names and order are kept, later files only append what
+    is new. Each node is visited once and every lookup is a dict probe, so a
+    merge is linear in the total size of the inputs.
+    """
+
+    def __init__(self) -> None:
+        self.result = MergeResult()
+        self._roots: Dict[str, _MergedFolder] = {}
+
+    def add(self, raw: RawBookmarkFile) -> None:
+        """Merge every root of ``raw`` into the tree."""
+        self.result.files += 1
+        for key, raw_root in raw.roots().items():
+            if not isinstance(raw_root, dict):
+                continue
+            target = self._roots.get(key)
+            if target is None:
+                target = self._roots[key] = _MergedFolder(self._folder_node(raw_root))
+            stack = [(raw_root, target)]
+            while stack:
+                raw_folder, target = stack.pop()
+                for child in raw_folder.get("children", ()):
+                    if raw_node_type(child) == "folder":
+                        stack.append((child, self._enter(target, child)))
+                    else:
+                        self._add_url(target, child)
+
+    def roots(self) -> Dict[str, BookmarkNode]:
+        """``{root key: folder}`` for :class:`BookmarkTreeSerializer`."""
+        return {key: merged.node for key, merged in self._roots.items()}
+
+    def nodes(self) -> List[BookmarkNode]:
+        """The merged roots in export order, ready for :class:`BookmarkExporter`.
+
+        Nodes get fresh ids in pre-order, and folder summaries (used to prune
+        date-filtered exports) are computed from the merged contents.
+        """
+        order = BookmarkTreeBuilder.ROOT_ORDER
+        keys = [key for key in order if key in self._roots]
+        keys += sorted(key for key in self._roots if key not in order)
+        roots = [self._roots[key].node for key in keys]
+        next_id = 1
+        folders: List[BookmarkNode] = []
+        stack = list(reversed(roots))
+        while stack:
+            node = stack.pop()
+            node.id = str(next_id)
+            next_id += 1
+            if node.is_folder:
+                folders.append(node)
+                stack.extend(reversed(node.children))
+        # pre-order reversed visits every child folder before its parent
+        for folder in reversed(folders):
+            update_folder_summary(folder)
+        return roots
+
+    def write(self, path: str | Path) -> RawBookmarkFile:
+        """Save the merged tree as a Bookmarks file with fresh ids, GUIDs and a valid checksum."""
+        raw = RawBookmarkFile.create(path, BookmarkTreeSerializer().serialize_roots(self.roots()))
+        raw.save()
+        return raw
+
+    def _folder_node(self, raw_folder: Dict) -> BookmarkNode:
+        return BookmarkNode(
+            id="",
+            name=raw_folder.get("name", ""),
+            type="folder",
+            date_added=chrome_time(raw_folder.get("date_added")),
+            date_modified=chrome_time(raw_folder.get("date_modified")),
+        )
+
+    def _enter(self, parent: _MergedFolder, raw_folder: Dict) -> _MergedFolder:
+        key = raw_folder.get("name", "").casefold()
+        merged = parent.folders.get(key)
+        if merged is None:
+            node = self._folder_node(raw_folder)
+            parent.node.add_child(node)
+            merged = parent.folders[key] = _MergedFolder(node)
+            self.result.folders += 1
+        return merged
+
+    def _add_url(self, parent: _MergedFolder, raw_node: Dict) -> None:
+        url = raw_node.get("url") or ""
+        key = normalize_url(url)
+        date_added = chrome_time(raw_node.get("date_added"))
+        date_last_used = chrome_time(raw_node.get("date_last_used"))
+        kept = parent.urls.get(key)
+        if kept is not None:
+            # the copy that stays remembers when the link was first saved and last used
+            if date_added and (not kept.date_added or date_added < kept.date_added):
+                kept.date_added = date_added
+            kept.date_last_used = max(kept.date_last_used, date_last_used)
+            self.result.duplicates += 1
+            return
+        node = BookmarkNode(
+            id="",
+            name=raw_node.get("name", ""),
+            type="url",
+            url=url,
+            date_added=date_added,
+            date_last_used=date_last_used,
+        )
+        parent.node.add_child(node)
+        parent.urls[key] = node
+        self.result.bookmarks += 1
+
+
+def merge_files(paths: Iterable[str | Path]) -> BookmarkMerger:
+    """Merge the Bookmarks files at ``paths``, in priority order."""
+    merger = BookmarkMerger()
+    for path in paths:
+        merger.add(RawBookmarkFile.load(path))
+    return merger
@@ -15,6 +15,17 @@ class BookmarkNode:
     url: Optional[str] = None
     children: List["BookmarkNode"] = field(default_factory=list)
     parent: Optional["BookmarkNode"] = field(default=None, repr=False)
+    guid: Optional[str] = None
+    # Chromium timestamps: microseconds since 1601-01-01 UTC, 0 when unknown
+    date_added: int = 0
+    date_modified: int = 0
+    date_last_used: int = 0
+    # folders: newest date_added of any bookmark below them, for pruning date filters;
+    # None until update_folder_summary() has run, and then nothing is pruned
+    latest_added: Optional[int] = None
+    # folders: digest of the name plus every name, URL and position below, cached by
+    # tree.folder_hash(); None until first asked for and after update_folder_summary()
+    content_hash: Optional[bytes] = field(default=None, repr=False)
 
     def add_child(self, child: "BookmarkNode") -> None:
         child.parent = self
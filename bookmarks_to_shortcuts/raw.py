@@ -1,13 +1,20 @@
 """Utilities for loading Brave bookmark files."""
 from __future__ import annotations
 
-import json
+import hashlib
+import os
 import shutil
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
+from .codec import read_json, write_json
+from .durability import Durability, fsync_directory
+
+# Roots covered by Chromium's checksum, in the order BookmarkCodec encodes them.
+CHECKSUM_ROOTS = ("bookmark_bar", "other", "synced")
+
 
 @dataclass
 class RawBookmarkFile:
@@ -19,13 +26,45 @@ class RawBookmarkFile:
     @classmethod
     def load(cls, path: str | Path) -> "RawBookmarkFile":
         json_path = Path(path)
-        with json_path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-        return cls(source_path=json_path, data=data)
+        return cls(source_path=json_path, data=read_json(json_path))
+
+    @classmethod
+    def create(cls, path: str | Path, roots: Dict[str, Any]) -> "RawBookmarkFile":
+        """Build a new bookmarks file around ``roots`` with a valid checksum."""
+        raw = cls(source_path=Path(path), data={"checksum": "", "roots": roots, "version": 1})
+        raw.update_checksum()
+        return raw
 
     def roots(self) -> Dict[str, Any]:
         return self.data.get("roots", {})
 
+    def compute_checksum(self) -> str:
+        """MD5 over id, UTF-16 title, type and URL of every node, in pre-order.
+
+        This mirrors Chromium's ``BookmarkCodec`` so Brave accepts the file
+        without flagging it for recovery.
+        """
+        md5 = hashlib.md5()
+        roots = self.roots()
+        for key in CHECKSUM_ROOTS:
+            if key not in roots:
+                continue
+            stack = [roots[key]]
+            while stack:
+                node = stack.pop()
+                md5.update(str(node.get("id", "")).encode("utf-8"))
+                md5.update(node.get("name", "").encode("utf-16-le"))
+                if node.get("type") == "url":
+                    md5.update(b"url")
+                    md5.update(node.get("url", "").encode("utf-8"))
+                else:
+                    md5.update(b"folder")
+                    stack.extend(reversed(node.get("children", [])))
+        return md5.hexdigest()
+
+    def update_checksum(self) -> None:
+        self.data["checksum"] = self.compute_checksum()
+
     def backup(self) -> Path:
         """Create a timestamped backup of the bookmarks file."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -33,8 +72,25 @@ class RawBookmarkFile:
         shutil.copy2(self.source_path, backup_path)
         return backup_path
 
-    def save(self) -> None:
-        """Write the current data back to the source file."""
-        with self.source_path.open("w", encoding="utf-8") as fh:
-            json.dump(self.data, fh, indent=3)
+    def save(self, durability: Durability = Durability.NONE) -> None:
+        """Write the current data back to the source file.
+
+        For a single file ``BATCHED`` and ``FULL`` are the same: the data is
+        written and fsynced to a temporary file next to the source, renamed
+        over it and the directory fsynced, so a crash leaves either the old
+        or the new file, never a truncated one.
+        """
+        if Durability(durability) is Durability.NONE:
+            write_json(self.source_path, self.data, indent=3)
+            return
+        temporary = self.source_path.with_name(f".{self.source_path.name}.tmp")
+        try:
+            write_json(temporary, self.data, indent=3, fsync=True)
+            if self.source_path.exists():
+                shutil.copymode(self.source_path, temporary)
+            os.replace(temporary, self.source_path)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+        fsync_directory(self.source_path.parent)
 
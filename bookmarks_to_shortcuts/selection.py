@@ -0,0 +1,107 @@
+"""Tri-state folder selection for the folder explorer, independent of Tk."""
+from __future__ import annotations
+
+from enum import Enum
+from typing import Dict, Iterable, List, Optional
+
+from .model import BookmarkNode
+
+
+class CheckState(str, Enum):
+    CHECKED = "checked"
+    UNCHECKED = "unchecked"
+    MIXED = "mixed"
+
+
+class SelectionModel:
+    """Checked flags for every folder plus per-subtree counts.
+
+    A folder shows as checked when it and every folder below it are checked,
+    unchecked when none are, and mixed otherwise. Keeping the number of
+    folders and of checked folders in each subtree means a toggle touches
+    only the toggled subtree and its ancestors, never the whole forest.
+    """
+
+    def __init__(self, roots: Iterable[BookmarkNode] = (), selected: Iterable[str] = ()) -> None:
+        self._parent: Dict[str, Optional[str]] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._checked: Dict[str, bool] = {}
+        self._size: Dict[str, int] = {}  # folders in the subtree, itself included
+        self._count: Dict[str, int] = {}  # checked folders in the subtree
+        selected = set(selected)
+        order: List[str] = []
+        stack = [(node, None) for node in roots if node.is_folder]
+        while stack:
+            node, parent_id = stack.pop()
+            self._parent[node.id] = parent_id
+            self._children[node.id] = [child.id for child in node.children if child.is_folder]
+            self._checked[node.id] = node.id in selected
+            order.append(node.id)
+            stack.extend((child, node.id) for child in node.children if child.is_folder)
+        for folder_id in reversed(order):  # children before their parents
+            children = self._children[folder_id]
+            self._size[folder_id] = 1 + sum(self._size[child] for child in children)
+            self._count[folder_id] = self._checked[folder_id] + sum(self._count[child] for child in children)
+
+    def __contains__(self, folder_id: object) -> bool:
+        return folder_id in self._checked
+
+    def __len__(self) -> int:
+        return len(self._checked)
+
+    def ids(self) -> List[str]:
+        return list(self._checked)
+
+    def is_checked(self, folder_id: str) -> bool:
+        return self._checked.get(folder_id, False)
+
+    def selected(self) -> List[str]:
+        return [folder_id for folder_id, checked in self._checked.items() if checked]
+
+    def state(self, folder_id: str) -> CheckState:
+        count = self._count[folder_id]
+        if count == 0:
+            return CheckState.UNCHECKED
+        if count == self._size[folder_id]:
+            return CheckState.CHECKED
+        return CheckState.MIXED
+
+    def toggle(self, folder_id: str) -> List[str]:
+        return self.set_checked(folder_id, not self.is_checked(folder_id))
+
+    def set_checked(self, folder_id: str, value: bool) -> List[str]:
+        """Check or uncheck a folder and everything below it.
+
+        Returns the ids of folders whose :meth:`state` changed, so only their
+        icons need repainting.
+        """
+        if folder_id not in self._checked:
+            return []
+        changed: List[str] = []
+        before = self._count[folder_id]
+        stack = [folder_id]
+        while stack:
+            current = stack.pop()
+            old_state = self.state(current)
+            self._checked[current] = value
+            self._count[current] = self._size[current] if value else 0
+            if self.state(current) is not old_state:
+                changed.append(current)
+            stack.extend(self._children[current])
+        delta = self._count[folder_id] - before
+        parent_id = self._parent[folder_id]
+        while parent_id is not None and delta:
+            old_state = self.state(parent_id)
+            self._count[parent_id] += delta
+            if self.state(parent_id) is not old_state:
+                changed.append(parent_id)
+            parent_id = self._parent[parent_id]
+        return changed
+
+    def set_all(self, value: bool) -> List[str]:
+        """Check or uncheck every folder; returns the ids whose state changed."""
+        changed: List[str] = []
+        for folder_id, parent_id in self._parent.items():
+            if parent_id is None:
+                changed.extend(self.set_checked(folder_id, value))
+        return changed
@@ -0,0 +1,449 @@
+"""Resident service that keeps parsed bookmark trees in memory between requests."""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .codec import get_codec
+from .durability import Durability
+from .exporter import HTML_SHARD_SIZE, BookmarkExporter, DuplicateStrategy, ExportResult, StructureMode
+from .filters import FilterSpec
+from .model import BookmarkNode
+from .raw import RawBookmarkFile
+from .tree import BookmarkTreeBuilder
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+    from .linkcheck import LinkResult
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# The service reads and writes any path a request names, so it only ever
+# listens on, and answers requests addressed to, the local machine.
+LOOPBACK_HOSTS = frozenset({"127.0.0.1", "localhost", "::1"})
+TOKEN_DIR = Path.home() / ".bookmarks_to_shortcuts"
+MAX_CACHED_TREES = 8
+
+
+@dataclass
+class _CachedTree:
+    fingerprint: Tuple[int, int]
+    nodes: List[BookmarkNode]
+    # (casefolded "name url", bookmark, folder path), built on first search
+    search_index: Optional[List[Tuple[str, BookmarkNode, Tuple[str, ...]]]] = field(default=None)
+
+
+class BookmarkService:
+    """Answers export, search and count requests from cached bookmark trees.
+
+    A tree is rebuilt only when the Bookmarks file's modification time or size
+    changes, so repeated requests against the same file skip parsing entirely.
+    """
+
+    def __init__(self, max_trees: int = MAX_CACHED_TREES) -> None:
+        # least recently used first; the oldest tree is dropped beyond max_trees
+        self._cache: Dict[Tuple[str, Tuple[str, ...]], _CachedTree] = {}
+        self.max_trees = max_trees
+        self._lock = threading.Lock()
+
+    def tree(self, bookmarks: str | Path, include_roots: Optional[List[str]] = None) -> List[BookmarkNode]:
+        return self._cached(bookmarks, include_roots).nodes
+
+    def _cached(self, bookmarks: str | Path, include_roots: Optional[List[str]]) -> _CachedTree:
+        path = Path(bookmarks).expanduser().resolve()
+        stat = path.stat()
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        key = (str(path), tuple(include_roots or ()))
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry is None or entry.fingerprint != fingerprint:
+                nodes = BookmarkTreeBuilder(RawBookmarkFile.load(path)).build(include_roots=include_roots)
+                entry = _CachedTree(fingerprint=fingerprint, nodes=nodes)
+            self._cache[key] = entry
+            while len(self._cache) > self.max_trees:
+                del self._cache[next(iter(self._cache))]
+            return entry
+
+    def handle(self, operation: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        handlers = {
+            "export": self.export,
+            "search": self.search,
+            "count": self.count,
+            "links": self.links,
+        }
+        if operation not in handlers:
+            raise ValueError(f"Unknown operation: {operation}")
+        return handlers[operation](request)
+
+    def export(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run an export described by the same options the CLI accepts.
+
+        With ``stream`` a shortcut-only export reads the raw file directly and
+        bypasses the tree cache, which suits one-shot runs.
+        """
+        output = request.get("output")
+        options: Dict[str, Any] = dict(
+            output_root=output or Path.cwd(),
+            include_full_path=request.get("include_full_path", False),
+            duplicate_strategy=DuplicateStrategy(request.get("duplicate_strategy", "unique")),
+            structure_mode=StructureMode(request.get("structure_mode", "preserve")),
+            journal=True,
+            since=_parse_time(request.get("since")),
+            until=_parse_time(request.get("until")),
+            # callers only need counts; full path lists go to the manifest file
+            track_paths=False,
+            manifest=request.get("manifest"),
+            durability=Durability(request.get("durability", "none")),
+            mirror_roots=request.get("mirrors"),
+            link_dest=request.get("link_dest"),
+            mirror_link_dests=request.get("mirror_link_dests"),
+            filters=FilterSpec.from_dict(request["filters"]) if request.get("filters") else None,
+        )
+        exporter = BookmarkExporter(**options)
+        links = request.get("links")
+        link_summary = None
+        if links and links.get("skip"):
+            # asyncio and ssl are only loaded when links are actually checked
+            from .linkcheck import LinkStatus, summarize
+
+            # only the bookmarks this export would write are worth probing
+            nodes = self.tree(request["bookmarks"], request.get("include_roots"))
+            results = self._check_links(
+                (node.url for node in exporter.iter_bookmarks(nodes) if node.url),
+                links,
+                save_cache=not request.get("dry_run"),  # a preview has no side effects
+            )
+            link_summary = summarize(results.values())
+            skip = {LinkStatus(status) for status in links["skip"]}
+            exclude_urls = {url for url, result in results.items() if result.status in skip}
+            exporter = BookmarkExporter(**options, exclude_urls=exclude_urls)
+        streamable = not any(
+            request.get(key) for key in ("dry_run", "ndjson", "csv", "sqlite", "html_shards")
+        )
+        # link checking already built the tree, so reuse it instead of streaming
+        if request.get("stream") and output is not None and streamable and link_summary is None:
+            shortcuts = exporter.export_raw(
+                RawBookmarkFile.load(request["bookmarks"]),
+                request.get("include_roots"),
+                resume=request.get("resume", False),
+            )
+            return {
+                "shortcuts": _shortcut_summary(shortcuts),
+                "ndjson": None,
+                "csv": None,
+                "sqlite": None,
+                "html_shards": None,
+                "links": None,
+                "errors": None,
+            }
+        nodes = self.tree(request["bookmarks"], request.get("include_roots"))
+        if request.get("dry_run"):
+            return {"plan": exporter.plan(nodes, resume=request.get("resume", False)).describe()}
+        result = exporter.export_formats(
+            nodes,
+            shortcuts=output is not None,
+            ndjson_file=request.get("ndjson"),
+            csv_file=request.get("csv"),
+            sqlite_file=request.get("sqlite"),
+            html_shard_dir=request.get("html_shards"),
+            shard_size=int(request.get("shard_size", HTML_SHARD_SIZE)),
+            resume=request.get("resume", False),
+        )
+        response: Dict[str, Any] = {
+            "ndjson": result.ndjson_count,
+            "csv": result.csv_count,
+            "shortcuts": None,
+            "sqlite": None,
+            "html_shards": None,
+            "links": link_summary,
+            "errors": result.errors or None,
+        }
+        if result.shortcuts is not None:
+            response["shortcuts"] = _shortcut_summary(result.shortcuts)
+        if result.html_shards is not None:
+            response["html_shards"] = {
+                "index": str(result.html_shards.index),
+                "pages": len(result.html_shards.pages),
+                "bookmarks": result.html_shards.bookmark_count,
+            }
+        if result.sqlite is not None:
+            response["sqlite"] = {
+                "bookmarks": result.sqlite.bookmarks,
+                "changed": result.sqlite.changed,
+                "removed": result.sqlite.removed,
+            }
+        return response
+
+    def search(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Case-insensitive substring search over bookmark names and URLs."""
+        entry = self._cached(request["bookmarks"], request.get("include_roots"))
+        index = entry.search_index
+        if index is None:
+            index = [
+                (f"{node.name} {node.url}".casefold(), node, tuple(node.path_components[:-1]))
+                for root in entry.nodes
+                for node in [root, *root.iter_descendants()]
+                if not node.is_folder and node.url
+            ]
+            entry.search_index = index
+        needle = str(request.get("query", "")).casefold()
+        limit = int(request.get("limit", 50))
+        results = []
+        for haystack, node, folder in index:
+            if needle in haystack:
+                results.append({"id": node.id, "name": node.name, "url": node.url, "folder": list(folder)})
+                if len(results) >= limit:
+                    break
+        return {"results": results}
+
+    def links(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Check every bookmark URL and report the ones that are not alive."""
+        from .linkcheck import LinkStatus, summarize
+
+        nodes = self.tree(request["bookmarks"], request.get("include_roots"))
+        urls = (
+            node.url
+            for root in nodes
+            for node in [root, *root.iter_descendants()]
+            if not node.is_folder and node.url
+        )
+        results = self._check_links(urls, request.get("links") or {})
+        problems = []
+        for root in nodes:
+            for node in [root, *root.iter_descendants()]:
+                result = results.get(node.url) if not node.is_folder and node.url else None
+                if result is None or result.status in (LinkStatus.ALIVE, LinkStatus.SKIPPED):
+                    continue
+                problems.append({
+                    "id": node.id,
+                    "name": node.name,
+                    "url": node.url,
+                    "folder": node.path_components[:-1],
+                    "status": result.status.value,
+                    "code": result.code,
+                    "error": result.error,
+                })
+        return {"summary": summarize(results.values()), "problems": problems}
+
+    @staticmethod
+    def _check_links(
+        urls: Iterable[str], options: Dict[str, Any], *, save_cache: bool = True
+    ) -> Dict[str, LinkResult]:
+        """Check ``urls``; ``options`` mirror the CLI's --link-* flags."""
+        from .linkcheck import DEFAULT_CACHE_PATH, DEFAULT_TTL, LinkCache, LinkChecker
+
+        cache_path = options.get("cache", str(DEFAULT_CACHE_PATH))
+        checker = LinkChecker(
+            concurrency=int(options.get("concurrency", 100)),
+            per_host=int(options.get("per_host", 8)),
+            timeout=float(options.get("timeout", 10.0)),
+            cache=LinkCache(cache_path, float(options.get("ttl", DEFAULT_TTL))) if cache_path else None,
+            save_cache=save_cache,
+        )
+        return checker.check(urls)
+
+    def count(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        bookmarks = folders = 0
+        for root in self.tree(request["bookmarks"], request.get("include_roots")):
+            for node in [root, *root.iter_descendants()]:
+                if node.is_folder:
+                    folders += 1
+                elif node.url:
+                    bookmarks += 1
+        return {"bookmarks": bookmarks, "folders": folders}
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _shortcut_summary(result: ExportResult) -> Dict[str, Any]:
+    return {
+        "created": result.created_count,
+        "skipped": result.skipped_count,
+        "bytes": result.bytes_written,
+        "linked": result.linked_count,
+        "seconds": round(result.elapsed, 3),
+        "mirrors": [
+            {
+                "root": str(mirror.root),
+                "created": mirror.created_count,
+                "bytes": mirror.bytes_written,
+                "linked": mirror.linked_count,
+                "error": mirror.error,
+            }
+            for mirror in result.mirrors
+        ],
+    }
+
+
+def token_path(port: int) -> Path:
+    """Where a service listening on ``port`` keeps its access token."""
+    return TOKEN_DIR / f"service-{port}.token"
+
+
+def _write_token(path: Path, token: str) -> None:
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        fh.write(token)
+    os.chmod(path, 0o600)  # in case the file already existed with wider permissions
+
+
+def _host_name(header: str) -> str:
+    """The host of a ``Host`` header, without port or IPv6 brackets."""
+    if header.startswith("["):
+        return header[1:].partition("]")[0]
+    return header.rpartition(":")[0] if header.count(":") == 1 else header
+
+
+class _RequestHandler:
+    """Request handling mixed into ``BaseHTTPRequestHandler`` by :func:`make_server`.
+
+    Web pages can send requests to localhost too (a cross-origin form post,
+    or DNS rebinding), so a request must name a loopback ``Host``, carry the
+    service's bearer token and send ``application/json``, which browsers
+    never send cross-origin without a preflight.
+    """
+
+    service: BookmarkService
+    token: str
+
+    def _refused(self) -> bool:
+        if _host_name(self.headers.get("Host", "")).lower() not in LOOPBACK_HOSTS:
+            self._reply(403, {"error": "Requests must be addressed to a loopback host"})
+            return True
+        return False
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        import hmac
+
+        if self._refused():
+            return
+        scheme, _, token = self.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), self.token.encode()):
+            self._reply(401, {"error": "Missing or wrong service token"})
+            return
+        if self.headers.get_content_type() != "application/json":
+            self._reply(415, {"error": "Requests must be application/json"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = get_codec().loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("The request body must be a JSON object")
+            response = self.service.handle(self.path.strip("/"), request)
+            self._reply(200, response)
+        except (KeyError, ValueError, TypeError, OSError) as exc:
+            self._reply(400, {"error": str(exc) or exc.__class__.__name__})
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        if self._refused():
+            return
+        if self.path.strip("/") == "health":
+            self._reply(200, {"status": "ok"})
+        else:
+            self._reply(404, {"error": "Not found"})
+
+    def _reply(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # keep the daemon quiet; errors are reported to clients
+
+
+def make_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    service: Optional[BookmarkService] = None,
+    *,
+    token_file: Optional[Path] = None,
+) -> ThreadingHTTPServer:
+    """Create (but do not start) an HTTP server bound to the loopback ``host:port``.
+
+    A fresh access token is written to ``token_file`` (by default
+    :func:`token_path` of the bound port), readable only by the current
+    user; it is also available as ``server.token``. Remove
+    ``server.token_file`` after shutting down.
+    """
+    # The HTTP stack (and the ssl and email modules under it) is only loaded
+    # by the serve and --server paths, never by an in-process export.
+    import secrets
+    import socket
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    if host.lower() not in LOOPBACK_HOSTS:
+        raise ValueError(f"Refusing to listen on {host}: the service only binds to loopback")
+    token = secrets.token_urlsafe(32)
+    handler = type(
+        "BookmarkRequestHandler",
+        (_RequestHandler, BaseHTTPRequestHandler),
+        {"service": service or BookmarkService(), "token": token},
+    )
+    server_class = ThreadingHTTPServer
+    if ":" in host:
+        server_class = type("IPv6Server", (ThreadingHTTPServer,), {"address_family": socket.AF_INET6})
+    server = server_class((host, port), handler)
+    server.token = token  # type: ignore[attr-defined]
+    server.token_file = token_file or token_path(server.server_address[1])  # type: ignore[attr-defined]
+    _write_token(server.token_file, token)  # type: ignore[attr-defined]
+    return server
+
+
+class ServiceClient:
+    """Thin JSON-over-HTTP client for a running :class:`BookmarkService`."""
+
+    def __init__(
+        self,
+        url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}",
+        timeout: float = 600,
+        token: Optional[str] = None,
+    ) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        # read from the service's token file when not given
+        self.token = token
+
+    def _token(self) -> str:
+        if self.token is None:
+            path = token_path(urlsplit(self.url).port or 80)
+            try:
+                self.token = path.read_text(encoding="utf-8").strip()
+            except OSError:
+                raise RuntimeError(
+                    f"No bookmark service token at {path}; is 'serve' running on {self.url}?"
+                ) from None
+        return self.token
+
+    def call(self, operation: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        import urllib.error
+        import urllib.request
+
+        data = json.dumps(request).encode("utf-8")
+        http_request = urllib.request.Request(
+            f"{self.url}/{operation}",
+            data=data,
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {self._token()}"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(http_request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            message = json.loads(exc.read() or b"{}").get("error", str(exc))
+            raise RuntimeError(f"Bookmark service error: {message}") from None
+        except (urllib.error.URLError, OSError) as exc:
+            reason = getattr(exc, "reason", exc)
+            raise RuntimeError(f"Cannot reach the bookmark service at {self.url}: {reason}") from None
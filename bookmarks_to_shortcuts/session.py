@@ -0,0 +1,146 @@
+"""One parsed Bookmarks file shared by every step of a GUI operation."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from .deleter import BookmarkDeleter, RemovedNode
+from .durability import Durability
+from .model import BookmarkNode
+from .raw import RawBookmarkFile
+from .tree import BookmarkTreeBuilder, update_folder_summary
+from .undo import UndoJournal
+
+
+@dataclass
+class DeleteResult:
+    removed: int  # bookmarks removed
+    removed_nodes: List[RemovedNode] = field(default_factory=list)
+
+    @property
+    def removed_ids(self) -> Set[str]:
+        """Ids of every removed bookmark and pruned folder."""
+        return {str(entry.node.get("id", "")) for entry in self.removed_nodes}
+
+
+class BookmarkSession:
+    """Owns one :class:`RawBookmarkFile` and the tree built from it.
+
+    Loading the folder explorer, filtering, exporting and deleting all work
+    on this single parse. Deletions are applied to the raw data and the tree
+    in memory, so the file is never read back after it is saved.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.raw: RawBookmarkFile
+        self.nodes: List[BookmarkNode] = []
+        self._fingerprint: Tuple[int, int] = (0, 0)
+        self.reload()
+
+    def reload(self) -> None:
+        self._fingerprint = self._stat()
+        self.raw = RawBookmarkFile.load(self.path)
+        self.nodes = BookmarkTreeBuilder(self.raw).build()
+
+    def is_stale(self) -> bool:
+        """Whether the file changed on disk since it was loaded or saved."""
+        try:
+            return self._stat() != self._fingerprint
+        except OSError:
+            return True
+
+    def delete(
+        self,
+        bookmark_ids: Set[str],
+        *,
+        record_undo: bool = True,
+        ancestors: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> DeleteResult:
+        """Remove bookmarks (pruning emptied folders), save, and update the tree.
+
+        The file is reloaded first if something else changed it, so the save
+        never overwrites edits made since the session was opened.
+        ``ancestors`` is passed on to :meth:`BookmarkDeleter.delete`.
+        """
+        if self.is_stale():
+            self.reload()
+        deleter = BookmarkDeleter(self.raw)
+        removed = deleter.delete(bookmark_ids, ancestors=ancestors)
+        result = DeleteResult(removed, deleter.removed_nodes)
+        if not result.removed_nodes:
+            return result
+        journal = UndoJournal(self.path) if record_undo else None
+        if journal is not None:
+            # Written before saving so a crash after the save never loses the undo step.
+            journal.record(result.removed_nodes)
+        try:
+            self.raw.save(Durability.FULL)
+        except BaseException:
+            # The file is unchanged (saves are atomic), so there is nothing to undo,
+            # and the in-memory data no longer matches it: reload on next use.
+            if journal is not None:
+                journal.drop_last()
+            self._fingerprint = (0, 0)
+            raise
+        self._fingerprint = self._stat()
+        removed_ids = result.removed_ids
+        paths = None
+        if ancestors:
+            bookmarks = (entry.node for entry in result.removed_nodes if "url" in entry.node)
+            paths = {tuple(ancestors.get(str(node.get("id", "")), ())) for node in bookmarks}
+        if not paths or () in paths or not self._prune_paths(paths, removed_ids):
+            for root in self.nodes:
+                _prune(root, removed_ids)
+        return result
+
+    def _prune_paths(self, paths: Set[Tuple[str, ...]], removed_ids: Set[str]) -> bool:
+        """Like :func:`_prune`, but only visits the folders at ``paths`` and their ancestors.
+
+        Returns ``False``, changing nothing, if a path is not in the tree.
+        """
+        prefixes = {path[:depth] for path in paths for depth in range(1, len(path) + 1)}
+        folders: Dict[Tuple[str, ...], BookmarkNode] = {}
+        for prefix in sorted(prefixes, key=len):
+            siblings = self.nodes if len(prefix) == 1 else folders[prefix[:-1]].children
+            folder = next(
+                (node for node in siblings if node.id == prefix[-1] and node.is_folder), None
+            )
+            if folder is None:
+                return False
+            folders[prefix] = folder
+        # deepest first, so each summary is built from already updated children
+        for prefix in sorted(prefixes, key=len, reverse=True):
+            folder = folders[prefix]
+            kept: List[BookmarkNode] = []
+            for child in folder.children:
+                if child.id in removed_ids:
+                    child.parent = None
+                else:
+                    kept.append(child)
+            folder.children = kept
+            update_folder_summary(folder)
+        return True
+
+    def _stat(self) -> Tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+
+def _prune(folder: BookmarkNode, removed_ids: Set[str]) -> bool:
+    """Drop ``removed_ids`` below ``folder``; returns whether anything changed."""
+    changed = False
+    kept: List[BookmarkNode] = []
+    for child in folder.children:
+        if child.id in removed_ids:
+            child.parent = None
+            changed = True
+            continue
+        if child.is_folder and _prune(child, removed_ids):
+            changed = True
+        kept.append(child)
+    if changed:
+        folder.children = kept
+        update_folder_summary(folder)
+    return changed
@@ -0,0 +1,134 @@
+"""Timestamped export folders kept as a history, and how long to keep them."""
+from __future__ import annotations
+
+import re
+import shutil
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Hashable, List, Optional, Set, Tuple
+
+from .journal import ExportJournal
+
+SNAPSHOT_SUFFIX = "_Bookmarks"
+TIMESTAMP_FORMAT = "%Y-%m-%d_%H%M"
+# "2026-10-19_0930_Bookmarks", or "..._Bookmarks_2" for a second export in the same minute
+SNAPSHOT_NAME = re.compile(r"(\d{4}-\d{2}-\d{2}_\d{4})_Bookmarks(?:_(\d+))?")
+
+
+@dataclass
+class RetentionPolicy:
+    """Which snapshots to keep; a snapshot kept by any rule survives.
+
+    ``keep_last`` keeps the newest snapshots; the others keep the newest
+    snapshot of each of that many most recent days, ISO weeks or months.
+    A policy with every count at zero keeps everything.
+    """
+
+    keep_last: int = 0
+    keep_daily: int = 0
+    keep_weekly: int = 0
+    keep_monthly: int = 0
+
+    def __bool__(self) -> bool:
+        return any((self.keep_last, self.keep_daily, self.keep_weekly, self.keep_monthly))
+
+
+def snapshot_time(path: Path) -> Optional[datetime]:
+    match = SNAPSHOT_NAME.fullmatch(path.name)
+    if match is None:
+        return None
+    return datetime.strptime(match.group(1), TIMESTAMP_FORMAT)
+
+
+def _sort_key(path: Path):
+    match = SNAPSHOT_NAME.fullmatch(path.name)
+    return match.group(1), int(match.group(2) or 1)  # type: ignore[union-attr]
+
+
+def is_finished(snapshot: Path) -> bool:
+    """Whether the export into ``snapshot`` completed (it no longer holds a journal)."""
+    return snapshot.is_dir() and not ExportJournal.exists(snapshot)
+
+
+def list_snapshots(base: Path) -> List[Path]:
+    """Finished snapshot folders directly in ``base``, oldest first.
+
+    Folders still holding an export journal are unfinished and left out.
+    """
+    if not base.is_dir():
+        return []
+    snapshots = [
+        entry
+        for entry in base.iterdir()
+        if SNAPSHOT_NAME.fullmatch(entry.name) and is_finished(entry)
+    ]
+    return sorted(snapshots, key=_sort_key)
+
+
+def latest_snapshot(base: Path, *, exclude: Optional[Path] = None) -> Optional[Path]:
+    """The newest finished snapshot in ``base`` other than ``exclude``."""
+    for snapshot in reversed(list_snapshots(base)):
+        if exclude is None or snapshot != exclude:
+            return snapshot
+    return None
+
+
+def unfinished_snapshot(base: Path) -> Optional[Path]:
+    """The newest snapshot folder in ``base`` that still holds an export journal."""
+    if not base.is_dir():
+        return None
+    unfinished = [
+        entry
+        for entry in base.iterdir()
+        if SNAPSHOT_NAME.fullmatch(entry.name) and ExportJournal.exists(entry)
+    ]
+    return max(unfinished, key=_sort_key) if unfinished else None
+
+
+def next_snapshot_path(base: Path, now: Optional[datetime] = None) -> Path:
+    """A snapshot folder name in ``base`` that is not taken yet."""
+    base_name = f"{(now or datetime.now()).strftime(TIMESTAMP_FORMAT)}{SNAPSHOT_SUFFIX}"
+    candidate = base / base_name
+    suffix = 2
+    while candidate.exists():
+        candidate = base / f"{base_name}_{suffix}"
+        suffix += 1
+    return candidate
+
+
+def expired_snapshots(snapshots: List[Path], policy: RetentionPolicy) -> List[Path]:
+    """The snapshots ``policy`` does not keep, oldest first; ``snapshots`` must be sorted."""
+    if not policy:
+        return []
+    newest_first = list(reversed(snapshots))
+    keep: Set[Path] = set(newest_first[: policy.keep_last])
+    periods: List[Tuple[int, Callable[[datetime], Hashable]]] = [
+        (policy.keep_daily, lambda when: when.date()),
+        (policy.keep_weekly, lambda when: tuple(when.isocalendar())[:2]),
+        (policy.keep_monthly, lambda when: (when.year, when.month)),
+    ]
+    for count, period in periods:
+        seen: Set[Hashable] = set()
+        for snapshot in newest_first:
+            if len(seen) >= count:
+                break
+            key = period(snapshot_time(snapshot))  # type: ignore[arg-type]
+            if key not in seen:
+                seen.add(key)
+                keep.add(snapshot)
+    # the newest snapshot is the next export's link source; never drop it
+    keep.update(newest_first[:1])
+    return [snapshot for snapshot in snapshots if snapshot not in keep]
+
+
+def prune_snapshots(base: Path, policy: RetentionPolicy) -> List[Path]:
+    """Delete the finished snapshots in ``base`` that ``policy`` does not keep.
+
+    Deleting a snapshot only drops its own links, so files it shares with
+    the snapshots that are kept stay intact.
+    """
+    expired = expired_snapshots(list_snapshots(base), policy)
+    for snapshot in expired:
+        shutil.rmtree(snapshot)
+    return expired
@@ -0,0 +1,169 @@
+"""SQLite export target with incremental upserts and full-text search."""
+from __future__ import annotations
+
+import itertools
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+from .model import BookmarkNode
+
+BATCH_SIZE = 1000
+
+FolderRow = Tuple[str, Optional[str], str, str]
+BookmarkRow = Tuple[str, Optional[str], str, str]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS folders (
+    id TEXT PRIMARY KEY,
+    parent_id TEXT,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS folders_parent_id ON folders (parent_id);
+CREATE INDEX IF NOT EXISTS folders_path ON folders (path);
+
+CREATE TABLE IF NOT EXISTS bookmarks (
+    id TEXT PRIMARY KEY,
+    folder_id TEXT,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bookmarks_folder_id ON bookmarks (folder_id);
+CREATE INDEX IF NOT EXISTS bookmarks_url ON bookmarks (url);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS bookmarks_fts USING fts5 (
+    name, url, content='bookmarks', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS bookmarks_fts_insert AFTER INSERT ON bookmarks BEGIN
+    INSERT INTO bookmarks_fts (rowid, name, url) VALUES (new.rowid, new.name, new.url);
+END;
+CREATE TRIGGER IF NOT EXISTS bookmarks_fts_delete AFTER DELETE ON bookmarks BEGIN
+    INSERT INTO bookmarks_fts (bookmarks_fts, rowid, name, url)
+    VALUES ('delete', old.rowid, old.name, old.url);
+END;
+CREATE TRIGGER IF NOT EXISTS bookmarks_fts_update AFTER UPDATE OF name, url ON bookmarks BEGIN
+    INSERT INTO bookmarks_fts (bookmarks_fts, rowid, name, url)
+    VALUES ('delete', old.rowid, old.name, old.url);
+    INSERT INTO bookmarks_fts (rowid, name, url) VALUES (new.rowid, new.name, new.url);
+END;
+"""
+
+# The WHERE clauses skip no-op updates, so unchanged rows (and their FTS
+# entries) are never rewritten on a re-export.
+UPSERT_FOLDER = """
+INSERT INTO folders (id, parent_id, name, path) VALUES (?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    parent_id = excluded.parent_id, name = excluded.name, path = excluded.path
+WHERE folders.parent_id IS NOT excluded.parent_id
+    OR folders.name IS NOT excluded.name
+    OR folders.path IS NOT excluded.path
+"""
+
+UPSERT_BOOKMARK = """
+INSERT INTO bookmarks (id, folder_id, name, url) VALUES (?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    folder_id = excluded.folder_id, name = excluded.name, url = excluded.url
+WHERE bookmarks.folder_id IS NOT excluded.folder_id
+    OR bookmarks.name IS NOT excluded.name
+    OR bookmarks.url IS NOT excluded.url
+"""
+
+
+@dataclass
+class SqliteExportResult:
+    bookmarks: int
+    changed: int
+    removed: int
+    full_text_search: bool
+
+
+def write_sqlite(
+    records: Iterable[Tuple[BookmarkNode, Tuple[str, ...]]],
+    database: str | Path,
+    *,
+    prune: bool = True,
+) -> SqliteExportResult:
+    """Upsert ``(bookmark, folder path)`` records into ``database`` in one transaction.
+
+    With ``prune`` the database mirrors the export: bookmarks and folders that
+    were not part of it are deleted.
+    """
+    database = Path(database)
+    database.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(database)
+    try:
+        conn.executescript(SCHEMA)
+        fts = _create_fts(conn)
+        with conn:
+            conn.execute("CREATE TEMP TABLE seen_bookmarks (id TEXT PRIMARY KEY)")
+            conn.execute("CREATE TEMP TABLE seen_folders (id TEXT PRIMARY KEY)")
+            count = changed = 0
+            seen_folders: Set[str] = set()
+            records = iter(records)
+            while True:
+                batch = list(itertools.islice(records, BATCH_SIZE))
+                if not batch:
+                    break
+                folder_rows, bookmark_rows = _rows(batch, seen_folders)
+                # rowcount excludes the FTS trigger writes and skipped no-op updates
+                changed += conn.executemany(UPSERT_FOLDER, folder_rows).rowcount
+                changed += conn.executemany(UPSERT_BOOKMARK, bookmark_rows).rowcount
+                conn.executemany(
+                    "INSERT INTO seen_folders (id) VALUES (?)", ((row[0],) for row in folder_rows)
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO seen_bookmarks (id) VALUES (?)",
+                    ((row[0],) for row in bookmark_rows),
+                )
+                count += len(bookmark_rows)
+
+            removed = 0
+            if prune:
+                removed += conn.execute(
+                    "DELETE FROM bookmarks WHERE id NOT IN (SELECT id FROM seen_bookmarks)"
+                ).rowcount
+                removed += conn.execute(
+                    "DELETE FROM folders WHERE id NOT IN (SELECT id FROM seen_folders)"
+                ).rowcount
+            conn.execute("DROP TABLE seen_bookmarks")
+            conn.execute("DROP TABLE seen_folders")
+    finally:
+        conn.close()
+    return SqliteExportResult(
+        bookmarks=count, changed=changed, removed=removed, full_text_search=fts
+    )
+
+
+def _create_fts(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.executescript(FTS_SCHEMA)
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5; the plain tables still work.
+        return False
+    return True
+
+
+def _rows(
+    records: Iterable[Tuple[BookmarkNode, Tuple[str, ...]]], seen_folders: Set[str]
+) -> Tuple[List[FolderRow], List[BookmarkRow]]:
+    """Build bookmark rows plus rows for containing folders not seen before."""
+    folder_rows: List[FolderRow] = []
+    bookmark_rows: List[BookmarkRow] = []
+    for node, path in records:
+        if not node.url:
+            continue
+        folder = node.parent
+        folder_path = path
+        while folder is not None and folder.id not in seen_folders:
+            seen_folders.add(folder.id)
+            parent_id = folder.parent.id if folder.parent is not None else None
+            folder_rows.append((folder.id, parent_id, folder.name, " / ".join(folder_path)))
+            folder = folder.parent
+            folder_path = folder_path[:-1]
+        folder_id = node.parent.id if node.parent is not None else None
+        bookmark_rows.append((node.id, folder_id, node.name, node.url))
+    return folder_rows, bookmark_rows
@@ -1,11 +1,22 @@
 """Convert raw bookmark JSON into typed nodes."""
 from __future__ import annotations
 
-from typing import Dict, List
+import hashlib
+import time
+import uuid
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from .model import BookmarkNode
 from .raw import RawBookmarkFile
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
+CONTENT_HASH_SIZE = 16
+
+# Microseconds between 1601-01-01 (Chromium's epoch) and 1970-01-01.
+CHROME_EPOCH_OFFSET_US = 11_644_473_600_000_000
+
 
 class BookmarkTreeBuilder:
     """Builds BookmarkNode hierarchies while preserving order."""
@@ -22,30 +33,163 @@ class BookmarkTreeBuilder:
         self.raw = raw
 
     def build(self, include_roots: List[str] | None = None) -> List[BookmarkNode]:
+        return [self._build_node(root) for root in self.selected_roots(include_roots)]
+
+    def selected_roots(self, include_roots: List[str] | None = None) -> List[Dict]:
+        """Raw root dicts in export order, limited to ``include_roots`` if given."""
         roots = self.raw.roots()
-        nodes: List[BookmarkNode] = []
+        selected: List[Dict] = []
         for key in self.ROOT_ORDER:
             if key not in roots:
                 continue
             if include_roots and key not in include_roots:
                 continue
-            nodes.append(self._build_node(roots[key]))
+            selected.append(roots[key])
         # include any additional custom roots deterministically
         for key in sorted(roots.keys()):
             if key in self.ROOT_ORDER:
                 continue
             if include_roots and key not in include_roots:
                 continue
-            nodes.append(self._build_node(roots[key]))
-        return nodes
+            selected.append(roots[key])
+        return selected
 
     def _build_node(self, raw_node: Dict) -> BookmarkNode:
         node = BookmarkNode(
             id=str(raw_node.get("id", "")),
             name=raw_node.get("name", ""),
-            type=raw_node.get("type", "folder" if raw_node.get("children") else "url"),
+            type=raw_node_type(raw_node),
             url=raw_node.get("url"),
+            guid=raw_node.get("guid"),
+            date_added=chrome_time(raw_node.get("date_added")),
+            date_modified=chrome_time(raw_node.get("date_modified")),
+            date_last_used=chrome_time(raw_node.get("date_last_used")),
         )
+        if not node.is_folder:
+            return node
         for child in raw_node.get("children", []):
             node.add_child(self._build_node(child))
+        update_folder_summary(node)
         return node
+
+
+class BookmarkTreeSerializer:
+    """Turns BookmarkNode trees back into the JSON structure Brave persists.
+
+    Every node gets a fresh id (assigned in pre-order) and a random GUID.
+    Dates the nodes carry are kept; missing ones are set to ``timestamp``.
+    """
+
+    ROOT_NAMES = {
+        "bookmark_bar": "Bookmarks bar",
+        "other": "Other bookmarks",
+        "synced": "Mobile bookmarks",
+    }
+    # Chromium uses these fixed GUIDs for its permanent folders.
+    ROOT_GUIDS = {
+        "bookmark_bar": "0bc5d13f-2cba-5d74-951f-3f233fe6c908",
+        "other": "82b081ec-3dd3-529c-8475-ab6c344590dd",
+        "synced": "4cf2e351-0e85-532b-bb37-df045d8f8d0f",
+    }
+
+    def __init__(self, timestamp: int | None = None) -> None:
+        self.timestamp = str(timestamp if timestamp is not None else chrome_time_now())
+        self._next_id = 1
+
+    def serialize_roots(self, roots: Dict[str, BookmarkNode]) -> Dict[str, Dict]:
+        """Encode ``{root key: folder}``; missing permanent roots are created empty."""
+        encoded: Dict[str, Dict] = {}
+        for key in self.ROOT_NAMES:
+            folder = roots.get(key) or BookmarkNode(id="", name=self.ROOT_NAMES[key], type="folder")
+            encoded[key] = self.serialize(folder, guid=self.ROOT_GUIDS[key])
+        for key, folder in roots.items():
+            if key not in encoded:
+                encoded[key] = self.serialize(folder)
+        return encoded
+
+    def serialize(self, node: BookmarkNode, guid: str | None = None) -> Dict:
+        raw: Dict = {
+            "date_added": str(node.date_added) if node.date_added else self.timestamp,
+            "date_last_used": str(node.date_last_used),
+            "guid": guid or _new_guid(),
+            "id": str(self._next_id),
+            "name": node.name,
+            "type": node.type,
+        }
+        self._next_id += 1
+        if node.is_folder:
+            raw["date_modified"] = str(node.date_modified) if node.date_modified else self.timestamp
+            raw["children"] = [self.serialize(child) for child in node.children]
+        else:
+            raw["url"] = node.url or ""
+        return raw
+
+
+def update_folder_summary(folder: BookmarkNode) -> None:
+    """Recompute ``latest_added`` of ``folder`` from its children and drop its cached hash.
+
+    Child folders must already be up to date, so after editing a tree call
+    this for each changed folder from the bottom up. If one of them never
+    was, ``latest_added`` stays unknown (None) here too.
+    """
+    latest: Optional[int] = 0
+    for child in folder.children:
+        child_latest = child.latest_added if child.is_folder else child.date_added
+        if child_latest is None or latest is None:
+            latest = None
+        elif child_latest > latest:
+            latest = child_latest
+    folder.latest_added = latest
+    folder.content_hash = None
+
+
+def folder_hash(folder: BookmarkNode) -> bytes:
+    """BLAKE2b digest of ``folder``'s name and everything below it, in order.
+
+    Each child folder contributes its own digest, so equal digests mean
+    identical subtrees. Digests are computed on first use and cached on the
+    folders; building a tree costs nothing until a diff or refresh asks.
+    """
+    if folder.content_hash is not None:
+        return folder.content_hash
+    digest = hashlib.blake2b(_hash_text(b"f", folder.name), digest_size=CONTENT_HASH_SIZE)
+    for child in folder.children:
+        if child.is_folder:
+            digest.update(b"F" + folder_hash(child))
+        else:
+            digest.update(_hash_text(b"u", child.name) + _hash_text(b"", child.url or ""))
+    folder.content_hash = digest.digest()
+    return folder.content_hash
+
+
+def chrome_time_now() -> int:
+    """Current time in Chromium's format: microseconds since 1601-01-01 UTC."""
+    return int(time.time() * 1_000_000) + CHROME_EPOCH_OFFSET_US
+
+
+def chrome_time(value: object) -> int:
+    """Parse a Chromium timestamp string (as stored in Bookmarks) into an int."""
+    try:
+        return int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return 0
+
+
+def chrome_time_from_datetime(moment: datetime) -> int:
+    """Chromium timestamp for ``moment``; naive datetimes are local time."""
+    return int(moment.timestamp() * 1_000_000) + CHROME_EPOCH_OFFSET_US
+
+
+def _hash_text(tag: bytes, text: str) -> bytes:
+    # length-prefixed so that no two sequences of names encode the same
+    data = text.encode("utf-8", "surrogatepass")
+    return tag + len(data).to_bytes(4, "little") + data
+
+
+def raw_node_type(raw_node: Dict) -> str:
+    """The node type, inferred from ``children`` when the ``type`` key is missing."""
+    return raw_node.get("type", "folder" if raw_node.get("children") else "url")
+
+
+def _new_guid() -> str:
+    return str(uuid.uuid4())
@@ -0,0 +1,93 @@
+"""Compact undo journal for bookmark deletions."""
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .deleter import RemovedNode
+
+UNDO_SUFFIX = ".undo"
+
+
+class UndoJournal:
+    """Append-only log of deletions kept next to the Bookmarks file.
+
+    Each deletion is one JSON line holding only the removed nodes with their
+    parent ids and sibling indices, so recording an undo step costs I/O
+    proportional to what was deleted rather than to the size of the file.
+    """
+
+    def __init__(self, bookmarks_path: str | Path) -> None:
+        bookmarks_path = Path(bookmarks_path)
+        self.path = bookmarks_path.with_name(bookmarks_path.name + UNDO_SUFFIX)
+
+    def record(self, removed_nodes: List[RemovedNode]) -> None:
+        if not removed_nodes:
+            return
+        entry = {
+            "time": int(time.time()),
+            "removed": [[item.parent_id, item.index, item.node] for item in removed_nodes],
+        }
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    def steps(self) -> int:
+        if not self.path.exists():
+            return 0
+        with self.path.open("rb") as fh:
+            return sum(1 for line in fh if line.strip())
+
+    def peek(self) -> Optional[List[RemovedNode]]:
+        """The most recent deletion, or ``None`` when there is nothing to undo."""
+        found = self._last_line()
+        if found is None:
+            return None
+        _, line = found
+        entry = json.loads(line)
+        return [RemovedNode(str(parent_id), index, node) for parent_id, index, node in entry["removed"]]
+
+    def drop_last(self) -> None:
+        """Forget the most recent deletion once it has been restored."""
+        found = self._last_line()
+        if found is None:
+            return
+        offset, _ = found
+        if offset == 0:
+            self.path.unlink()
+            return
+        with self.path.open("r+b") as fh:
+            fh.truncate(offset)
+
+    def _last_line(self) -> Optional[Tuple[int, str]]:
+        """``(byte offset, content)`` of the last non-empty line, read from the end."""
+        if not self.path.exists():
+            return None
+        with self.path.open("rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            end = fh.tell()
+            # skip trailing newlines
+            while end > 0:
+                fh.seek(end - 1)
+                if fh.read(1) not in (b"\n", b"\r"):
+                    break
+                end -= 1
+            if end == 0:
+                return None
+            start = end
+            chunk = 64 * 1024
+            while start > 0:
+                step = min(chunk, start)
+                fh.seek(start - step)
+                block = fh.read(step)
+                newline = block.rfind(b"\n")
+                if newline != -1:
+                    start = start - step + newline + 1
+                    break
+                start -= step
+            fh.seek(start)
+            return start, fh.read(end - start).decode("utf-8")
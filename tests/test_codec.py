@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from bookmarks_to_shortcuts.codec import CODECS, JsonCodec, get_codec, read_json
+from bookmarks_to_shortcuts.durability import Durability
+from bookmarks_to_shortcuts.raw import RawBookmarkFile
+
+SAMPLE = {
+    "checksum": "",
+    "roots": {
+        "bookmark_bar": {
+            "children": [
+                {"id": "2", "name": "Café — \U0001f600", "type": "url", "url": "https://xn--caf-dma.example/"},
+            ],
+            "id": "1",
+            "name": "Bookmarks bar",
+            "type": "folder",
+        }
+    },
+    "version": 1,
+}
+
+
+def available_codecs():
+    names = []
+    for name in CODECS:
+        try:
+            get_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_save_matches_text_mode_json_dump(tmp_path, monkeypatch, name):
+    monkeypatch.setenv("BOOKMARKS_JSON_CODEC", name)
+    legacy = tmp_path / "legacy"
+    with legacy.open("w", encoding="utf-8") as fh:
+        json.dump(SAMPLE, fh, indent=3)
+
+    source = tmp_path / "Bookmarks"
+    source.write_bytes(legacy.read_bytes())
+    raw = RawBookmarkFile.load(source)
+    assert raw.data == SAMPLE
+    raw.save()
+    assert source.read_bytes() == legacy.read_bytes()
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_read_json_handles_bom_and_empty_files(tmp_path, name):
+    codec = get_codec(name)
+    bom = tmp_path / "bom.json"
+    bom.write_bytes(b"\xef\xbb\xbf" + json.dumps(SAMPLE).encode("utf-8"))
+    assert read_json(bom, codec) == SAMPLE
+
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        read_json(empty, codec)
+
+
+def test_durable_save_never_leaves_a_truncated_file(tmp_path, monkeypatch):
+    source = tmp_path / "Bookmarks"
+    source.write_text(json.dumps(SAMPLE), encoding="utf-8")
+    original = source.read_bytes()
+    raw = RawBookmarkFile.load(source)
+    raw.data["version"] = 2
+
+    def crash(path, obj, **kwargs):
+        path.write_bytes(b'{"checks')
+        raise OSError("disk full")
+
+    monkeypatch.setattr("bookmarks_to_shortcuts.raw.write_json", crash)
+    with pytest.raises(OSError):
+        raw.save(Durability.FULL)
+    assert source.read_bytes() == original
+    assert [path.name for path in tmp_path.iterdir()] == ["Bookmarks"]
+
+    monkeypatch.undo()
+    raw.save(Durability.FULL)
+    assert RawBookmarkFile.load(source).data["version"] == 2
+    assert [path.name for path in tmp_path.iterdir()] == ["Bookmarks"]
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        get_codec("nope")
+    assert isinstance(get_codec("json"), JsonCodec)
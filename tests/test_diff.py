@@ -0,0 +1,73 @@
+import copy
+import json
+
+from bookmarks_to_shortcuts.cli import main
+from bookmarks_to_shortcuts.diff import ChangeKind, diff_bookmarks
+from bookmarks_to_shortcuts.raw import RawBookmarkFile
+
+
+def node(node_id, name, url=None, children=None):
+    data = {"id": node_id, "guid": f"guid-{node_id}", "name": name}
+    if children is None:
+        data.update(type="url", url=url)
+    else:
+        data.update(type="folder", children=children)
+    return data
+
+
+OLD_ROOTS = {
+    "bookmark_bar": node("1", "Bookmarks bar", children=[
+        node("10", "News", "https://news.example"),
+        node("20", "Work", children=[node("21", "Docs", "https://docs.example")]),
+        node("30", "Later", children=[node("31", "Read", "https://read.example")]),
+    ]),
+}
+
+
+def changed_roots():
+    roots = copy.deepcopy(OLD_ROOTS)
+    bar = roots["bookmark_bar"]["children"]
+    news, work, later = bar
+    news["name"] = "Headlines"  # renamed
+    work["children"][0]["url"] = "https://docs.example/v2"  # URL changed
+    work["children"].append(later["children"].pop())  # moved
+    bar.remove(later)  # removed (now empty)
+    bar.append(node("40", "New", "https://new.example"))  # added
+    return roots
+
+
+def test_diff_reports_each_kind_of_change(tmp_path):
+    old = RawBookmarkFile(tmp_path / "old", {"roots": OLD_ROOTS})
+    new = RawBookmarkFile(tmp_path / "new", {"roots": changed_roots()})
+
+    result = diff_bookmarks(old, new)
+
+    assert result.matched_by == "guid"
+    kinds = {(change.kind, change.id) for change in result.changes}
+    assert kinds == {
+        (ChangeKind.RENAMED, "10"),
+        (ChangeKind.URL_CHANGED, "21"),
+        (ChangeKind.MOVED, "31"),
+        (ChangeKind.REMOVED, "30"),
+        (ChangeKind.ADDED, "40"),
+    }
+    moved = next(change for change in result.changes if change.kind is ChangeKind.MOVED)
+    assert moved.folder == ("Bookmarks bar", "Work")
+    assert moved.old_value == "Bookmarks bar / Later"
+    assert diff_bookmarks(old, old).changes == []
+
+
+def test_diff_command_prints_json(tmp_path, capsys):
+    old_path, new_path = tmp_path / "old", tmp_path / "new"
+    RawBookmarkFile.create(old_path, OLD_ROOTS).save()
+    roots = changed_roots()
+    del roots["bookmark_bar"]["guid"]  # without GUIDs on both sides, ids are used
+    RawBookmarkFile.create(new_path, roots).save()
+
+    main(["diff", str(old_path), str(new_path), "--json"])
+    report = json.loads(capsys.readouterr().out)
+
+    assert report["matched_by"] == "id"
+    assert report["summary"] == {
+        "added": 1, "removed": 1, "renamed": 1, "moved": 1, "url_changed": 1,
+    }
@@ -1,11 +1,22 @@
+import csv
+import io
+import json
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+
+from bookmarks_to_shortcuts.cli import main
+from bookmarks_to_shortcuts.durability import Durability
 from bookmarks_to_shortcuts.exporter import (
     BookmarkExporter,
     DuplicateStrategy,
     StructureMode,
 )
+from bookmarks_to_shortcuts.journal import ExportJournal
 from bookmarks_to_shortcuts.model import BookmarkNode
+from bookmarks_to_shortcuts.raw import RawBookmarkFile
+from bookmarks_to_shortcuts.tree import BookmarkTreeBuilder, chrome_time_from_datetime
 
 
 def make_sample_tree(tmp_path: Path) -> BookmarkNode:
@@ -139,3 +150,339 @@ def test_export_text_combined_is_plain_list(tmp_path):
     exporter.export_text([root], text_path)
     text = text_path.read_text().strip().splitlines()
     assert text == ["https://example.com", "https://example.org"]
+
+
+def test_plan_resolves_duplicates_without_writing(tmp_path):
+    root = make_sample_tree(tmp_path)
+    output = tmp_path / "out"
+    exporter = BookmarkExporter(output, include_full_path=False)
+
+    plan = exporter.plan([root])
+
+    assert not output.exists()
+    assert plan.file_count == 2
+    assert len(plan.collisions) == 1
+    assert plan.directories == [output, output / "Work"]
+    assert plan.total_bytes == sum(
+        len(exporter._shortcut_payload(s.node.url)) for s in plan.shortcuts
+    )
+
+    result = exporter.execute(plan)
+    assert result.created_files == [s.path for s in plan.shortcuts]
+    assert sorted(p.name for p in result.created_files) == [
+        "Example _ Docs (2).url",
+        "Example _ Docs.url",
+    ]
+
+
+def test_plan_skip_strategy_accounts_for_existing_files(tmp_path):
+    root = make_sample_tree(tmp_path)
+    (tmp_path / "Work").mkdir()
+    (tmp_path / "Work" / "Example _ Docs.url").write_text("existing")
+    exporter = BookmarkExporter(
+        tmp_path, include_full_path=False, duplicate_strategy=DuplicateStrategy.SKIP
+    )
+
+    plan = exporter.plan([root])
+
+    assert plan.file_count == 0
+    assert plan.skipped == [tmp_path / "Work" / "Example _ Docs.url"] * 2
+    assert plan.directories == []
+
+
+def test_export_formats_walks_tree_once(tmp_path, monkeypatch):
+    root = make_sample_tree(tmp_path)
+    exporter = BookmarkExporter(tmp_path / "out", include_full_path=False)
+    calls = []
+    original = exporter._collect
+    monkeypatch.setattr(exporter, "_collect", lambda nodes: calls.append(1) or original(nodes))
+
+    result = exporter.export_formats(
+        [root], html_file=tmp_path / "b.html", text_file=tmp_path / "b.txt"
+    )
+
+    assert len(calls) == 1
+    assert len(result.shortcuts.created_files) == 2
+    assert result.html_count == result.text_count == 2
+    assert (tmp_path / "b.html").read_text().count("<li>") == 2
+
+
+def test_export_formats_keeps_going_after_a_failed_format(tmp_path):
+    root = make_sample_tree(tmp_path)
+    exporter = BookmarkExporter(tmp_path / "out", include_full_path=False)
+    (tmp_path / "taken").mkdir()  # a directory cannot be written as the HTML file
+
+    result = exporter.export_formats(
+        [root], html_file=tmp_path / "taken", text_file=tmp_path / "b.txt"
+    )
+
+    assert list(result.errors) == ["HTML"]
+    assert result.html_count is None
+    assert len(result.shortcuts.created_files) == 2
+    assert result.text_count == 2
+
+
+def test_cli_reports_a_failed_format_and_exits_non_zero(tmp_path, capsys):
+    bookmarks = tmp_path / "Bookmarks"
+    RawBookmarkFile.create(bookmarks, {
+        "bookmark_bar": {"id": "1", "name": "Bar", "type": "folder", "children": [
+            {"id": "2", "name": "Wiki", "type": "url", "url": "https://wiki.example"},
+        ]},
+    }).save()
+    (tmp_path / "taken").mkdir()  # a directory cannot be written as the CSV file
+
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(bookmarks), str(tmp_path / "out"), "--csv", str(tmp_path / "taken"),
+              "--ndjson", str(tmp_path / "b.ndjson")])
+
+    assert exit_info.value.code == 1
+    out, err = capsys.readouterr()
+    assert "Created 1 shortcuts" in out
+    assert "Exported 1 bookmarks as NDJSON" in out
+    assert err.startswith("CSV: ")
+
+
+def test_export_ndjson_streams_records(tmp_path):
+    root = make_sample_tree(tmp_path)
+    exporter = BookmarkExporter(tmp_path, include_full_path=False)
+    out = io.StringIO()
+
+    count = exporter.export_ndjson([root], out)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert count == 2
+    assert records[0] == {
+        "id": "3",
+        "name": "Example / Docs",
+        "url": "https://example.com",
+        "folder": ["Bookmarks Bar", "Work"],
+    }
+
+
+def test_export_csv_writes_header_and_rows(tmp_path):
+    root = make_sample_tree(tmp_path)
+    exporter = BookmarkExporter(tmp_path, include_full_path=False)
+    csv_path = tmp_path / "bookmarks.csv"
+
+    count = exporter.export_csv([root], csv_path)
+
+    with csv_path.open(newline="", encoding="utf-8") as fh:
+        rows = list(csv.reader(fh))
+    assert count == 2
+    assert rows[0] == ["id", "name", "url", "folder"]
+    assert rows[2] == ["4", "Example / Docs", "https://example.org", "Bookmarks Bar / Work"]
+
+
+def test_export_raw_matches_tree_export(tmp_path):
+    raw = RawBookmarkFile(
+        source_path=tmp_path / "Bookmarks",
+        data={
+            "roots": {
+                "bookmark_bar": {
+                    "id": "1",
+                    "name": "Bookmarks bar",
+                    "type": "folder",
+                    "children": [
+                        {"id": "2", "name": "Top", "type": "url", "url": "https://top.example"},
+                        {
+                            "id": "3",
+                            "name": "Work",
+                            "children": [
+                                {"id": "4", "name": "Docs", "url": "https://a.example"},
+                                {"id": "5", "name": "docs", "url": "https://b.example"},
+                                {"id": 6, "name": "Deep", "type": "folder", "children": [
+                                    {"id": "7", "name": "", "type": "url", "url": "https://c.example"},
+                                ]},
+                            ],
+                        },
+                        {"id": "8", "name": "Docs", "type": "url", "url": "https://d.example"},
+                    ],
+                },
+                "other": {"id": "9", "name": "Other bookmarks", "type": "folder", "children": []},
+            }
+        },
+    )
+    nodes = BookmarkTreeBuilder(raw).build()
+    for mode in StructureMode:
+        for strategy in DuplicateStrategy:
+            for full_path in (True, False):
+                options = dict(
+                    include_full_path=full_path, duplicate_strategy=strategy, structure_mode=mode
+                )
+                case = tmp_path / f"{mode.value}-{strategy.value}-{full_path}"
+                expected = BookmarkExporter(case / "tree", **options).export(nodes)
+                actual = BookmarkExporter(case / "raw", **options).export_raw(raw)
+                assert [p.relative_to(case / "raw") for p in actual.created_files] == [
+                    p.relative_to(case / "tree") for p in expected.created_files
+                ]
+                assert len(actual.skipped) == len(expected.skipped)
+                for path in expected.created_files:
+                    twin = case / "raw" / path.relative_to(case / "tree")
+                    assert twin.read_bytes() == path.read_bytes()
+
+
+class _Untouchable(list):
+    def __iter__(self):
+        raise AssertionError("folder should have been pruned")
+
+
+def test_date_filters_prune_old_folders(tmp_path):
+    def stamp(day):
+        return str(chrome_time_from_datetime(datetime(2026, 10, day)))
+
+    data = {
+        "roots": {
+            "bookmark_bar": {"id": "1", "name": "Bar", "type": "folder", "children": [
+                {"id": "2", "name": "Archive", "type": "folder", "children": [
+                    {"id": "3", "name": "Old", "type": "url", "url": "https://old", "date_added": stamp(1)},
+                ]},
+                {"id": "4", "name": "Recent", "type": "folder", "children": [
+                    {"id": "5", "name": "Mid", "type": "url", "url": "https://mid", "date_added": stamp(5)},
+                    {"id": "6", "name": "New", "type": "url", "url": "https://new", "date_added": stamp(9)},
+                ]},
+            ]},
+        }
+    }
+    raw = RawBookmarkFile(source_path=tmp_path / "Bookmarks", data=data)
+    nodes = BookmarkTreeBuilder(raw).build()
+    archive, recent = nodes[0].children
+    assert recent.latest_added == int(stamp(9))
+    assert recent.children[0].date_added == int(stamp(5))
+    archive.children = _Untouchable(archive.children)
+
+    exporter = BookmarkExporter(tmp_path / "out", since=datetime(2026, 10, 3), until=datetime(2026, 10, 8))
+    result = exporter.export(nodes)
+    assert [p.relative_to(tmp_path / "out").as_posix() for p in result.created_files] == ["Bar/Recent/Mid.url"]
+
+    streamed = BookmarkExporter(tmp_path / "raw", since=datetime(2026, 10, 3), until=datetime(2026, 10, 8))
+    assert [p.name for p in streamed.export_raw(raw).created_files] == ["Mid.url"]
+
+
+def test_date_filters_never_prune_folders_without_a_summary(tmp_path):
+    # hand-built (or GUI-cloned) trees never ran update_folder_summary
+    added = chrome_time_from_datetime(datetime(2026, 10, 5))
+    bar = BookmarkNode(id="1", name="Bar", type="folder")
+    work = BookmarkNode(id="2", name="Work", type="folder")
+    bar.add_child(work)
+    work.add_child(BookmarkNode(id="3", name="Mid", type="url", url="https://mid", date_added=added))
+    assert work.latest_added is None
+
+    exporter = BookmarkExporter(tmp_path / "out", since=datetime(2026, 10, 3), until=datetime(2026, 10, 8))
+    assert [p.name for p in exporter.export([bar]).created_files] == ["Mid.url"]
+
+
+def test_excluded_urls_are_left_out(tmp_path):
+    root = make_sample_tree(tmp_path)
+    exporter = BookmarkExporter(tmp_path / "out", exclude_urls={"https://example.org"})
+    result = exporter.export([root])
+    assert [p.read_text() for p in result.created_files] == [BookmarkExporter._shortcut_contents("https://example.com")]
+    assert exporter._journal_options()["excluded_urls"]
+
+
+def test_export_html_shards_splits_by_top_level_folder_and_size(tmp_path):
+    bar = BookmarkNode(id="1", name="Bar", type="folder")
+    other = BookmarkNode(id="2", name="Other", type="folder")
+    for idx in range(5):
+        bar.add_child(BookmarkNode(id=f"b{idx}", name=f"B{idx}", type="url", url=f"https://b/{idx}"))
+    other.add_child(BookmarkNode(id="o", name="O", type="url", url="https://o"))
+
+    result = BookmarkExporter(tmp_path, include_full_path=True).export_html_shards(
+        [bar, other], tmp_path / "html", shard_size=2
+    )
+
+    assert [page.name for page in result.pages] == [
+        "0001-bar-1-3.html", "0002-bar-2-3.html", "0003-bar-3-3.html", "0004-other.html"
+    ]
+    assert result.bookmark_count == 6
+    index = result.index.read_text(encoding="utf-8")
+    assert all(f'href="{page.name}"' in index for page in result.pages)
+    last_bar_page = result.pages[2].read_text(encoding="utf-8")
+    assert "https://b/4" in last_bar_page and "https://b/3" not in last_bar_page
+    assert '<a href="index.html">' in last_bar_page
+
+
+def test_html_shards_give_each_top_level_folder_its_own_page(tmp_path):
+    bar = BookmarkNode(id="1", name="Bar", type="folder")
+    bar.add_child(BookmarkNode(id="b", name="Loose", type="url", url="https://loose"))
+    for name in ("Work", "Home"):
+        folder = BookmarkNode(id=name, name=name, type="folder")
+        bar.add_child(folder)
+        folder.add_child(BookmarkNode(id=f"{name}1", name="A", type="url", url=f"https://{name}/a"))
+        nested = BookmarkNode(id=f"{name}n", name="Nested", type="folder")
+        folder.add_child(nested)
+        nested.add_child(BookmarkNode(id=f"{name}2", name="B", type="url", url=f"https://{name}/b"))
+    exporter = BookmarkExporter(tmp_path, include_full_path=False)
+
+    result = exporter.export_html_shards([bar], tmp_path / "html", shard_size=0)
+
+    assert [page.name for page in result.pages] == [
+        "0001-bar.html", "0002-bar-home.html", "0003-bar-work.html"
+    ]
+    assert "https://Work/b" in result.pages[2].read_text(encoding="utf-8")
+    with pytest.raises(ValueError):
+        exporter.export_html_shards([bar], tmp_path / "html", shard_size=-1)
+
+
+def test_summary_mode_counts_without_keeping_paths(tmp_path):
+    root = make_sample_tree(tmp_path)
+    manifest = tmp_path / "manifest.tsv"
+    exporter = BookmarkExporter(
+        tmp_path / "out", duplicate_strategy=DuplicateStrategy.SKIP, track_paths=False, manifest=manifest
+    )
+    result = exporter.export([root])
+
+    assert (result.created_files, result.skipped) == ([], [])
+    assert (result.created_count, result.skipped_count) == (1, 1)
+    written = list((tmp_path / "out").rglob("*.url"))
+    assert result.bytes_written == written[0].stat().st_size
+    lines = manifest.read_text(encoding="utf-8").splitlines()
+    assert [line.split("\t")[0] for line in lines] == ["created", "skipped"]
+    assert lines[0].split("\t")[1] == str(written[0])
+
+
+def test_durability_levels_control_fsync(tmp_path, monkeypatch):
+    import os
+
+    calls = []
+    monkeypatch.setattr(os, "fsync", lambda fd: calls.append("fsync"))
+    monkeypatch.setattr(os, "sync", lambda: calls.append("sync"), raising=False)
+    counts = {}
+    for level in Durability:
+        calls.clear()
+        BookmarkExporter(tmp_path / level.value, include_full_path=True, durability=level).export(
+            [make_sample_tree(tmp_path)]
+        )
+        counts[level] = (calls.count("sync"), calls.count("fsync"))
+
+    # the output root, Bookmarks Bar/ and Work/ are created; FULL also fsyncs both files,
+    # BATCHED only the folders, and neither flushes the whole system
+    assert counts[Durability.NONE] == (0, 0)
+    assert counts[Durability.BATCHED] == (0, 3)
+    assert counts[Durability.FULL] == (0, 5)
+    assert BookmarkExporter(tmp_path / "default").durability is Durability.NONE
+
+
+def test_mirror_roots_receive_the_same_files(tmp_path):
+    blocked = tmp_path / "blocked"
+    blocked.write_text("not a directory")
+    exporter = BookmarkExporter(
+        tmp_path / "main", include_full_path=True, journal=True,
+        mirror_roots=[tmp_path / "backup", blocked],
+    )
+    result = exporter.export([make_sample_tree(tmp_path)])
+
+    def tree(root):
+        return {p.relative_to(root).as_posix(): p.read_bytes() for p in root.rglob("*.url")}
+
+    assert len(tree(tmp_path / "main")) == 2
+    assert tree(tmp_path / "backup") == tree(tmp_path / "main")
+    backup, failed = result.mirrors
+    assert (backup.created_count, backup.bytes_written, backup.error) == (2, result.bytes_written, None)
+    assert failed.created_count == 0 and failed.error
+
+    # the failed mirror's batches stay pending, so a resume fills it in
+    assert ExportJournal.exists(tmp_path / "main")
+    blocked.unlink()
+    exporter.export([make_sample_tree(tmp_path)], resume=True)
+    assert tree(blocked) == tree(tmp_path / "main")
+    assert not ExportJournal.exists(tmp_path / "main")
@@ -0,0 +1,91 @@
+import pytest
+
+from bookmarks_to_shortcuts.exporter import BookmarkExporter
+from bookmarks_to_shortcuts.filters import FilterSpec
+from bookmarks_to_shortcuts.raw import RawBookmarkFile
+from bookmarks_to_shortcuts.tree import BookmarkTreeBuilder
+
+
+def test_rules_compile_into_one_matcher():
+    matcher = FilterSpec(
+        include_folders=["Bar/**/Work"],
+        exclude_folders=["**/old"],
+        include_domains=["*.corp.example", "example.org"],
+        exclude_urls=["/logout"],
+        exclude_schemes=["javascript:"],
+    ).compile()
+
+    assert matcher.enter_path(["Other"]) is None  # no include glob can match below it
+    bar = matcher.enter_path(["Bar"])
+    assert bar is not None and not bar.included
+    work = matcher.enter_path(["bar", "Team", "WORK"])
+    assert work.included
+    assert matcher.enter(work, "Old") is None
+    assert matcher.enter(work, "Notes").included
+
+    accepted = [
+        url
+        for url in (
+            "https://wiki.corp.example/page",
+            "https://corp.example/",
+            "https://evilcorp.example/",
+            "http://user@EXAMPLE.org:8080/",
+            "https://wiki.corp.example/logout",
+            "javascript:alert(1)",
+        )
+        if matcher.accepts(url, work)
+    ]
+    assert accepted == ["https://wiki.corp.example/page", "http://user@EXAMPLE.org:8080/"]
+    assert not matcher.accepts("https://wiki.corp.example/page", bar)
+
+    with pytest.raises(ValueError):
+        FilterSpec(include_urls=["("]).compile()
+    with pytest.raises(ValueError):
+        FilterSpec.from_dict({"include_hosts": ["x"]})
+    with pytest.raises(ValueError, match="list of strings"):
+        FilterSpec.from_dict({"include_domains": "example.com"})
+    with pytest.raises(ValueError, match="list of strings"):
+        FilterSpec.from_dict({"exclude_domains": [1]})
+
+
+class _Untouchable(list):
+    def __iter__(self):
+        raise AssertionError("folder should have been pruned")
+
+
+def test_excluded_folders_are_never_walked(tmp_path):
+    def url(node_id, name, address):
+        return {"id": node_id, "name": name, "type": "url", "url": address}
+
+    data = {
+        "roots": {
+            "bookmark_bar": {"id": "1", "name": "Bar", "type": "folder", "children": [
+                {"id": "2", "name": "Archive", "type": "folder", "children": [
+                    url("3", "Old", "https://old.example"),
+                ]},
+                {"id": "4", "name": "Work", "type": "folder", "children": [
+                    url("5", "Wiki", "https://wiki.corp.example"),
+                    url("6", "Run", "javascript:void(0)"),
+                    url("7", "News", "https://news.example"),
+                ]},
+            ]},
+            "other": {"id": "8", "name": "Other", "type": "folder", "children": []},
+        }
+    }
+    raw = RawBookmarkFile(source_path=tmp_path / "Bookmarks", data=data)
+    spec = FilterSpec(
+        include_folders=["Bar"], exclude_folders=["*/archive"], exclude_schemes=["javascript"],
+        exclude_domains=["news.example"],
+    )
+
+    nodes = BookmarkTreeBuilder(raw).build()
+    nodes[0].children[0].children = _Untouchable()
+    nodes[1].children = _Untouchable()
+    result = BookmarkExporter(tmp_path / "tree", filters=spec).export(nodes)
+    assert [p.name for p in result.created_files] == ["Wiki.url"]
+
+    roots = data["roots"]
+    roots["bookmark_bar"]["children"][0]["children"] = _Untouchable()
+    roots["other"]["children"] = _Untouchable()
+    streamed = BookmarkExporter(tmp_path / "raw", filters=spec).export_raw(raw)
+    assert [p.name for p in streamed.created_files] == ["Wiki.url"]
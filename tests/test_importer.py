@@ -0,0 +1,69 @@
+import json
+
+from bookmarks_to_shortcuts.exporter import BookmarkExporter
+from bookmarks_to_shortcuts.importer import ShortcutImporter
+from bookmarks_to_shortcuts.raw import RawBookmarkFile
+from bookmarks_to_shortcuts.tree import BookmarkTreeBuilder
+
+
+def write_bookmarks(path):
+    data = {
+        "roots": {
+            "bookmark_bar": {
+                "id": "1",
+                "name": "Bookmarks bar",
+                "type": "folder",
+                "children": [
+                    {
+                        "id": "2",
+                        "name": "Work",
+                        "type": "folder",
+                        "children": [
+                            {"id": "3", "name": "Tracker", "type": "url", "url": "https://issues.example"},
+                            {"id": "4", "name": "Docs", "type": "url", "url": "https://docs.example"},
+                        ],
+                    },
+                    {"id": "5", "name": "News", "type": "url", "url": "https://news.example"},
+                ],
+            },
+            "other": {
+                "id": "6",
+                "name": "Other bookmarks",
+                "type": "folder",
+                "children": [
+                    {"id": "7", "name": "Recipes", "type": "url", "url": "https://food.example"},
+                ],
+            },
+        },
+        "version": 1,
+    }
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return RawBookmarkFile.load(path)
+
+
+def test_import_round_trips_exported_shortcuts(tmp_path):
+    raw = write_bookmarks(tmp_path / "Bookmarks")
+    export_root = tmp_path / "export"
+    BookmarkExporter(export_root, include_full_path=True).export(BookmarkTreeBuilder(raw).build())
+
+    restored = ShortcutImporter(export_root, workers=4, batch_size=1).write(tmp_path / "Restored")
+
+    reloaded = RawBookmarkFile.load(tmp_path / "Restored")
+    assert reloaded.data["checksum"] == reloaded.compute_checksum() == restored.data["checksum"]
+    roots = reloaded.roots()
+    assert set(roots) == {"bookmark_bar", "other", "synced"}
+    bar = roots["bookmark_bar"]["children"]
+    assert [child["name"] for child in bar] == ["Work", "News"]
+    assert [child["name"] for child in bar[0]["children"]] == ["Docs", "Tracker"]
+    assert bar[0]["children"][0]["url"] == "https://docs.example"
+    assert roots["other"]["children"][0]["url"] == "https://food.example"
+    ids = [node["id"] for node in _walk(roots)]
+    assert len(ids) == len(set(ids))
+
+
+def _walk(roots):
+    stack = list(roots.values())
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(node.get("children", []))
@@ -0,0 +1,119 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from bookmarks_to_shortcuts.exporter import BookmarkExporter, DuplicateStrategy
+from bookmarks_to_shortcuts.journal import JOURNAL_NAME
+from bookmarks_to_shortcuts.model import BookmarkNode
+
+
+def make_tree() -> BookmarkNode:
+    root = BookmarkNode(id="1", name="Bookmarks Bar", type="folder")
+    work = BookmarkNode(id="2", name="Work", type="folder")
+    for idx in range(12):
+        # every third bookmark collides with the previous name
+        name = f"Site {idx - idx % 3 // 2}"
+        work.add_child(
+            BookmarkNode(id=str(10 + idx), name=name, type="url", url=f"https://{idx}.example")
+        )
+    root.add_child(work)
+    return root
+
+
+def snapshot(root: Path) -> dict:
+    return {
+        p.relative_to(root).as_posix(): p.read_text(encoding="utf-8")
+        for p in root.rglob("*")
+        if p.is_file()
+    }
+
+
+def test_resume_matches_uninterrupted_export(tmp_path, monkeypatch):
+    expected_root = tmp_path / "expected"
+    BookmarkExporter(expected_root, include_full_path=False, journal=True).export([make_tree()])
+
+    resumed_root = tmp_path / "resumed"
+    exporter = BookmarkExporter(resumed_root, include_full_path=False, journal=True)
+    monkeypatch.setattr(exporter, "JOURNAL_BATCH_SIZE", 4)
+    calls = {"count": 0}
+    original = BookmarkExporter._shortcut_contents
+
+    def flaky_contents(url):
+        calls["count"] += 1
+        if calls["count"] == 7:
+            raise OSError("network share went away")
+        return original(url)
+
+    monkeypatch.setattr(exporter, "_shortcut_contents", flaky_contents)
+    with pytest.raises(OSError):
+        exporter.export([make_tree()])
+    assert (resumed_root / JOURNAL_NAME).exists()
+
+    monkeypatch.setattr(exporter, "_shortcut_contents", original)
+    result = exporter.export([make_tree()], resume=True)
+
+    assert len(result.created_files) == 12
+    assert not (resumed_root / JOURNAL_NAME).exists()
+    assert snapshot(resumed_root) == snapshot(expected_root)
+
+
+def test_resume_rejects_changed_options(tmp_path, monkeypatch):
+    exporter = BookmarkExporter(tmp_path, include_full_path=False, journal=True)
+    monkeypatch.setattr(exporter, "JOURNAL_BATCH_SIZE", 2)
+    original_write = Path.write_bytes
+    calls = {"count": 0}
+
+    def failing_write(self, *args, **kwargs):
+        calls["count"] += 1
+        if calls["count"] == 3:
+            raise OSError("killed")
+        return original_write(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_bytes", failing_write)
+    with pytest.raises(OSError):
+        exporter.export([make_tree()])
+    monkeypatch.setattr(Path, "write_bytes", original_write)
+
+    other = BookmarkExporter(
+        tmp_path,
+        include_full_path=False,
+        duplicate_strategy=DuplicateStrategy.SKIP,
+        journal=True,
+    )
+    with pytest.raises(ValueError):
+        other.export([make_tree()], resume=True)
+
+
+def test_executing_a_resume_plan_never_writes_through_hard_links(tmp_path, monkeypatch):
+    expected_root = tmp_path / "expected"
+    BookmarkExporter(expected_root, include_full_path=False, journal=True).export([make_tree()])
+    root = tmp_path / "resumed"
+    exporter = BookmarkExporter(root, include_full_path=False, journal=True)
+    monkeypatch.setattr(exporter, "JOURNAL_BATCH_SIZE", 2)
+    original_write = Path.write_bytes
+    calls = {"count": 0}
+
+    def failing_write(self, *args, **kwargs):
+        calls["count"] += 1
+        if calls["count"] == 3:
+            raise OSError("killed")
+        return original_write(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_bytes", failing_write)
+    with pytest.raises(OSError):
+        exporter.export([make_tree()])
+    monkeypatch.setattr(Path, "write_bytes", original_write)
+
+    # the failed batch planned Site 3 but never wrote it; give it a hard link
+    # into an older snapshot, as a copy from --link-dest would be
+    pending = "Work/Site 3.url"
+    assert not (root / pending).exists()
+    older = tmp_path / "older.url"
+    older.write_text("older snapshot", encoding="utf-8")
+    os.link(older, root / pending)
+
+    exporter.execute(exporter.plan([make_tree()], resume=True))
+
+    assert older.read_text(encoding="utf-8") == "older snapshot"
+    assert snapshot(root) == snapshot(expected_root)
@@ -0,0 +1,96 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bookmarks_to_shortcuts.linkcheck import LinkCache, LinkChecker, LinkStatus
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+
+    def _answer(self, send_body: bool) -> None:
+        path = self.path.partition("?")[0]
+        self.server.requests.append((self.command, path))
+        self.server.clients.add(self.client_address)
+        if path == "/slow":
+            time.sleep(1)
+        if path == "/moved":
+            self._respond(301, {"Location": "/ok"})
+        elif path == "/no-head" and self.command == "HEAD":
+            self._respond(405)
+        elif path in ("/ok", "/no-head", "/slow"):
+            self._respond(200, body=b"hello" if send_body else b"")
+        else:
+            self._respond(404)
+
+    def _respond(self, code, headers=None, body=b""):
+        self.send_response(code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):  # noqa: N802 - http.server naming
+        self._answer(send_body=False)
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        self._answer(send_body=True)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    httpd.daemon_threads = True
+    httpd.requests, httpd.clients = [], set()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd, f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_statuses_redirects_and_fallback_to_get(server):
+    httpd, base = server
+    urls = [f"{base}/ok", f"{base}/gone", f"{base}/moved", f"{base}/no-head", f"{base}/slow", "javascript:void(0)"]
+    results = LinkChecker(timeout=0.5).check(urls + [f"{base}/ok"])
+
+    assert results[f"{base}/ok"].status is LinkStatus.ALIVE
+    assert (results[f"{base}/gone"].status, results[f"{base}/gone"].code) == (LinkStatus.DEAD, 404)
+    assert results[f"{base}/moved"].status is LinkStatus.ALIVE
+    assert results[f"{base}/no-head"].code == 200
+    assert results[f"{base}/slow"].status is LinkStatus.UNREACHABLE
+    assert results["javascript:void(0)"].status is LinkStatus.SKIPPED
+    assert httpd.requests.count(("HEAD", "/ok")) == 2  # once directly, once after the redirect
+
+
+def test_connections_are_pooled_per_host(server):
+    httpd, base = server
+    urls = [f"{base}/ok?page={n}" for n in range(40)]
+    results = LinkChecker(concurrency=20, per_host=2).check(urls)
+
+    assert all(result.status is LinkStatus.ALIVE for result in results.values())
+    assert len(httpd.requests) == 40
+    assert len(httpd.clients) <= 2
+
+
+def test_cache_skips_fresh_results(server, tmp_path):
+    httpd, base = server
+    cache_file = tmp_path / "links.json"
+    urls = [f"{base}/ok", f"{base}/gone"]
+
+    LinkChecker(cache=LinkCache(cache_file)).check(urls)
+    probes = len(httpd.requests)
+    checker = LinkChecker(cache=LinkCache(cache_file))
+    results = checker.check(urls)
+    assert len(httpd.requests) == probes
+    assert checker.cached_hits == 2
+    assert results[f"{base}/gone"].status is LinkStatus.DEAD
+
+    LinkChecker(cache=LinkCache(cache_file, ttl=0)).check(urls)
+    assert len(httpd.requests) == 2 * probes
@@ -0,0 +1,75 @@
+from bookmarks_to_shortcuts.cli import main
+from bookmarks_to_shortcuts.merge import BookmarkMerger, normalize_url
+from bookmarks_to_shortcuts.raw import RawBookmarkFile
+
+
+def url(node_id, name, address, added="0"):
+    return {"id": node_id, "name": name, "type": "url", "url": address, "date_added": added}
+
+
+def folder(node_id, name, children):
+    return {"id": node_id, "name": name, "type": "folder", "children": children}
+
+
+def make_file(path, bar, other=()):
+    roots = {
+        "bookmark_bar": folder("1", "Bookmarks bar", bar),
+        "other": folder("2", "Other bookmarks", list(other)),
+    }
+    raw = RawBookmarkFile.create(path, roots)
+    raw.save()
+    return raw
+
+
+def test_merge_unions_folders_and_drops_duplicate_links(tmp_path):
+    laptop = make_file(tmp_path / "laptop", [
+        url("3", "Wiki", "https://Wiki.example/", "200"),
+        folder("4", "Work", [url("5", "Jira", "https://jira.example/browse"),
+                             folder("6", "Docs", [url("7", "API", "https://api.example/v1")])]),
+    ])
+    desktop = make_file(tmp_path / "desktop", [
+        folder("8", "work", [url("9", "Jira (old)", "HTTPS://jira.example:443/browse"),
+                             folder("10", "Docs", [url("11", "Guide", "https://guide.example")])]),
+        url("12", "Wiki", "https://wiki.example", "100"),
+        url("13", "Wiki", "https://wiki.example/#faq"),
+    ], other=[url("14", "Wiki", "https://wiki.example/")])
+
+    assert normalize_url("HTTP://User@Host.example:80") == "http://User@host.example/"
+    merger = BookmarkMerger()
+    merger.add(laptop)
+    merger.add(desktop)
+    assert (merger.result.folders, merger.result.bookmarks, merger.result.duplicates) == (2, 6, 2)
+
+    bar, other = merger.nodes()
+    assert [child.name for child in bar.children] == ["Wiki", "Work", "Wiki"]
+    assert bar.children[0].date_added == 100  # the earliest copy's date is kept
+    work = bar.children[1]
+    assert [child.name for child in work.children] == ["Jira", "Docs"]
+    assert [child.name for child in work.children[1].children] == ["API", "Guide"]
+    assert [child.name for child in other.children] == ["Wiki"]  # other folder, not a duplicate
+    ids = [node.id for root in (bar, other) for node in [root, *root.iter_descendants()]]
+    assert len(set(ids)) == len(ids)
+
+    written = merger.write(tmp_path / "Bookmarks")
+    reloaded = RawBookmarkFile.load(written.source_path)
+    assert reloaded.data["checksum"] == reloaded.compute_checksum()
+    assert [child["name"] for child in reloaded.roots()["bookmark_bar"]["children"]] == [
+        "Wiki", "Work", "Wiki"
+    ]
+
+
+def test_merge_command_writes_and_exports(tmp_path, capsys):
+    first = make_file(tmp_path / "first", [
+        folder("3", "Work", [url("4", "A", "https://a.example")]),
+    ])
+    second = make_file(tmp_path / "second", [
+        folder("3", "Work", [url("4", "A", "https://a.example/"), url("5", "B", "https://b.example")]),
+    ])
+    target = tmp_path / "Merged"
+    main(["merge", str(first.source_path), str(second.source_path),
+          "--output", str(target), "--export", str(tmp_path / "out")])
+
+    out = capsys.readouterr().out
+    assert "2 bookmarks in 1 folders; dropped 1 duplicates" in out
+    assert sorted(path.name for path in (tmp_path / "out" / "Work").iterdir()) == ["A.url", "B.url"]
+    assert RawBookmarkFile.load(target).roots()["bookmark_bar"]["children"][0]["name"] == "Work"
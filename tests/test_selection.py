@@ -0,0 +1,60 @@
+import random
+
+from bookmarks_to_shortcuts.model import BookmarkNode
+from bookmarks_to_shortcuts.selection import CheckState, SelectionModel
+
+
+def folder(node_id, *children):
+    node = BookmarkNode(id=node_id, name=node_id, type="folder")
+    for child in children:
+        node.add_child(child)
+    return node
+
+
+def make_forest():
+    link = BookmarkNode(id="url", name="Link", type="url", url="https://example.com")
+    return [folder("bar", folder("a", folder("a1"), folder("a2"), link), folder("b")), folder("other")]
+
+
+def test_toggle_reports_only_changed_folders():
+    model = SelectionModel(make_forest())
+    assert model.state("bar") is CheckState.UNCHECKED
+
+    assert sorted(model.toggle("a1")) == ["a", "a1", "bar"]
+    assert (model.state("a"), model.state("bar")) == (CheckState.MIXED, CheckState.MIXED)
+
+    # checking "a" completes its subtree; "bar" stays mixed because "b" is unchecked
+    assert sorted(model.toggle("a")) == ["a", "a2"]
+    assert model.state("a") is CheckState.CHECKED
+
+    assert sorted(model.set_all(True)) == ["b", "bar", "other"]
+    assert model.set_all(True) == []
+    assert sorted(model.selected()) == ["a", "a1", "a2", "b", "bar", "other"]
+    assert "url" not in model
+
+
+def _recursive_state(node, checked):
+    """The folder explorer's original rule, recomputed from scratch."""
+    states = [_recursive_state(child, checked) for child in node.children if child.is_folder]
+    own = "checked" if node.id in checked else "unchecked"
+    if not states:
+        return own
+    if own == "checked" and all(state == "checked" for state in states):
+        return "checked"
+    if own == "unchecked" and all(state == "unchecked" for state in states):
+        return "unchecked"
+    return "mixed"
+
+
+def test_states_match_full_recomputation():
+    rng = random.Random(7)
+    nodes = [folder("0")]
+    for idx in range(1, 300):
+        child = folder(str(idx))
+        rng.choice(nodes).add_child(child)
+        nodes.append(child)
+    model = SelectionModel(nodes[:1], selected=[str(idx) for idx in range(0, 300, 3)])
+    for _ in range(200):
+        model.toggle(str(rng.randrange(300)))
+        checked = set(model.selected())
+        assert all(model.state(node.id).value == _recursive_state(node, checked) for node in nodes)
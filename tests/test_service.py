@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from bookmarks_to_shortcuts.service import BookmarkService, ServiceClient, make_server
+
+
+def write_bookmarks(path, names):
+    children = [
+        {"id": str(10 + idx), "name": name, "type": "url", "url": f"https://{name.lower()}.example"}
+        for idx, name in enumerate(names)
+    ]
+    data = {
+        "roots": {
+            "bookmark_bar": {"id": "1", "name": "Bookmarks bar", "type": "folder", "children": children},
+        }
+    }
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_tree_is_cached_until_file_changes(tmp_path):
+    bookmarks = tmp_path / "Bookmarks"
+    write_bookmarks(bookmarks, ["Alpha"])
+    service = BookmarkService()
+
+    first = service.tree(bookmarks)
+    assert service.tree(bookmarks) is first
+
+    write_bookmarks(bookmarks, ["Alpha", "Beta"])
+    stat = bookmarks.stat()
+    os.utime(bookmarks, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert service.tree(bookmarks) is not first
+    assert service.count({"bookmarks": str(bookmarks)}) == {"bookmarks": 2, "folders": 1}
+
+    service.max_trees = 1
+    second = service.tree(bookmarks)
+    service.tree(bookmarks, ["other"])  # evicts the least recently used tree
+    assert service.tree(bookmarks) is not second
+
+
+def test_link_check_only_probes_exported_bookmarks(tmp_path, monkeypatch):
+    from bookmarks_to_shortcuts.linkcheck import LinkResult, LinkStatus
+
+    bookmarks = tmp_path / "Bookmarks"
+    write_bookmarks(bookmarks, ["Alpha", "Beta", "Gamma"])
+    probed = []
+
+    def check(urls, options, save_cache=True):
+        probed.extend(urls)
+        return {url: LinkResult(url, LinkStatus.DEAD, 404) for url in probed}
+
+    monkeypatch.setattr(BookmarkService, "_check_links", staticmethod(check))
+    response = BookmarkService().export({
+        "bookmarks": str(bookmarks),
+        "output": str(tmp_path / "out"),
+        "filters": {"exclude_domains": ["alpha.example", "gamma.example"]},
+        "links": {"skip": ["dead"]},
+    })
+
+    assert probed == ["https://beta.example"]
+    assert response["shortcuts"]["created"] == 0
+
+
+def test_client_round_trip(tmp_path):
+    bookmarks = tmp_path / "Bookmarks"
+    write_bookmarks(bookmarks, ["Alpha", "Beta"])
+    server = make_server(port=0, token_file=tmp_path / "token")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert (tmp_path / "token").read_text() == server.token
+        client = ServiceClient(f"http://127.0.0.1:{server.server_address[1]}", token=server.token)
+        found = client.call("search", {"bookmarks": str(bookmarks), "query": "BETA"})
+        assert [item["name"] for item in found["results"]] == ["Beta"]
+
+        output = tmp_path / "out"
+        result = client.call("export", {"bookmarks": str(bookmarks), "output": str(output)})
+        summary = result["shortcuts"]
+        assert (summary["created"], summary["skipped"]) == (2, 0)
+        assert summary["bytes"] == sum(p.stat().st_size for p in output.rglob("*.url"))
+        assert sorted(p.name for p in output.rglob("*.url")) == ["Alpha.url", "Beta.url"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_server_refuses_requests_a_web_page_could_send(tmp_path):
+    with pytest.raises(ValueError):
+        make_server("0.0.0.0", 0, token_file=tmp_path / "token")
+    server = make_server(port=0, token_file=tmp_path / "token")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    auth = {"Authorization": f"Bearer {server.token}"}
+
+    def status(headers, body=b"{}"):
+        request = urllib.request.Request(f"{url}/count", data=body, headers=headers, method="POST")
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return response.status
+        except urllib.error.HTTPError as exc:
+            return exc.code
+
+    try:
+        assert status({"Content-Type": "application/json"}) == 401
+        assert status({**auth, "Content-Type": "text/plain"}) == 415
+        assert status({**auth, "Content-Type": "application/json", "Host": "evil.example"}) == 403
+        assert status({**auth, "Content-Type": "application/json"}, b"[1, 2]") == 400
+        assert status({**auth, "Content-Type": "application/json"}, b'{"bookmarks": 5}') == 400
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    with pytest.raises(RuntimeError, match="Cannot reach"):
+        ServiceClient(url, token=server.token, timeout=5).call("count", {})
+
+
+def test_dry_run_link_check_leaves_the_cache_untouched(tmp_path, monkeypatch):
+    from bookmarks_to_shortcuts.linkcheck import LinkChecker, LinkResult, LinkStatus
+
+    async def check_one(self, url):
+        return LinkResult(url, LinkStatus.DEAD, 404, checked_at=time.time())
+
+    monkeypatch.setattr(LinkChecker, "_check_one", check_one)
+    bookmarks = tmp_path / "Bookmarks"
+    write_bookmarks(bookmarks, ["Alpha"])
+    cache = tmp_path / "link_cache.json"
+    request = {
+        "bookmarks": str(bookmarks),
+        "output": str(tmp_path / "out"),
+        "links": {"skip": ["dead"], "cache": str(cache)},
+    }
+
+    plan = BookmarkService().export({**request, "dry_run": True})["plan"]
+    assert "Shortcuts to write: 0" in plan
+    assert not cache.exists() and not (tmp_path / "out").exists()
+
+    BookmarkService().export(request)
+    assert cache.exists()
@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from bookmarks_to_shortcuts import session as session_module
+from bookmarks_to_shortcuts.raw import RawBookmarkFile
+from bookmarks_to_shortcuts.session import BookmarkSession
+from bookmarks_to_shortcuts.tree import BookmarkTreeBuilder, folder_hash
+from bookmarks_to_shortcuts.undo import UndoJournal
+
+
+def url(node_id, name):
+    return {"id": node_id, "name": name, "type": "url", "url": f"https://{name}.example"}
+
+
+def folder(node_id, name, children):
+    return {"id": node_id, "name": name, "type": "folder", "children": children}
+
+
+def make_file(tmp_path):
+    roots = {
+        "bookmark_bar": folder("1", "Bookmarks bar", [
+            url("10", "a"),
+            folder("20", "Work", [url("21", "b"), folder("22", "Old", [url("23", "c")])]),
+        ]),
+        "other": folder("2", "Other bookmarks", [url("30", "f")]),
+    }
+    raw = RawBookmarkFile.create(tmp_path / "Bookmarks", roots)
+    raw.save()
+    return raw.source_path
+
+
+def test_delete_updates_tree_in_memory(tmp_path, monkeypatch):
+    path = make_file(tmp_path)
+    session = BookmarkSession(path)
+    loads = []
+    monkeypatch.setattr(
+        session_module.RawBookmarkFile, "load", classmethod(lambda cls, p: loads.append(p))
+    )
+
+    result = session.delete({"23", "30"})
+
+    assert loads == []  # neither the delete nor the tree update re-reads the file
+    assert result.removed == 2
+    assert result.removed_ids == {"22", "23", "30"}
+    assert not session.is_stale()
+    assert UndoJournal(path).steps() == 1
+    monkeypatch.undo()
+    fresh = BookmarkTreeBuilder(RawBookmarkFile.load(path)).build()
+    assert [folder_hash(root) for root in session.nodes] == [folder_hash(root) for root in fresh]
+    assert [child.id for child in session.nodes[0].children[1].children] == ["21"]
+
+
+def test_delete_reloads_a_file_changed_on_disk(tmp_path):
+    path = make_file(tmp_path)
+    session = BookmarkSession(path)
+    raw = RawBookmarkFile.load(path)
+    raw.roots()["other"]["children"].append(url("31", "g"))
+    raw.save()
+    os.utime(path, ns=(0, 0))
+
+    assert session.is_stale()
+    session.delete({"10"}, record_undo=False)
+    ids = {node["id"] for node in RawBookmarkFile.load(path).roots()["other"]["children"]}
+    assert ids == {"30", "31"}
+    assert not UndoJournal(path).path.exists()
+
+
+class _Untouchable(list):
+    def __iter__(self):
+        raise AssertionError("folder should not have been visited")
+
+
+def test_delete_with_ancestors_updates_only_their_folders(tmp_path):
+    path = make_file(tmp_path)
+    session = BookmarkSession(path)
+    other = session.nodes[1]
+    other.children = _Untouchable(other.children)
+
+    result = session.delete({"21", "23"}, ancestors={"21": ["1", "20"], "23": ["1", "20", "22"]})
+
+    assert result.removed_ids == {"20", "21", "22", "23"}
+    other.children = other.children.copy()
+    fresh = BookmarkTreeBuilder(RawBookmarkFile.load(path)).build()
+    assert [folder_hash(root) for root in session.nodes] == [folder_hash(root) for root in fresh]
+    assert [child.id for child in session.nodes[0].children] == ["10"]
+
+
+def test_failed_save_leaves_no_undo_step(tmp_path, monkeypatch):
+    path = make_file(tmp_path)
+    session = BookmarkSession(path)
+    session.delete({"10"})
+    saved = path.read_bytes()
+
+    def fail(self, durability=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(session_module.RawBookmarkFile, "save", fail)
+    with pytest.raises(OSError):
+        session.delete({"30"})
+    monkeypatch.undo()
+
+    assert path.read_bytes() == saved
+    assert UndoJournal(path).steps() == 1  # only the delete that was saved
+    assert session.is_stale()  # its in-memory data still lacks bookmark 30
+    session.delete({"30"})
+    assert UndoJournal(path).steps() == 2
@@ -0,0 +1,104 @@
+import os
+from pathlib import Path
+
+from bookmarks_to_shortcuts.cli import main
+from bookmarks_to_shortcuts.exporter import BookmarkExporter, DuplicateStrategy
+from bookmarks_to_shortcuts.journal import JOURNAL_NAME
+from bookmarks_to_shortcuts.model import BookmarkNode
+from bookmarks_to_shortcuts.raw import RawBookmarkFile
+from bookmarks_to_shortcuts.snapshots import RetentionPolicy, expired_snapshots, list_snapshots
+
+
+def url(node_id, name, address):
+    return {"id": node_id, "name": name, "type": "url", "url": address}
+
+
+def write_bookmarks(path, work):
+    roots = {
+        "bookmark_bar": {"id": "1", "name": "Bar", "type": "folder", "children": [
+            {"id": "2", "name": "Work", "type": "folder", "children": work},
+        ]},
+        "other": {"id": "3", "name": "Other", "type": "folder", "children": []},
+    }
+    RawBookmarkFile.create(path, roots).save()
+
+
+def test_snapshots_link_unchanged_shortcuts(tmp_path, capsys):
+    bookmarks = tmp_path / "Bookmarks"
+    history = tmp_path / "history"
+    write_bookmarks(bookmarks, [url("4", "Wiki", "https://wiki.example"),
+                                url("5", "Mail", "https://mail.example")])
+    main([str(bookmarks), str(history), "--snapshot"])
+    write_bookmarks(bookmarks, [url("4", "Wiki", "https://wiki.example"),
+                                url("5", "Mail", "https://mail.example/inbox")])
+    main([str(bookmarks), str(history), "--snapshot", "--keep-last", "5"])
+    assert "Hard-linked 1 unchanged shortcuts" in capsys.readouterr().out
+
+    first, second = list_snapshots(history)
+    assert second.name == first.name + "_2"
+    assert (first / "Work" / "Wiki.url").stat().st_ino == (second / "Work" / "Wiki.url").stat().st_ino
+    assert (first / "Work" / "Mail.url").stat().st_ino != (second / "Work" / "Mail.url").stat().st_ino
+    assert b"mail.example/inbox" not in (first / "Work" / "Mail.url").read_bytes()
+
+    # overwriting a linked shortcut replaces it instead of changing the shared file
+    target = tmp_path / "next"
+    (target / "Work").mkdir(parents=True)
+    os.link(second / "Work" / "Wiki.url", target / "Work" / "Wiki.url")
+    work = BookmarkNode(id="2", name="Work", type="folder")
+    work.add_child(BookmarkNode(id="6", name="Wiki", type="url", url="https://other.example"))
+    BookmarkExporter(target, duplicate_strategy=DuplicateStrategy.OVERWRITE).export([work])
+    assert b"other.example" in (target / "Work" / "Wiki.url").read_bytes()
+    assert b"other.example" not in (first / "Work" / "Wiki.url").read_bytes()
+
+    (second / JOURNAL_NAME).write_text("")  # unfinished snapshots are never listed or pruned
+    assert list_snapshots(history) == [first]
+
+
+def test_retention_keeps_the_union_of_its_rules():
+    names = [
+        "2026-09-28_0900_Bookmarks",  # ISO week 40
+        "2026-10-01_0900_Bookmarks",
+        "2026-10-01_1800_Bookmarks",
+        "2026-10-01_1800_Bookmarks_2",
+        "2026-10-05_0900_Bookmarks",  # week 41
+        "2026-10-06_0900_Bookmarks",
+    ]
+    snapshots = [Path(name) for name in names]
+
+    assert expired_snapshots(snapshots, RetentionPolicy()) == []
+    assert expired_snapshots(snapshots, RetentionPolicy(keep_last=4)) == snapshots[:2]
+    kept = set(snapshots) - set(
+        expired_snapshots(snapshots, RetentionPolicy(keep_last=1, keep_daily=2, keep_monthly=2))
+    )
+    assert sorted(kept) == [snapshots[0], snapshots[4], snapshots[5]]
+    kept = set(snapshots) - set(expired_snapshots(snapshots, RetentionPolicy(keep_weekly=2)))
+    assert sorted(kept) == [snapshots[3], snapshots[5]]
+
+
+def test_mirrors_keep_their_own_snapshots(tmp_path, capsys):
+    bookmarks = tmp_path / "Bookmarks"
+    history, backup = tmp_path / "history", tmp_path / "backup"
+    for address in ("https://mail.example", "https://mail.example/inbox", "https://mail.example/sent"):
+        write_bookmarks(bookmarks, [url("4", "Wiki", "https://wiki.example"), url("5", "Mail", address)])
+        main([str(bookmarks), str(history), "--snapshot", "--keep-last", "2", "--mirror", str(backup)])
+    assert "Mirrored 2 shortcuts" in capsys.readouterr().out
+
+    assert [path.name for path in list_snapshots(backup)] == [
+        path.name for path in list_snapshots(history)
+    ]
+    older, newer = list_snapshots(backup)  # the first was pruned from both
+    assert (older / "Work" / "Wiki.url").stat().st_ino == (newer / "Work" / "Wiki.url").stat().st_ino
+    assert b"mail.example/sent" in (newer / "Work" / "Mail.url").read_bytes()
+
+
+def test_unfinished_snapshots_prune_nothing(tmp_path, capsys):
+    bookmarks = tmp_path / "Bookmarks"
+    history, blocked = tmp_path / "history", tmp_path / "blocked"
+    write_bookmarks(bookmarks, [url("4", "Wiki", "https://wiki.example")])
+    main([str(bookmarks), str(history), "--snapshot"])
+    blocked.write_text("not a directory")  # the mirror fails, so the journal stays
+    main([str(bookmarks), str(history), "--snapshot", "--keep-last", "1", "--mirror", str(blocked)])
+
+    assert "unfinished" in capsys.readouterr().out
+    assert len(list_snapshots(history)) == 1
+    assert len(list(history.iterdir())) == 2
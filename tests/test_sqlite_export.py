@@ -0,0 +1,54 @@
+import sqlite3
+
+from bookmarks_to_shortcuts.exporter import BookmarkExporter
+from bookmarks_to_shortcuts.model import BookmarkNode
+
+
+def make_tree() -> BookmarkNode:
+    root = BookmarkNode(id="1", name="Bookmarks Bar", type="folder")
+    work = BookmarkNode(id="2", name="Work", type="folder")
+    work.add_child(BookmarkNode(id="3", name="Python Docs", type="url", url="https://docs.python.org"))
+    work.add_child(BookmarkNode(id="4", name="Tracker", type="url", url="https://issues.example"))
+    root.add_child(work)
+    root.add_child(BookmarkNode(id="5", name="News", type="url", url="https://news.example"))
+    return root
+
+
+def test_export_sqlite_creates_tables_and_search(tmp_path):
+    db = tmp_path / "bookmarks.db"
+    result = BookmarkExporter(tmp_path).export_sqlite([make_tree()], db)
+
+    assert result.bookmarks == 3
+    assert result.changed == 5  # two folders and three bookmarks
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT path FROM folders WHERE id = '2'").fetchone() == (
+            "Bookmarks Bar / Work",
+        )
+        if result.full_text_search:
+            hits = conn.execute(
+                "SELECT b.id FROM bookmarks_fts JOIN bookmarks b ON b.rowid = bookmarks_fts.rowid "
+                "WHERE bookmarks_fts MATCH 'python'"
+            ).fetchall()
+            assert hits == [("3",)]
+
+
+def test_export_sqlite_reexport_touches_only_changes(tmp_path):
+    db = tmp_path / "bookmarks.db"
+    exporter = BookmarkExporter(tmp_path)
+    exporter.export_sqlite([make_tree()], db)
+
+    assert exporter.export_sqlite([make_tree()], db).changed == 0
+
+    root = make_tree()
+    work = root.children[0]
+    work.children[0].name = "CPython Docs"
+    work.children.pop()
+    result = exporter.export_sqlite([root], db)
+
+    assert (result.changed, result.removed) == (1, 1)
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT name FROM bookmarks WHERE id = '3'").fetchone() == ("CPython Docs",)
+        if result.full_text_search:
+            assert conn.execute(
+                "SELECT count(*) FROM bookmarks_fts WHERE bookmarks_fts MATCH 'cpython'"
+            ).fetchone() == (1,)
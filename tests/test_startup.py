@@ -0,0 +1,101 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import bookmarks_to_shortcuts
+from bookmarks_to_shortcuts.cli import DUPLICATE_STRATEGIES
+from bookmarks_to_shortcuts.exporter import DuplicateStrategy
+from bookmarks_to_shortcuts.raw import RawBookmarkFile
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# The stdlib modules the CLI cannot start without. With those already
+# loaded, importing the CLI may cost at most this fraction of what they took
+# in the same interpreter, so the check scales with the machine instead of
+# relying on an absolute budget. (Today it is about 5%.)
+CLI_BASELINE_MODULES = ("argparse", "datetime", "json", "pathlib", "typing")
+CLI_IMPORT_BUDGET_RATIO = 0.25
+
+# Heavy or optional modules that only specific commands need; cheap stdlib
+# modules are imported at the top of the package modules that use them.
+DEFERRED_MODULES = {
+    "tkinter",
+    "sqlite3",
+    "asyncio",
+    "ssl",
+    "orjson",
+    "bookmarks_to_shortcuts.exporter",
+    "bookmarks_to_shortcuts.gui",
+    "bookmarks_to_shortcuts.linkcheck",
+    "bookmarks_to_shortcuts.service",
+}
+
+# What a plain in-process export must still not load: the HTTP stack is only
+# for ``serve`` and ``--server``.
+EXPORT_DEFERRED_MODULES = {"tkinter", "sqlite3", "asyncio", "ssl", "http.server", "urllib.request"}
+
+EXPORT_STATEMENT = """
+import sys
+from bookmarks_to_shortcuts.cli import main
+main([sys.argv[1], sys.argv[2]])
+print(" ".join(sorted(sys.modules)))
+"""
+
+
+def import_times(statement: str) -> dict:
+    """Return ``{module: cumulative microseconds}`` parsed from ``-X importtime``."""
+    # bytecode is cached, so only the first run pays for compiling sources
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_is_lean():
+    times = import_times("import bookmarks_to_shortcuts.cli")
+    assert DEFERRED_MODULES.isdisjoint(times), sorted(DEFERRED_MODULES & set(times))
+
+    statement = f"import {', '.join(CLI_BASELINE_MODULES)}; import bookmarks_to_shortcuts.cli"
+    runs = [import_times(statement) for _ in range(3)]
+    baseline = min(sum(times[name] for name in CLI_BASELINE_MODULES) for times in runs)
+    cli = min(times["bookmarks_to_shortcuts.cli"] for times in runs)
+    assert cli < baseline * CLI_IMPORT_BUDGET_RATIO, (cli, baseline)
+
+
+def test_export_leaves_the_http_stack_unloaded(tmp_path):
+    bookmarks = tmp_path / "Bookmarks"
+    RawBookmarkFile.create(bookmarks, {
+        "bookmark_bar": {"id": "1", "name": "Bar", "type": "folder", "children": [
+            {"id": "2", "name": "Wiki", "type": "url", "url": "https://wiki.example"},
+        ]},
+    }).save()
+    completed = subprocess.run(
+        [sys.executable, "-c", EXPORT_STATEMENT, str(bookmarks), str(tmp_path / "out")],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.startswith("Created 1 shortcuts")
+    loaded = set(completed.stdout.splitlines()[-1].split())
+    assert EXPORT_DEFERRED_MODULES.isdisjoint(loaded), sorted(EXPORT_DEFERRED_MODULES & loaded)
+
+
+def test_package_attributes_load_lazily():
+    assert bookmarks_to_shortcuts.BookmarkExporter.__name__ == "BookmarkExporter"
+    assert set(bookmarks_to_shortcuts.__all__) <= set(dir(bookmarks_to_shortcuts))
+    assert DUPLICATE_STRATEGIES == tuple(strategy.value for strategy in DuplicateStrategy)
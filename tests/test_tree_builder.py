@@ -1,7 +1,9 @@
 from pathlib import Path
 
+from bookmarks_to_shortcuts.diff import changed_folders
+from bookmarks_to_shortcuts.model import BookmarkNode
 from bookmarks_to_shortcuts.raw import RawBookmarkFile
-from bookmarks_to_shortcuts.tree import BookmarkTreeBuilder
+from bookmarks_to_shortcuts.tree import BookmarkTreeBuilder, folder_hash, update_folder_summary
 
 
 def build_raw(tmp_path):
@@ -30,3 +32,34 @@ def test_build_preserves_root_order(tmp_path):
     nodes = builder.build()
     assert [node.name for node in nodes] == ["Bookmarks Bar", "Mobile"]
     assert nodes[0].children[0].name == "Docs"
+
+
+def test_content_hash_changes_only_along_the_edited_path(tmp_path):
+    raw = build_raw(tmp_path)
+    before = BookmarkTreeBuilder(raw).build()
+
+    roots = raw.data["roots"]
+    roots["bookmark_bar"]["children"][0]["children"].append(
+        {"id": "5", "name": "Guide", "type": "url", "url": "https://guide.example"}
+    )
+    after = BookmarkTreeBuilder(raw).build()
+
+    assert before[1].content_hash is None  # nothing is hashed until asked for
+    assert folder_hash(before[1]) == folder_hash(after[1])
+    assert folder_hash(before[0]) != folder_hash(after[0])
+    assert [folder.id for folder in changed_folders(before, after)] == ["1", "2"]
+
+    # order matters too
+    children = roots["bookmark_bar"]["children"]
+    children.reverse()
+    assert folder_hash(BookmarkTreeBuilder(raw).build()[0]) != folder_hash(after[0])
+
+
+def test_hand_built_trees_are_hashed_from_their_contents():
+    old, new = (BookmarkNode(id="1", name="Bar", type="folder") for _ in range(2))
+    new.add_child(BookmarkNode(id="2", name="Wiki", type="url", url="https://wiki.example"))
+
+    assert [folder.id for folder in changed_folders([old], [new])] == ["1"]
+    old.add_child(BookmarkNode(id="2", name="Wiki", type="url", url="https://wiki.example"))
+    update_folder_summary(old)  # drops the digest cached by the diff above
+    assert list(changed_folders([old], [new])) == []
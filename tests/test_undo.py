@@ -0,0 +1,98 @@
+import copy
+import json
+
+import pytest
+
+from bookmarks_to_shortcuts.cli import main
+from bookmarks_to_shortcuts.deleter import BookmarkDeleter
+from bookmarks_to_shortcuts.raw import RawBookmarkFile
+from bookmarks_to_shortcuts.undo import UndoJournal
+
+
+def url(node_id, name):
+    return {"id": node_id, "name": name, "type": "url", "url": f"https://{name}.example"}
+
+
+def folder(node_id, name, children):
+    return {"id": node_id, "name": name, "type": "folder", "children": children}
+
+
+def make_file(tmp_path):
+    roots = {
+        "bookmark_bar": folder("1", "Bookmarks bar", [
+            url("10", "a"),
+            folder("20", "Work", [url("21", "b"), folder("22", "Old", [url("23", "c")]), url("24", "d")]),
+            url("11", "e"),
+        ]),
+        "other": folder("2", "Other bookmarks", [url("30", "f"), url("31", "g")]),
+    }
+    raw = RawBookmarkFile.create(tmp_path / "Bookmarks", roots)
+    raw.save()
+    return raw
+
+
+def test_restore_undoes_delete_exactly(tmp_path):
+    raw = make_file(tmp_path)
+    original = copy.deepcopy(raw.data)
+    deleter = BookmarkDeleter(raw)
+
+    assert deleter.delete({"10", "21", "23", "31"}) == 4
+    assert [entry.node["id"] for entry in deleter.removed_nodes] == ["10", "21", "23", "22", "31"]
+
+    deleter.restore(deleter.removed_nodes)
+    assert raw.data == original
+
+
+def test_undo_command_steps_back_through_deletions(tmp_path, capsys):
+    raw = make_file(tmp_path)
+    original = raw.source_path.read_bytes()
+    journal = UndoJournal(raw.source_path)
+
+    for ids in ({"23", "24"}, {"21", "30"}):
+        current = RawBookmarkFile.load(raw.source_path)
+        deleter = BookmarkDeleter(current)
+        deleter.delete(ids)
+        journal.record(deleter.removed_nodes)
+        current.save()
+    assert journal.steps() == 2
+    entry = json.loads(journal.path.read_text(encoding="utf-8").splitlines()[-1])
+    assert {node["id"] for _, _, node in entry["removed"]} == {"21", "30", "20"}
+
+    main(["undo", str(raw.source_path)])
+    main(["undo", str(raw.source_path)])
+    assert raw.source_path.read_bytes() == original
+    assert not journal.path.exists()
+    assert "0 earlier deletions" in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        main(["undo", str(raw.source_path)])
+
+
+def test_restore_refuses_nodes_that_are_still_present(tmp_path):
+    raw = make_file(tmp_path)
+    deleter = BookmarkDeleter(raw)
+    deleter.delete({"10"})
+    removed = deleter.removed_nodes
+    deleter.restore(removed)
+    with pytest.raises(ValueError):
+        deleter.restore(removed)
+
+
+def test_delete_only_touches_folders_holding_the_ids(tmp_path):
+    raw = make_file(tmp_path)
+    raw.roots()["other"]["children"].append(folder("32", "Empty", []))
+    other_children = raw.roots()["other"]["children"]
+    bar = raw.roots()["bookmark_bar"]
+    deleter = BookmarkDeleter(raw)
+
+    assert deleter.delete({"23", "missing", "20"}) == 1  # folder ids are not deleted
+    assert raw.roots()["other"]["children"] is other_children  # untouched, not rebuilt
+    assert [child["id"] for child in bar["children"][1]["children"]] == ["21", "24"]
+    assert [entry.node["id"] for entry in deleter.removed_nodes] == ["23", "22"]
+
+    # found through their folder paths; a stale path falls back to a search
+    ancestors = {"21": ["1", "20"], "24": ["1", "20"], "11": ["1", "gone"]}
+    assert deleter.delete({"21", "24", "11"}, ancestors=ancestors) == 3
+    assert [entry.node["id"] for entry in deleter.removed_nodes] == ["21", "24", "20", "11"]
+    assert [child["id"] for child in bar["children"]] == ["10"]
+    assert other_children[-1]["id"] == "32"  # already empty folders are left alone